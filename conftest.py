@@ -0,0 +1,8 @@
+pytest_plugins = ["src.utils.allure_shards", "src.utils.idle_profiler", "src.utils.impact"]
+
+
+def pytest_sessionfinish() -> None:
+    """Stop the background health probes started by TestCore once the run is over."""
+    from src.tests.core import TestCore  # noqa: PLC0415
+
+    TestCore.stop_health_monitor()
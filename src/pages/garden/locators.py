@@ -1,8 +1,10 @@
 from appium.webdriver.common.appiumby import AppiumBy
 
+from src.pages.locators import PlatformLocators
 
-class GardenLocators:
-    """Garden Page Locators."""
+
+class GardenLocators(PlatformLocators):
+    """Garden Page Locators. PLANT_CARD is a template formatted with the plant name."""
 
     GARDEN_HEADING = (
         AppiumBy.ANDROID_UIAUTOMATOR,
@@ -12,3 +14,18 @@ class GardenLocators:
         AppiumBy.ANDROID_UIAUTOMATOR,
         'new UiSelector().description("Placeholder")',
     )
+    PLANT_CARD = (
+        AppiumBy.ANDROID_UIAUTOMATOR,
+        'new UiSelector().descriptionContains("{}")',
+    )
+
+    IOS = {  # noqa: RUF012
+        "GARDEN_HEADING": (AppiumBy.ACCESSIBILITY_ID, "Garden"),
+        "PLACEHOLDER": (AppiumBy.ACCESSIBILITY_ID, "Placeholder"),
+        "PLANT_CARD": (AppiumBy.IOS_PREDICATE, 'label CONTAINS "{}"'),
+    }
+    WEB = {  # noqa: RUF012
+        "GARDEN_HEADING": (AppiumBy.CSS_SELECTOR, 'flt-semantics[aria-label="Garden"]'),
+        "PLACEHOLDER": (AppiumBy.CSS_SELECTOR, 'flt-semantics[aria-label="Placeholder"]'),
+        "PLANT_CARD": (AppiumBy.CSS_SELECTOR, 'flt-semantics[aria-label*="{}"]'),
+    }
@@ -1,12 +1,18 @@
+from __future__ import annotations
+
 import logging
+from typing import TYPE_CHECKING
 
-from appium.webdriver.common.appiumby import AppiumBy
 from selenium.webdriver.remote.webdriver import WebDriver
 
 from src.pages.garden.locators import GardenLocators
 from src.utils.action import Action
+from src.utils.platform import PlatformName
 from src.utils.wait import Wait
 
+if TYPE_CHECKING:
+    from appium.swipe.actions import SwipeActions
+
 
 class GardenPage:
     """
@@ -15,16 +21,25 @@ class GardenPage:
     Locator tuples must be unpacked with * when called.
     """
 
-    def __init__(self, driver: WebDriver) -> None:
+    def __init__(
+        self,
+        driver: WebDriver,
+        action: Action | None = None,
+        wait: Wait | None = None,
+        swipe: SwipeActions | None = None,
+        platform: PlatformName = PlatformName.ANDROID,
+    ) -> None:
         self.driver = driver
-        self.action = Action(self.driver)
-        self.wait = Wait(self.driver)
+        self.action = action or Action(self.driver, platform)
+        self.wait = wait or Wait(self.driver)
+        self.swipe = swipe
+        self.locators = GardenLocators.for_platform(platform)
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.info("Interacting with: Garden Page")
 
     def confirm_ready(self) -> None:
-        self.wait.for_element_to_be_visible(*GardenLocators.GARDEN_HEADING)
+        self.wait.for_element_to_be_visible(*self.locators.GARDEN_HEADING)
 
     def verify_plant(self, plant_name: str) -> None:
-        value = f'new UiSelector().descriptionContains("{plant_name}")'
-        self.driver.find_element(AppiumBy.ANDROID_UIAUTOMATOR, value)
+        by, value = self.locators.PLANT_CARD
+        self.driver.find_element(by, value.format(plant_name))
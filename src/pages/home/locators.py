@@ -1,7 +1,9 @@
 from appium.webdriver.common.appiumby import AppiumBy
 
+from src.pages.locators import PlatformLocators
 
-class HomeLocators:
+
+class HomeLocators(PlatformLocators):
     """Home Page Locators."""
 
     TODAY_HEADING = (
@@ -13,3 +15,14 @@ class HomeLocators:
         'new UiSelector().className("android.widget.Button").instance(3)',
     )
     NEW_HEADING = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().description("New")')
+
+    IOS = {  # noqa: RUF012
+        "TODAY_HEADING": (AppiumBy.ACCESSIBILITY_ID, "Today"),
+        "ADD_PLANT_BUTTON": (AppiumBy.IOS_CLASS_CHAIN, "**/XCUIElementTypeButton[4]"),
+        "NEW_HEADING": (AppiumBy.ACCESSIBILITY_ID, "New"),
+    }
+    WEB = {  # noqa: RUF012
+        "TODAY_HEADING": (AppiumBy.CSS_SELECTOR, 'flt-semantics[aria-label="Today"]'),
+        "ADD_PLANT_BUTTON": (AppiumBy.XPATH, '(//flt-semantics[@role="button"])[4]'),
+        "NEW_HEADING": (AppiumBy.CSS_SELECTOR, 'flt-semantics[aria-label="New"]'),
+    }
@@ -1,13 +1,20 @@
 # pylint: disable=C0116
 
+from __future__ import annotations
+
 import logging
+from typing import TYPE_CHECKING
 
 from selenium.webdriver.remote.webdriver import WebDriver
 
 from src.pages.home.locators import HomeLocators
 from src.utils.action import Action
+from src.utils.platform import PlatformName
 from src.utils.wait import Wait
 
+if TYPE_CHECKING:
+    from appium.swipe.actions import SwipeActions
+
 
 class HomePage:
     """
@@ -16,17 +23,26 @@ class HomePage:
     Locator tuples must be unpacked with * when called.
     """
 
-    def __init__(self, driver: WebDriver):
+    def __init__(
+        self,
+        driver: WebDriver,
+        action: Action | None = None,
+        wait: Wait | None = None,
+        swipe: SwipeActions | None = None,
+        platform: PlatformName = PlatformName.ANDROID,
+    ):
         self.driver = driver
-        self.action = Action(self.driver)
-        self.wait = Wait(self.driver)
+        self.action = action or Action(self.driver, platform)
+        self.wait = wait or Wait(self.driver)
+        self.swipe = swipe
+        self.locators = HomeLocators.for_platform(platform)
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.info("Interacting with: Home Page")
 
     def confirm_ready(self) -> None:
-        self.wait.for_element_to_be_visible(*HomeLocators.TODAY_HEADING)
+        self.wait.for_element_to_be_visible(*self.locators.TODAY_HEADING)
 
     def open_add_plant(self) -> None:
-        self.wait.for_element_to_be_clickable(*HomeLocators.ADD_PLANT_BUTTON)
-        self.driver.find_element(*HomeLocators.ADD_PLANT_BUTTON).click()
-        self.wait.for_element_to_be_visible(*HomeLocators.NEW_HEADING)
+        self.wait.for_element_to_be_clickable(*self.locators.ADD_PLANT_BUTTON)
+        self.driver.find_element(*self.locators.ADD_PLANT_BUTTON).click()
+        self.wait.for_element_to_be_visible(*self.locators.NEW_HEADING)
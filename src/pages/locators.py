@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from functools import cache
+from typing import ClassVar
+
+from src.utils.platform import PlatformName
+
+
+class PlatformLocators:
+    """
+    Base class for a page's locator table.
+
+    Class constants hold the Android locators. Subclasses list the locators that differ on other
+    platforms in `IOS` and `WEB`, keyed by constant name; constants without an override are shared.
+    Pages resolve their table once with `for_platform` and read constants from the result, so the
+    same page methods run against every platform.
+    """
+
+    IOS: ClassVar[dict[str, tuple[str, str]]] = {}
+    WEB: ClassVar[dict[str, tuple[str, str]]] = {}
+
+    @classmethod
+    @cache
+    def for_platform(cls, platform: PlatformName) -> type[PlatformLocators]:
+        """
+        Get the locator table for a platform.
+
+        Args:
+            platform (PlatformName): The platform the session targets.
+
+        Returns:
+            type[PlatformLocators]: The table with the platform's overrides applied.
+
+        """
+        overrides = getattr(cls, platform.value, {}) if platform is not PlatformName.ANDROID else {}
+        if not overrides:
+            return cls
+        return type(f"{cls.__name__}{platform.value.title()}", (cls,), dict(overrides))
@@ -1,7 +1,9 @@
 from appium.webdriver.common.appiumby import AppiumBy
 
+from src.pages.locators import PlatformLocators
 
-class PlantLocators:
+
+class PlantLocators(PlatformLocators):
     """Plant Page Locators."""
 
     NEW_HEADING = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().description("New")')
@@ -45,3 +47,30 @@ class PlantLocators:
         AppiumBy.ANDROID_UIAUTOMATOR,
         'new UiSelector().description("Save")',
     )
+
+    IOS = {  # noqa: RUF012
+        "NEW_HEADING": (AppiumBy.ACCESSIBILITY_ID, "New"),
+        "NAME_FIELD": (AppiumBy.IOS_CLASS_CHAIN, "**/XCUIElementTypeTextField[1]"),
+        "DESC_FIELD": (AppiumBy.IOS_CLASS_CHAIN, "**/XCUIElementTypeTextField[2]"),
+        "LOCATION_FIELD": (AppiumBy.IOS_CLASS_CHAIN, "**/XCUIElementTypeTextField[3]"),
+        "NAME_TEXT": (AppiumBy.IOS_CLASS_CHAIN, "**/XCUIElementTypeTextField[1]"),
+        "DESC_TEXT": (AppiumBy.IOS_CLASS_CHAIN, "**/XCUIElementTypeTextField[2]"),
+        "LOCATION_TEXT": (AppiumBy.IOS_CLASS_CHAIN, "**/XCUIElementTypeTextField[3]"),
+        "DAY_PLANTED": (AppiumBy.IOS_PREDICATE, 'label CONTAINS "Day planted"'),
+        "DATE_PICKER_EDIT": (AppiumBy.IOS_CLASS_CHAIN, "**/XCUIElementTypeButton[1]"),
+        "DATE_PICKER_OK": (AppiumBy.ACCESSIBILITY_ID, "OK"),
+        "SAVE_BUTTON": (AppiumBy.ACCESSIBILITY_ID, "Save"),
+    }
+    WEB = {  # noqa: RUF012
+        "NEW_HEADING": (AppiumBy.CSS_SELECTOR, 'flt-semantics[aria-label="New"]'),
+        "NAME_FIELD": (AppiumBy.XPATH, "(//input)[1]"),
+        "DESC_FIELD": (AppiumBy.XPATH, "(//input)[2]"),
+        "LOCATION_FIELD": (AppiumBy.XPATH, "(//input)[3]"),
+        "NAME_TEXT": (AppiumBy.XPATH, "(//input)[1]"),
+        "DESC_TEXT": (AppiumBy.XPATH, "(//input)[2]"),
+        "LOCATION_TEXT": (AppiumBy.XPATH, "(//input)[3]"),
+        "DAY_PLANTED": (AppiumBy.CSS_SELECTOR, 'flt-semantics[aria-label*="Day planted"]'),
+        "DATE_PICKER_EDIT": (AppiumBy.XPATH, '(//flt-semantics[@role="button"])[1]'),
+        "DATE_PICKER_OK": (AppiumBy.CSS_SELECTOR, 'flt-semantics[aria-label="OK"]'),
+        "SAVE_BUTTON": (AppiumBy.CSS_SELECTOR, 'flt-semantics[aria-label="Save"]'),
+    }
@@ -2,14 +2,18 @@
 from __future__ import annotations
 
 import logging
+from typing import TYPE_CHECKING
 
-from appium.swipe.actions import SeekDirection, SwipeActions
 from selenium.webdriver.remote.webdriver import WebDriver
 
 from src.pages.plant.locators import PlantLocators
 from src.utils.action import Action
+from src.utils.platform import PlatformName
 from src.utils.wait import Wait
 
+if TYPE_CHECKING:
+    from appium.swipe.actions import SwipeActions
+
 
 class PlantPage:
     """
@@ -18,34 +22,46 @@ class PlantPage:
     Locator tuples must be unpacked with * when called.
     """
 
-    def __init__(self, driver: WebDriver) -> None:
+    def __init__(
+        self,
+        driver: WebDriver,
+        action: Action | None = None,
+        wait: Wait | None = None,
+        swipe: SwipeActions | None = None,
+        platform: PlatformName = PlatformName.ANDROID,
+    ) -> None:
         self.driver = driver
-        self.action = Action(self.driver)
-        self.swipe = SwipeActions(self.driver)
-        self.wait = Wait(self.driver)
+        self.action = action or Action(self.driver, platform)
+        if swipe is None:
+            from appium.swipe.actions import SwipeActions  # noqa: PLC0415
+
+            swipe = SwipeActions(self.driver)
+        self.swipe = swipe
+        self.wait = wait or Wait(self.driver)
+        self.locators = PlantLocators.for_platform(platform)
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.info("Interacting with: Plant Page")
 
     def set_details(self, name: str, desc: str, location: str) -> None:
-        name_field = self.driver.find_element(*PlantLocators.NAME_FIELD)
+        name_field = self.driver.find_element(*self.locators.NAME_FIELD)
         name_field.click()
         name_field.send_keys(name)
         self.action.dismiss_keyboard()
 
-        desc_field = self.driver.find_element(*PlantLocators.DESC_FIELD)
+        desc_field = self.driver.find_element(*self.locators.DESC_FIELD)
         desc_field.click()
         desc_field.send_keys(desc)
         self.action.dismiss_keyboard()
 
-        location_field = self.driver.find_element(*PlantLocators.LOCATION_FIELD)
+        location_field = self.driver.find_element(*self.locators.LOCATION_FIELD)
         location_field.click()
         location_field.send_keys(location)
         self.action.dismiss_keyboard()
 
     def get_details(self) -> dict[str, str]:
-        name_text = self.action.get_element_text(*PlantLocators.NAME_TEXT)
-        desc_text = self.action.get_element_text(*PlantLocators.DESC_TEXT)
-        location_text = self.action.get_element_text(*PlantLocators.LOCATION_TEXT)
+        name_text = self.action.get_element_text(*self.locators.NAME_TEXT)
+        desc_text = self.action.get_element_text(*self.locators.DESC_TEXT)
+        location_text = self.action.get_element_text(*self.locators.LOCATION_TEXT)
         return {
             "Name": name_text,
             "Desc": desc_text,
@@ -53,14 +69,16 @@ class PlantPage:
         }
 
     def set_day_planted(self, date: str) -> None:
+        from appium.swipe.actions import SeekDirection  # noqa: PLC0415
+
         self.swipe.swipe_element_into_view(
-            *PlantLocators.DAY_PLANTED, SeekDirection.DOWN,
+            *self.locators.DAY_PLANTED, SeekDirection.DOWN,
         )
-        self.action.click(*PlantLocators.DAY_PLANTED)
-        self.wait.for_element_to_be_clickable(*PlantLocators.DATE_PICKER_EDIT)
-        self.action.click(*PlantLocators.DATE_PICKER_EDIT)
+        self.action.click(*self.locators.DAY_PLANTED)
+        self.wait.for_element_to_be_clickable(*self.locators.DATE_PICKER_EDIT)
+        self.action.click(*self.locators.DATE_PICKER_EDIT)
         self.action.send_keycodes(date)
         self.action.send_enter_key()
-        self.action.click(*PlantLocators.DATE_PICKER_OK)
-        self.wait.for_element_to_be_clickable(*PlantLocators.SAVE_BUTTON)
-        self.action.click(*PlantLocators.SAVE_BUTTON)
+        self.action.click(*self.locators.DATE_PICKER_OK)
+        self.wait.for_element_to_be_clickable(*self.locators.SAVE_BUTTON)
+        self.action.click(*self.locators.SAVE_BUTTON)
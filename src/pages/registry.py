@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Protocol, TypeVar, cast
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from src.pages.garden.page import GardenPage
+from src.pages.home.page import HomePage
+from src.pages.plant.page import PlantPage
+from src.utils.action import Action
+from src.utils.platform import PlatformName
+from src.utils.wait import Wait
+
+if TYPE_CHECKING:
+    from appium.swipe.actions import SwipeActions
+
+
+class Page(Protocol):
+    """Constructor shared by every page object, so the registry can build any of them."""
+
+    def __init__(
+        self,
+        driver: WebDriver,
+        action: Action | None = None,
+        wait: Wait | None = None,
+        swipe: SwipeActions | None = None,
+        platform: PlatformName = PlatformName.ANDROID,
+    ) -> None: ...
+
+
+PageT = TypeVar("PageT", bound=Page)
+
+
+class PageRegistry:
+    """
+    Creates page objects lazily and shares one Action/Wait/swipe stack between them.
+
+    Accessing a page marks it as the current page.
+    """
+
+    def __init__(
+        self,
+        driver: WebDriver,
+        action: Action,
+        wait: Wait,
+        swipe: SwipeActions,
+        platform: PlatformName = PlatformName.ANDROID,
+    ) -> None:
+        """
+        Initialize the PageRegistry instance.
+
+        Args:
+            driver (WebDriver): The driver instance shared by all pages.
+            action (Action): The shared Action instance.
+            wait (Wait): The shared Wait instance.
+            swipe (SwipeActions): The shared SwipeActions instance.
+            platform (PlatformName): The platform the pages resolve their locators for.
+
+        """
+        self.driver = driver
+        self.action = action
+        self.wait = wait
+        self.swipe = swipe
+        self.platform = platform
+        self.current: Page | None = None
+        self._pages: dict[type[Page], Page] = {}
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def get(self, page_class: type[PageT]) -> PageT:
+        """
+        Get a page object, creating it on first access, and mark it as the current page.
+
+        Args:
+            page_class (type[PageT]): The page object class.
+
+        Returns:
+            PageT: The shared page object instance.
+
+        """
+        page = self._pages.get(page_class)
+        if page is None:
+            page = self._pages[page_class] = page_class(self.driver, self.action, self.wait, self.swipe, self.platform)
+        self.navigate(page)
+        return cast("PageT", page)
+
+    def navigate(self, page: Page) -> None:
+        """
+        Mark a page as current.
+
+        Args:
+            page (Page): The page object now displayed.
+
+        """
+        if page is self.current:
+            return
+        if self.current is not None:
+            self.logger.info("Navigated from %s to %s", type(self.current).__name__, type(page).__name__)
+        self.current = page
+
+    @property
+    def home(self) -> HomePage:
+        """HomePage: The shared Home Page object."""
+        return self.get(HomePage)
+
+    @property
+    def garden(self) -> GardenPage:
+        """GardenPage: The shared Garden Page object."""
+        return self.get(GardenPage)
+
+    @property
+    def plant(self) -> PlantPage:
+        """PlantPage: The shared Plant Page object."""
+        return self.get(PlantPage)
@@ -1,23 +1,29 @@
 from __future__ import annotations
 
 import configparser
+import os
 from ast import literal_eval
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable, ClassVar
 
-from appium import webdriver
-from appium.options.android import UiAutomator2Options
-from appium.swipe.actions import SwipeActions
+from src.utils.exception import DeviceUnhealthyError, ReplayMismatchError
+from src.utils.platform import Platform, PlatformName
 
-from src.utils.action import Action
-from src.utils.device import Device
-from src.utils.platform import Platform
-from src.utils.wait import Wait
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
 
-CUR_DIR = Path.cwd()
-CONFIG_PATH = Path(CUR_DIR / "config.cfg")
+    from src.utils.health import Endpoint, HealthMonitor
+    from src.utils.snapshot import SnapshotStrategy
+    from src.utils.transport import RecordingConnection, ReplayConnection, TransportMode
+    from src.utils.ui_events import UiEventStream
+    from src.utils.visual import Region, VisualCheck
+
+# The driver, page and reporting modules pull in appium, selenium, allure and numpy, so they are
+# imported where the session is set up rather than here, keeping test collection cheap.
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+CONFIG_PATH = PROJECT_ROOT / "config.cfg"
 
 
 class DeviceType(Enum):
@@ -34,13 +40,24 @@ class EnvConfig:
     Configuration dataclass for Environment settings.
 
     Attributes:
-        url (str): URL path.
+        url (str): URL path, opened by web sessions.
+        platform (str): ANDROID, IOS or WEB; overridden per process by the TEST_PLATFORM environment variable.
         debug (bool): Flag for configuring various debugging behavior.
+        transport_mode (str): LIVE, RECORD (save driver traffic to cassettes) or REPLAY (serve it back
+            without a device).
+        cassette_dir (str): Directory for recorded cassettes.
+        strict_replay (bool): Fail on the first command that diverges from the cassette.
+        step_max_attempts (int): Maximum attempts for steps run through `TestCore.retry`.
 
     """
 
     url: str
+    platform: str
     debug: bool
+    transport_mode: str
+    cassette_dir: str
+    strict_replay: bool
+    step_max_attempts: int
 
 
 @dataclass
@@ -79,6 +96,8 @@ class AndroidConfig:
         connected_device (str): Identifier for the connected Android device.
         apk (str): Path to the Android APK file.
         package (str): Android package name.
+        activity (str): Activity launched on session start.
+        platform_version (str): Android version of the device.
         id_physical (str): Identifier for physical device.
         id_wifi (str): Identifier for WiFi-connected device.
         id_virtual (str): Identifier for virtual device.
@@ -88,11 +107,165 @@ class AndroidConfig:
     connected_device: str
     apk: str
     package: str
+    activity: str
+    platform_version: str
+    id_physical: str
+    id_wifi: str
+    id_virtual: str
+
+
+@dataclass
+class IOSConfig:
+    """
+    Configuration dataclass for iOS-specific settings.
+
+    Attributes:
+        connected_device (str): Identifier for the connected iOS device.
+        ipa (str): Path to the iOS app, or NONE to launch the installed bundle.
+        bundle_id (str): iOS bundle identifier.
+        platform_version (str): iOS version of the device.
+        id_physical (str): Identifier for physical device.
+        id_wifi (str): Identifier for WiFi-connected device.
+        id_virtual (str): Identifier for simulator.
+
+    """
+
+    connected_device: str
+    ipa: str
+    bundle_id: str
+    platform_version: str
     id_physical: str
     id_wifi: str
     id_virtual: str
 
 
+@dataclass
+class WebConfig:
+    """
+    Configuration dataclass for web sessions.
+
+    Attributes:
+        browser_engine (str): chrome or firefox.
+        headless (bool): Run the browser without a window.
+
+    """
+
+    browser_engine: str
+    headless: bool
+
+
+@dataclass
+class SnapshotConfig:
+    """
+    Configuration dataclass for device state snapshots.
+
+    Attributes:
+        strategy (str): Capture strategy, APP_DATA, EMULATOR (VIRTUAL devices only) or REBUILD (no snapshots).
+        snapshot_dir (str): Local directory for app data archives.
+
+    """
+
+    strategy: str
+    snapshot_dir: str
+
+
+@dataclass
+class VisualConfig:
+    """
+    Configuration dataclass for screenshot comparison.
+
+    Attributes:
+        baseline_dir (str): Directory containing baseline screenshots.
+        max_diff_ratio (float): Fraction of differing pixels tolerated before a mismatch.
+        pixel_tolerance (int): Per-channel difference below which pixels are considered equal.
+
+    """
+
+    baseline_dir: str
+    max_diff_ratio: float
+    pixel_tolerance: int
+
+
+@dataclass
+class HealthConfig:
+    """
+    Configuration dataclass for device health probing.
+
+    Attributes:
+        probe_timeout (float): Maximum time for each health probe, in seconds.
+        probe_interval (float): Time between periodic health probes, in seconds.
+
+    """
+
+    probe_timeout: float
+    probe_interval: float
+
+
+@dataclass
+class LauncherConfig:
+    """
+    Configuration dataclass for the warm Appium server and emulator launcher.
+
+    Attributes:
+        enabled (bool): Use servers and emulators kept warm by the launcher daemon.
+        worker_ports (list[int]): Appium server ports, one per parallel worker.
+        state_dir (str): Directory for the daemon state file and process logs.
+        appium_executable (str): Path of the appium executable.
+        emulator_executable (str): Path of the emulator executable.
+        adb_executable (str): Path of the adb executable.
+        boot_timeout (int): Maximum time to wait for servers and emulators to become ready, in seconds.
+
+    """
+
+    enabled: bool
+    worker_ports: list[int]
+    state_dir: str
+    appium_executable: str
+    emulator_executable: str
+    adb_executable: str
+    boot_timeout: int
+
+
+@dataclass
+class WaitConfig:
+    """
+    Configuration dataclass for element waits.
+
+    Attributes:
+        backend (str): POLLING (WebDriverWait) or EVENTS (re-check after device log activity).
+        event_filter (str): Regular expression selecting the app's log lines that count as UI changes, or NONE for all.
+        fallback_interval (float): Maximum seconds between checks while waiting on events.
+
+    """
+
+    backend: str
+    event_filter: str
+    fallback_interval: float
+
+
+@dataclass
+class SoakConfig:
+    """
+    Configuration dataclass for soak runs.
+
+    Attributes:
+        duration (float): Seconds to repeat the soak flows; 0 skips the soak tests.
+        sample_every (int): Iterations between resource samples.
+        baseline_samples (int): Number of leading samples forming each metric's baseline.
+        ewma_alpha (float): Smoothing factor of the moving average of each metric.
+        drift_tolerance (float): Allowed rise above a baseline mean, as a fraction of it.
+        restore_every (int): Iterations between restores of the starting state; 0 restores it only once.
+
+    """
+
+    duration: float
+    sample_every: int
+    baseline_samples: int
+    ewma_alpha: float
+    drift_tolerance: float
+    restore_every: int
+
+
 @dataclass
 class AppConfig:
     """
@@ -101,12 +274,28 @@ class AppConfig:
     Attributes:
         appium (AppiumConfig): Appium-specific configuration.
         android (AndroidConfig): Android-specific configuration.
+        ios (IOSConfig): iOS-specific configuration.
+        web (WebConfig): Web session configuration.
+        snapshot (SnapshotConfig): Device state snapshot configuration.
+        visual (VisualConfig): Screenshot comparison configuration.
+        health (HealthConfig): Device health probing configuration.
+        launcher (LauncherConfig): Warm server and emulator launcher configuration.
+        wait (WaitConfig): Element wait configuration.
+        soak (SoakConfig): Soak run configuration.
 
     """
 
     env: EnvConfig
     appium: AppiumConfig
     android: AndroidConfig
+    ios: IOSConfig
+    web: WebConfig
+    snapshot: SnapshotConfig
+    visual: VisualConfig
+    health: HealthConfig
+    launcher: LauncherConfig
+    wait: WaitConfig
+    soak: SoakConfig
 
 
 class ConfigLoader:
@@ -129,7 +318,12 @@ class ConfigLoader:
 
         env_config = EnvConfig(
             url=config.get("ENVIRONMENT", "url"),
+            platform=config.get("ENVIRONMENT", "platform"),
             debug=config.get("ENVIRONMENT", "debug"),
+            transport_mode=config.get("ENVIRONMENT", "transport_mode"),
+            cassette_dir=config.get("ENVIRONMENT", "cassette_dir"),
+            strict_replay=literal_eval(config.get("ENVIRONMENT", "strict_replay")),
+            step_max_attempts=int(config.get("ENVIRONMENT", "step_max_attempts")),
         )
 
         appium_config = AppiumConfig(
@@ -151,63 +345,272 @@ class ConfigLoader:
             connected_device=config.get("ANDROID", "android_connected_device"),
             apk=config.get("APP", "android_apk"),
             package=config.get("APP", "package"),
+            activity=config.get("APP", "android_activity"),
+            platform_version=config.get("ANDROID", "android_platform_version"),
             id_physical=config.get("ANDROID", "android_id_physical"),
             id_wifi=config.get("ANDROID", "android_id_wifi"),
             id_virtual=config.get("ANDROID", "android_id_virtual"),
         )
 
-        return AppConfig(env=env_config, appium=appium_config, android=android_config)
+        ios_config = IOSConfig(
+            connected_device=config.get("iOS", "ios_connected_device"),
+            ipa=config.get("APP", "ios_ipa"),
+            bundle_id=config.get("APP", "ios_bundle_id"),
+            platform_version=config.get("iOS", "ios_platform_version"),
+            id_physical=config.get("iOS", "ios_id_physical"),
+            id_wifi=config.get("iOS", "ios_id_wifi"),
+            id_virtual=config.get("iOS", "ios_id_virtual"),
+        )
+
+        web_config = WebConfig(
+            browser_engine=config.get("WEB", "browser_engine"),
+            headless=literal_eval(config.get("WEB", "headless")),
+        )
+
+        snapshot_config = SnapshotConfig(
+            strategy=config.get("SNAPSHOT", "snapshot_strategy"),
+            snapshot_dir=config.get("SNAPSHOT", "snapshot_dir"),
+        )
+
+        visual_config = VisualConfig(
+            baseline_dir=config.get("VISUAL", "baseline_dir"),
+            max_diff_ratio=float(config.get("VISUAL", "max_diff_ratio")),
+            pixel_tolerance=int(config.get("VISUAL", "pixel_tolerance")),
+        )
+
+        health_config = HealthConfig(
+            probe_timeout=float(config.get("HEALTH", "probe_timeout")),
+            probe_interval=float(config.get("HEALTH", "probe_interval")),
+        )
+
+        launcher_config = LauncherConfig(
+            enabled=literal_eval(config.get("LAUNCHER", "use_launcher")),
+            worker_ports=[int(port) for port in config.get("LAUNCHER", "worker_ports").split(",")],
+            state_dir=config.get("LAUNCHER", "state_dir"),
+            appium_executable=config.get("LAUNCHER", "appium_executable"),
+            emulator_executable=config.get("LAUNCHER", "emulator_executable"),
+            adb_executable=config.get("LAUNCHER", "adb_executable"),
+            boot_timeout=int(config.get("LAUNCHER", "boot_timeout")),
+        )
+
+        wait_config = WaitConfig(
+            backend=config.get("WAIT", "wait_backend"),
+            event_filter=config.get("WAIT", "event_filter"),
+            fallback_interval=float(config.get("WAIT", "fallback_interval")),
+        )
+
+        soak_config = SoakConfig(
+            duration=float(config.get("SOAK", "duration")),
+            sample_every=int(config.get("SOAK", "sample_every")),
+            baseline_samples=int(config.get("SOAK", "baseline_samples")),
+            ewma_alpha=float(config.get("SOAK", "ewma_alpha")),
+            drift_tolerance=float(config.get("SOAK", "drift_tolerance")),
+            restore_every=int(config.get("SOAK", "restore_every")),
+        )
+
+        return AppConfig(
+            env=env_config,
+            appium=appium_config,
+            android=android_config,
+            ios=ios_config,
+            web=web_config,
+            snapshot=snapshot_config,
+            visual=visual_config,
+            health=health_config,
+            launcher=launcher_config,
+            wait=wait_config,
+            soak=soak_config,
+        )
 
 
 class DeviceOptionsFactory:
-    """Factory class for creating device options based on configuration and device type."""
+    """
+    Pluggable factory for session capabilities, with one registered builder per platform.
+
+    Builders only copy values out of the configuration, so capabilities are rebuilt on every call
+    and always reflect the current configuration.
+    """
+
+    _builders: ClassVar[dict[PlatformName, Callable[[AppConfig], dict[str, Any]]]] = {}
+
+    @classmethod
+    def register(
+        cls, platform: PlatformName,
+    ) -> Callable[[Callable[[AppConfig], dict[str, Any]]], Callable[[AppConfig], dict[str, Any]]]:
+        """
+        Register the capability builder for a platform.
+
+        Args:
+            platform (PlatformName): The platform the builder creates capabilities for.
+
+        Returns:
+            Callable: Decorator registering the builder and returning it unchanged.
+
+        """
+
+        def decorator(builder: Callable[[AppConfig], dict[str, Any]]) -> Callable[[AppConfig], dict[str, Any]]:
+            cls._builders[platform] = builder
+            return builder
+
+        return decorator
+
+    @classmethod
+    def create_options(cls, config: AppConfig, platform: PlatformName = PlatformName.ANDROID) -> dict[str, Any]:
+        """
+        Create session capabilities for a platform from the provided configuration.
+
+        Args:
+            config (AppConfig): Application configuration.
+            platform (PlatformName): The platform the session targets.
+
+        Returns:
+            Dict[str, Any]: New capabilities, safe to adjust per session.
 
-    @staticmethod
-    def create_options(config: AppConfig) -> dict[str, Any]:
         """
-        Create device options for Appium based on the provided configuration and device type.
+        return cls._builders[platform](config)
+
+    @classmethod
+    def precompute(cls, config: AppConfig) -> dict[PlatformName, dict[str, Any]]:
+        """
+        Build the capabilities of every configured platform up front.
 
         Args:
             config (AppConfig): Application configuration.
-            device_type (DeviceType): Type of the device (PHYSICAL, WIFI, or VIRTUAL).
 
         Returns:
-            Dict[str, Any]: Dictionary of device options for Appium.
-
-        """
-        options: dict[str, Any] = {
-            "platformName": "Android",
-            "automationName": "UIAutomator2",
-            "noReset": config.appium.no_reset,
-            "fullReset": config.appium.full_reset,
-            "platformVersion": "13",
-            "appPackage": "cat.naval.florae",
-            "appActivity": ".MainActivity",
-            "autoGrantPermissions": True,
-            "ignoreUnimportantViews": False,
-            "ensureWebviewsHavePages": True,
-            "remoteAppsCacheLimit": config.appium.remote_apps_cache_limit,
-            "newCommandTimeout": config.appium.new_command_timeout,
-            "uiautomator2ServerInstallTimeout": config.appium.uiautomator2_server_install_timeout,
-            "adbExecTimeout": config.appium.adb_exec_timeout,
+            dict[PlatformName, dict[str, Any]]: Capabilities by platform.
+
+        """
+        configured = {
+            PlatformName.ANDROID: config.android.connected_device,
+            PlatformName.IOS: config.ios.connected_device,
+            PlatformName.WEB: config.env.url,
         }
+        return {
+            platform: cls.create_options(config, platform) for platform, value in configured.items() if value != "NONE"
+        }
+
+    @staticmethod
+    def device_name(config: AppConfig, platform: PlatformName) -> str:
+        """
+        Get the name of the device a platform's sessions run on.
+
+        Args:
+            config (AppConfig): Application configuration.
+            platform (PlatformName): The platform the session targets.
+
+        Returns:
+            str: The device identifier, or the browser name for web sessions.
+
+        """
+        if platform is PlatformName.WEB:
+            return f"{config.web.browser_engine}-headless" if config.web.headless else config.web.browser_engine
+        device = config.android if platform is PlatformName.ANDROID else config.ios
+        return {
+            DeviceType.PHYSICAL.value: device.id_physical,
+            DeviceType.WIFI.value: device.id_wifi,
+        }.get(device.connected_device, device.id_virtual)
 
-        if config.android.connected_device == "PHYSICAL":
-            options["udid"] = config.android.id_physical
-            options["deviceName"] = config.android.id_physical
-        elif config.android.connected_device == "WIFI":
-            options["deviceName"] = config.android.id_wifi
-        else:
-            options["avd"] = config.android.id_virtual
-            options["deviceName"] = config.android.id_virtual
-        options["app"] = str(Path(CUR_DIR / config.android.apk).resolve())
 
-        return options
+@DeviceOptionsFactory.register(PlatformName.ANDROID)
+def android_options(config: AppConfig) -> dict[str, Any]:
+    """
+    Build UiAutomator2 capabilities.
+
+    Args:
+        config (AppConfig): Application configuration.
+
+    Returns:
+        dict[str, Any]: Capabilities for an Android session.
+
+    """
+    options: dict[str, Any] = {
+        "platformName": "Android",
+        "automationName": "UIAutomator2",
+        "noReset": config.appium.no_reset,
+        "fullReset": config.appium.full_reset,
+        "platformVersion": config.android.platform_version,
+        "appPackage": config.android.package,
+        "appActivity": config.android.activity,
+        "autoGrantPermissions": True,
+        "ignoreUnimportantViews": False,
+        "ensureWebviewsHavePages": True,
+        "remoteAppsCacheLimit": config.appium.remote_apps_cache_limit,
+        "newCommandTimeout": config.appium.new_command_timeout,
+        "uiautomator2ServerInstallTimeout": config.appium.uiautomator2_server_install_timeout,
+        "adbExecTimeout": config.appium.adb_exec_timeout,
+    }
+
+    if config.android.connected_device == "PHYSICAL":
+        options["udid"] = config.android.id_physical
+        options["deviceName"] = config.android.id_physical
+    elif config.android.connected_device == "WIFI":
+        options["udid"] = config.android.id_wifi
+        options["deviceName"] = config.android.id_wifi
+    else:
+        options["avd"] = config.android.id_virtual
+        options["deviceName"] = config.android.id_virtual
+    options["app"] = str(Path(PROJECT_ROOT / config.android.apk).resolve())
+
+    return options
+
+
+@DeviceOptionsFactory.register(PlatformName.IOS)
+def ios_options(config: AppConfig) -> dict[str, Any]:
+    """
+    Build XCUITest capabilities.
+
+    Args:
+        config (AppConfig): Application configuration.
+
+    Returns:
+        dict[str, Any]: Capabilities for an iOS session.
+
+    """
+    options: dict[str, Any] = {
+        "platformName": "iOS",
+        "automationName": "XCUITest",
+        "noReset": config.appium.no_reset,
+        "fullReset": config.appium.full_reset,
+        "platformVersion": config.ios.platform_version,
+        "bundleId": config.ios.bundle_id,
+        "autoAcceptAlerts": True,
+        "newCommandTimeout": config.appium.new_command_timeout,
+        "deviceName": DeviceOptionsFactory.device_name(config, PlatformName.IOS),
+    }
+    if config.ios.connected_device in (DeviceType.PHYSICAL.value, DeviceType.WIFI.value):
+        options["udid"] = options["deviceName"]
+    if config.ios.ipa != "NONE":
+        options["app"] = str(Path(PROJECT_ROOT / config.ios.ipa).resolve())
+
+    return options
+
+
+@DeviceOptionsFactory.register(PlatformName.WEB)
+def web_options(config: AppConfig) -> dict[str, Any]:
+    """
+    Build browser capabilities.
+
+    Args:
+        config (AppConfig): Application configuration.
+
+    Returns:
+        dict[str, Any]: Capabilities for a web session.
+
+    """
+    return {
+        "browserName": config.web.browser_engine,
+        "headless": config.web.headless,
+        "deviceName": DeviceOptionsFactory.device_name(config, PlatformName.WEB),
+    }
 
 
 class TestCore:
     """Core class for Appium-based testing, handling setup and teardown of test sessions."""
 
+    _health_monitor: ClassVar[HealthMonitor | None] = None
+    _visual: ClassVar[VisualCheck | None] = None
+
     @property
     def scheme(self) -> str:
         """
@@ -230,25 +633,352 @@ class TestCore:
         """
         return f"{self.scheme}{self.config.appium.host}:{self.config.appium.port}"
 
-    def setup_method(self) -> None:
+    @property
+    def transport_mode(self) -> TransportMode:
+        """
+        Get how driver commands reach the device.
+
+        Returns:
+            TransportMode: LIVE, RECORD or REPLAY.
+
+        """
+        from src.utils.transport import TransportMode  # noqa: PLC0415
+
+        return TransportMode(self.config.env.transport_mode)
+
+    @property
+    def platform_name(self) -> PlatformName:
+        """
+        Get the platform this process runs sessions on.
+
+        The TEST_PLATFORM environment variable overrides the configured platform, so the same tests
+        can run against several platforms from concurrent pytest processes.
+
+        Returns:
+            PlatformName: ANDROID, IOS or WEB.
+
+        """
+        return PlatformName(os.environ.get("TEST_PLATFORM", self.config.env.platform))
+
+    def setup_method(self, method: Callable | None = None) -> None:
         """
         Set up the test environment before each test method.
 
         Initializes configuration, device options, and creates necessary objects for testing.
+
+        Args:
+            method (Callable | None): The test method, used to name its cassette.
+
         """
+        import allure  # noqa: PLC0415
+
+        from src.utils.transport import TransportMode  # noqa: PLC0415
+        from src.utils.visual import VisualCheck  # noqa: PLC0415
+
         self.config = ConfigLoader.load_config(CONFIG_PATH)
-        self.options = DeviceOptionsFactory.create_options(self.config)
-        self.driver = webdriver.Remote(
-            self.appium_url,
-            options=UiAutomator2Options().load_capabilities(self.options),
-        )
-        self.action = Action(self.driver)
+        self.options = DeviceOptionsFactory.create_options(self.config, self.platform_name)
         self.platform = Platform(self.config.env.debug)
-        self.device = Device(
-            self.driver, self.config.android.package, self.platform.output_dir,
-        )
+        allure.dynamic.label("device", self.options["deviceName"])
+        test_name = method.__name__ if method is not None else "session"
+        self.cassette_path = PROJECT_ROOT / self.config.env.cassette_dir / f"{type(self).__name__}.{test_name}.json.gz"
+        if self.transport_mode is not TransportMode.REPLAY and self.platform_name is not PlatformName.WEB:
+            if self.config.launcher.enabled and self.platform_name is PlatformName.ANDROID:
+                self.use_warm_slot()
+            else:
+                self.check_health()
+        if TestCore._visual is None:
+            # One instance per process, so decoded baselines are reused across tests.
+            TestCore._visual = VisualCheck(
+                str(PROJECT_ROOT / self.config.visual.baseline_dir),
+                self.config.visual.max_diff_ratio,
+                self.config.visual.pixel_tolerance,
+            )
+        self.visual = TestCore._visual
+        self._start_session()
+
+    def use_warm_slot(self) -> None:
+        """
+        Point the session at an Appium server and emulator kept warm by the launcher daemon.
+
+        The daemon is started on first use, by one worker at a time, and reused by later pytest
+        invocations with the same launcher settings. Every slot is health-checked before one is
+        taken, and an already booted emulator is passed as `udid` so Appium does not boot the AVD
+        itself.
+        """
+        from src.utils.health import Endpoint  # noqa: PLC0415
+        from src.utils.launcher import LauncherDaemon  # noqa: PLC0415
+
+        launcher = self.config.launcher
+        is_virtual = DeviceType(self.config.android.connected_device) is DeviceType.VIRTUAL
+        avds = [self.config.android.id_virtual] if is_virtual else []
+        launcher_args = [f"--port={port}" for port in launcher.worker_ports]
+        launcher_args += [f"--avd={avd}" for avd in avds]
+        launcher_args += [
+            f"--appium={launcher.appium_executable}",
+            f"--emulator={launcher.emulator_executable}",
+            f"--adb={launcher.adb_executable}",
+            f"--boot-timeout={launcher.boot_timeout}",
+        ]
+        slots = LauncherDaemon(PROJECT_ROOT / launcher.state_dir).ensure_running(launcher_args, launcher.boot_timeout)
+        by_endpoint = {
+            Endpoint(
+                f"{self.options['deviceName']}@{slot.appium_port}",
+                f"{self.scheme}{self.config.appium.host}:{slot.appium_port}",
+                slot.udid,
+            ): slot
+            for slot in slots
+        }
+        slot = by_endpoint[self.check_health(list(by_endpoint))]
+        self.config.appium.port = str(slot.appium_port)
+        if slot.udid:
+            self.options.pop("avd", None)
+            self.options["udid"] = slot.udid
+
+    def check_health(self, endpoints: list[Endpoint] | None = None) -> Endpoint:
+        """
+        Fail fast if the Appium server or device is unhealthy, and pick the endpoint to run on.
+
+        The first call probes every endpoint synchronously and starts a background monitor that keeps
+        probing every `probe_interval` seconds until the session finishes; later calls only consult
+        its quarantine state. Each xdist worker takes the endpoint matching its index, or the next
+        healthy one if that endpoint is quarantined.
+
+        Args:
+            endpoints (list[Endpoint] | None): The launcher slots, or None for the configured device.
+
+        Returns:
+            Endpoint: The healthy endpoint the session should use.
+
+        Raises:
+            DeviceUnhealthyError: If every endpoint failed its latest health probe.
+
+        """
+        from src.utils.health import Endpoint, HealthMonitor  # noqa: PLC0415
+
+        if TestCore._health_monitor is None:
+            if endpoints is None:
+                # Android devices are also probed over adb; the serial of an AVD that Appium boots
+                # itself is only known once the session starts, see `_watch_device`.
+                udid = self.options.get("udid") if self.platform_name is PlatformName.ANDROID else None
+                endpoints = [Endpoint(self.options["deviceName"], self.appium_url, udid)]
+            monitor = HealthMonitor(
+                endpoints,
+                timeout=self.config.health.probe_timeout,
+                interval=self.config.health.probe_interval,
+                adb_path=self.config.launcher.adb_executable,
+            )
+            monitor.check()
+            monitor.start()
+            TestCore._health_monitor = monitor
+        monitor = TestCore._health_monitor
+        worker = int(os.environ.get("PYTEST_XDIST_WORKER", "gw0").removeprefix("gw")) % len(monitor.endpoints)
+        preferred = monitor.endpoints[worker:] + monitor.endpoints[:worker]
+        for endpoint in preferred:
+            if endpoint.name not in monitor.quarantined:
+                return endpoint
+        endpoint = preferred[0]
+        msg = f"{endpoint.name} failed health probe: {monitor.statuses[endpoint.name].reason}"
+        raise DeviceUnhealthyError(msg)
+
+    def _watch_device(self) -> None:
+        """Add the serial Appium reports for the session's device to a monitored endpoint that lacks one."""
+        from src.utils.health import Endpoint  # noqa: PLC0415
+
+        monitor = TestCore._health_monitor
+        if monitor is None or self.platform_name is not PlatformName.ANDROID:
+            return
+        udid = self.driver.capabilities.get("udid")
+        if not udid:
+            return
+        for endpoint in monitor.endpoints:
+            if endpoint.appium_url == self.appium_url and endpoint.udid is None:
+                monitor.update(Endpoint(endpoint.name, endpoint.appium_url, udid))
+
+    @classmethod
+    def stop_health_monitor(cls) -> None:
+        """Stop the background health probes at the end of the session."""
+        if cls._health_monitor is not None:
+            cls._health_monitor.stop()
+            cls._health_monitor = None
+
+    def _start_session(self) -> None:
+        """Create the driver and the helper objects bound to it."""
+        from appium.swipe.actions import SwipeActions  # noqa: PLC0415
+
+        from src.pages.registry import PageRegistry  # noqa: PLC0415
+        from src.utils.action import Action  # noqa: PLC0415
+        from src.utils.device import Device  # noqa: PLC0415
+        from src.utils.retry import StepRetrier  # noqa: PLC0415
+        from src.utils.snapshot import StateSnapshot  # noqa: PLC0415
+        from src.utils.wait import Wait  # noqa: PLC0415
+
+        self.driver = self._create_driver()
+        self._watch_device()
+        self.action = Action(self.driver, self.platform_name)
+        app_id = self.config.ios.bundle_id if self.platform_name is PlatformName.IOS else self.config.android.package
+        self.device = Device(self.driver, app_id, self.platform.output_dir, self.platform_name)
         self.swipe = SwipeActions(self.driver)
-        self.wait = Wait(self.driver)
+        self.retry = StepRetrier(self.device, self.config.env.step_max_attempts)
+        self.wait = Wait(self.driver, events=self._ui_events(), fallback_interval=self.config.wait.fallback_interval)
+        self.pages = PageRegistry(self.driver, self.action, self.wait, self.swipe, self.platform_name)
+        self.snapshot = StateSnapshot(
+            self.driver,
+            self.config.android.package,
+            str(PROJECT_ROOT / self.config.snapshot.snapshot_dir),
+            self.snapshot_strategy,
+            adb_path=self.config.launcher.adb_executable,
+        )
+
+    def system_bar_masks(self) -> list[Region]:
+        """
+        Get the screen regions of the system bars, whose clock and icons change between screenshots.
+
+        Returns:
+            list[Region]: (x, y, width, height) of the visible status and navigation bars; empty off Android.
+
+        """
+        if self.platform_name is not PlatformName.ANDROID:
+            return []
+        bars = self.driver.get_system_bars()
+        return [
+            (bar["x"], bar["y"], bar["width"], bar["height"])
+            for bar in (bars.get("statusBar", {}), bars.get("navigationBar", {}))
+            if bar.get("visible")
+        ]
+
+    def _ui_events(self) -> UiEventStream | None:
+        """
+        Subscribe to UI change notifications if the EVENTS wait backend is configured.
+
+        Events are only used against a live Appium session; recorded and replayed sessions keep
+        polling so their command sequences stay reproducible.
+
+        Returns:
+            UiEventStream | None: The device log stream, or None to poll.
+
+        """
+        from src.utils.transport import TransportMode  # noqa: PLC0415
+        from src.utils.wait import WaitBackend  # noqa: PLC0415
+
+        if (
+            WaitBackend(self.config.wait.backend) is not WaitBackend.EVENTS
+            or self.transport_mode is not TransportMode.LIVE
+            or self.platform_name is PlatformName.WEB
+        ):
+            return None
+        from src.utils.ui_events import UiEventStream  # noqa: PLC0415
+
+        event_filter = None if self.config.wait.event_filter == "NONE" else self.config.wait.event_filter
+        package = self.config.android.package if self.platform_name is PlatformName.ANDROID else None
+        return UiEventStream.for_session(self.driver, self.appium_url, event_filter, package)
+
+    def _quit_session(self) -> None:
+        """Close the UI event stream, if any, and quit the driver."""
+        if self.wait.events is not None:
+            self.wait.events.stop()
+        self.driver.quit()
+
+    def _create_driver(self) -> WebDriver:
+        """
+        Start a session for the targeted platform.
+
+        Android and iOS sessions go through Appium with UiAutomator2 or XCUITest options; web
+        sessions start a local browser on the configured URL.
+
+        Returns:
+            WebDriver: The driver of the new session.
+
+        Raises:
+            ValueError: If a web session is requested without a configured URL.
+
+        """
+        if self.platform_name is PlatformName.WEB:
+            from selenium import webdriver as browser  # noqa: PLC0415
+
+            if self.config.env.url == "NONE":
+                msg = "Web sessions need `url` set in the [ENVIRONMENT] section of config.cfg"
+                raise ValueError(msg)
+            if self.options["browserName"] == "firefox":
+                driver_class, browser_options = browser.Firefox, browser.FirefoxOptions()
+                headless_argument = "-headless"
+            else:
+                driver_class, browser_options = browser.Chrome, browser.ChromeOptions()
+                headless_argument = "--headless=new"
+            if self.options["headless"]:
+                browser_options.add_argument(headless_argument)
+            driver = driver_class(options=browser_options)
+            driver.get(self.config.env.url)
+            return driver
+
+        from appium import webdriver  # noqa: PLC0415
+        from appium.options.android import UiAutomator2Options  # noqa: PLC0415
+        from appium.options.ios import XCUITestOptions  # noqa: PLC0415
+
+        options_class = XCUITestOptions if self.platform_name is PlatformName.IOS else UiAutomator2Options
+        return webdriver.Remote(self._command_executor(), options=options_class().load_capabilities(self.options))
+
+    def _command_executor(self) -> str | RecordingConnection | ReplayConnection:
+        """
+        Get the command executor for the configured transport mode.
+
+        Returns:
+            str | RecordingConnection | ReplayConnection: The Appium URL for LIVE, or a recording/replaying connection.
+
+        """
+        from src.utils.transport import RecordingConnection, ReplayConnection, TransportMode  # noqa: PLC0415
+
+        if self.transport_mode is TransportMode.RECORD:
+            return RecordingConnection(self.appium_url, self.cassette_path, keep_alive=True)
+        if self.transport_mode is TransportMode.REPLAY:
+            return ReplayConnection(
+                self.appium_url, self.cassette_path, strict=self.config.env.strict_replay, keep_alive=True,
+            )
+        return self.appium_url
+
+    @property
+    def snapshot_strategy(self) -> SnapshotStrategy:
+        """
+        Get the snapshot strategy usable with the connected device.
+
+        Both snapshot strategies need adb, so iOS and web sessions rebuild their states through the UI.
+        Emulator snapshots are only available for VIRTUAL Android devices; other devices fall back to APP_DATA.
+
+        Returns:
+            SnapshotStrategy: The strategy used to capture and restore precondition states.
+
+        """
+        from src.utils.snapshot import SnapshotStrategy  # noqa: PLC0415
+
+        strategy = SnapshotStrategy(self.config.snapshot.strategy)
+        if self.platform_name is not PlatformName.ANDROID:
+            return SnapshotStrategy.REBUILD
+        is_virtual = DeviceType(self.config.android.connected_device) is DeviceType.VIRTUAL
+        if strategy is SnapshotStrategy.EMULATOR and not is_virtual:
+            return SnapshotStrategy.APP_DATA
+        return strategy
+
+    def use_state(self, key: str, builder: Callable[[], None]) -> bool:
+        """
+        Reach a named precondition state, building it through the UI only once per run.
+
+        The first test to request a state runs the builder and captures the result, later tests
+        restore the capture instead of repeating the UI steps.
+
+        Args:
+            key (str): The name of the precondition state.
+            builder (Callable[[], None]): Reaches the state through the UI.
+
+        Returns:
+            bool: True if the state was restored, in which case the app has just been relaunched.
+
+        """
+        from src.utils.snapshot import SnapshotStrategy  # noqa: PLC0415
+
+        restored = self.snapshot.ensure(key, builder)
+        if restored and self.snapshot.strategy is SnapshotStrategy.EMULATOR:
+            self._quit_session()
+            self._start_session()
+        return restored
 
     def teardown_method(self) -> None:
         """
@@ -258,4 +988,9 @@ class TestCore:
         """
         if not hasattr(self, "driver"):
             return
-        self.driver.quit()
+        self.retry.attach_stats()
+        self._quit_session()
+        mismatches = getattr(self.driver.command_executor, "mismatches", [])
+        if mismatches:
+            msg = f"Replay diverged from {self.cassette_path.name}: {mismatches[0]}"
+            raise ReplayMismatchError(msg)
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from src.utils.allure_shards import LEDGER_NAME, completed_tests, merge_shards
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+SAMPLE_TESTS = """
+import os
+
+def test_first():
+    pass
+
+def test_second():
+    if os.environ.get("CRASH_SECOND"):
+        os._exit(1)
+"""
+MERGED_FILES = 4
+
+
+class TestsAllureShards:
+
+    def setup_method(self) -> None:
+        self.tmp_dir = Path(tempfile.mkdtemp())
+        self.shards = self.tmp_dir / "shards"
+        self.results = self.tmp_dir / "allure-results"
+
+    def teardown_method(self) -> None:
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def write_shard(self, worker: str, *names: str) -> None:
+        shard = self.shards / worker
+        shard.mkdir(parents=True)
+        for name in names:
+            (shard / name).write_text(name)
+
+    def run_pytest(self, *args: str, crash: bool = False) -> subprocess.CompletedProcess:
+        (self.tmp_dir / "test_sample.py").write_text(SAMPLE_TESTS)
+        env = {**os.environ, "PYTHONPATH": str(PROJECT_ROOT)}
+        env.pop("PYTEST_XDIST_WORKER", None)
+        if crash:
+            env["CRASH_SECOND"] = "1"
+        return subprocess.run(  # noqa: S603
+            [
+                sys.executable, "-m", "pytest", "-p", "src.utils.allure_shards", "test_sample.py",
+                f"--alluredir={self.results}", "--clean-alluredir", "--allure-shards",
+                f"--allure-shard-dir={self.shards}", *args,
+            ],
+            capture_output=True, text=True, cwd=self.tmp_dir, env=env, check=False,
+        )
+
+    def test_merge_combines_shards_and_skips_partial_files(self) -> None:
+        self.write_shard("gw0", "a-result.json", "a-attachment.png", ".b-result.json.123.tmp")
+        self.write_shard("gw1", "c-result.json", "d-container.json")
+        (self.shards / "gw1" / LEDGER_NAME).write_text("test_a\n")
+        self.results.mkdir()
+        (self.results / "stale-result.json").write_text("{}")
+        results_inode = self.results.stat().st_ino
+
+        assert merge_shards(self.shards, self.results) == MERGED_FILES
+        assert self.results.stat().st_ino == results_inode
+        assert sorted(path.name for path in self.results.iterdir()) == [
+            "a-attachment.png", "a-result.json", "c-result.json", "d-container.json",
+        ]
+
+    def test_merge_keeps_existing_results_without_clean(self) -> None:
+        self.write_shard("main", "a-result.json")
+        self.results.mkdir()
+        (self.results / "old-result.json").write_text("{}")
+
+        merge_shards(self.shards, self.results, clean=False)
+        assert sorted(path.name for path in self.results.iterdir()) == ["a-result.json", "old-result.json"]
+
+    def test_resume_skips_tests_with_results(self) -> None:
+        crashed = self.run_pytest(crash=True)
+        assert crashed.returncode != 0
+        assert completed_tests(self.shards) == {"test_sample.py::test_first"}
+        assert not self.results.exists()
+
+        resumed = self.run_pytest("--allure-resume")
+        assert resumed.returncode == 0, resumed.stdout
+        assert "1 deselected" in resumed.stdout
+        results = [json.loads(path.read_text()) for path in self.results.glob("*-result.json")]
+        assert sorted(result["name"] for result in results) == ["test_first", "test_second"]
+        assert not list(self.results.glob(".*"))
+        assert not list(self.tmp_dir.glob(".allure-results.*"))
@@ -1,11 +1,8 @@
 import allure
 import pytest
 
-from src.pages.garden.page import GardenPage
-from src.pages.home.page import HomePage
-from src.pages.plant.page import PlantPage
 from src.tests.core import TestCore
-from src.utils.exception import FailedTestError
+from src.utils.exception import AppCrashError, FailedTestError, TransientStepError
 
 
 @allure.title("Add New Plant Test")
@@ -13,32 +10,37 @@ from src.utils.exception import FailedTestError
 @allure.tag("Smoke Test")
 class TestsBasic(TestCore):
 
+    def open_app(self) -> None:
+        self.retry.step(
+            "Step 1. Open App",
+            self.pages.home.confirm_ready,
+            retry_on=(TransientStepError, AppCrashError),
+        )
+
     def test_add_new_plant(self) -> None:
         try:
-            with allure.step("Step 1. Open App"):
-                self.home = HomePage(self.driver)
-                self.garden = GardenPage(self.driver)
-                self.plant = PlantPage(self.driver)
-                self.home.confirm_ready()
-            with allure.step("Step 2. Navigate to Add Plant"):
-                self.home.open_add_plant()
+            if self.use_state("empty_garden", self.open_app):
+                self.open_app()
+            self.retry.step("Step 2. Navigate to Add Plant", self.pages.home.open_add_plant, retry_on=())
             with allure.step("Step 3. Create New Plant"):
-                self.plant.set_details("Tulips", "Very pretty!", "5th Floor Dungeon")
-                details = self.plant.get_details()
+                self.pages.plant.set_details("Tulips", "Very pretty!", "5th Floor Dungeon")
+                details = self.pages.plant.get_details()
                 assert details == {
                     "Name": "Tulips",
                     "Desc": "Very pretty!",
                     "Location": "5th Floor Dungeon",
                 }
-                self.plant.set_day_planted("06/01/2024")
+                self.pages.plant.set_day_planted("06/01/2024")
             with allure.step("Step 4. Verify New Plant"):
-                self.garden.confirm_ready()
-                self.garden.verify_plant("Tulips")
+                self.retry.step("Confirm Garden", self.pages.garden.confirm_ready)
+                self.retry.step("Find Plant", self.pages.garden.verify_plant, "Tulips")
+                screenshot = self.driver.get_screenshot_as_png()
                 allure.attach(
-                    self.driver.get_screenshot_as_png(),
+                    screenshot,
                     name="Plant Created",
                     attachment_type=allure.attachment_type.PNG,
                 )
+                self.visual.assert_matches("plant_created", screenshot, masks=self.system_bar_masks())
             self.platform.remove_output_folder()
         except FailedTestError as e:
             allure.attach(
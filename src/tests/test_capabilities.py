@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from src.pages.locators import PlatformLocators
+from src.tests.core import CONFIG_PATH, ConfigLoader, DeviceOptionsFactory
+from src.utils.platform import PlatformName
+
+
+class SampleLocators(PlatformLocators):
+    HEADING = ("-android uiautomator", 'new UiSelector().description("Today")')
+    BUTTON = ("-android uiautomator", 'new UiSelector().className("android.widget.Button")')
+
+    IOS = {"HEADING": ("accessibility id", "Today")}  # noqa: RUF012
+
+
+class TestsCapabilities:
+
+    def setup_method(self) -> None:
+        self.config = ConfigLoader.load_config(CONFIG_PATH)
+        self.config.ios.connected_device = "VIRTUAL"
+        self.config.ios.id_virtual = "iPhone 15"
+        self.config.ios.platform_version = "17.5"
+        self.config.env.url = "http://127.0.0.1:8080"
+
+    def test_precomputes_every_configured_platform(self) -> None:
+        options = DeviceOptionsFactory.precompute(self.config)
+        assert options[PlatformName.ANDROID]["appPackage"] == self.config.android.package
+        assert options[PlatformName.ANDROID]["platformVersion"] == self.config.android.platform_version
+        assert options[PlatformName.IOS]["automationName"] == "XCUITest"
+        assert options[PlatformName.IOS]["deviceName"] == "iPhone 15"
+        assert "udid" not in options[PlatformName.IOS]
+        assert options[PlatformName.WEB]["browserName"] == self.config.web.browser_engine
+
+    def test_options_follow_config_changes_and_are_not_shared(self) -> None:
+        first = DeviceOptionsFactory.create_options(self.config, PlatformName.IOS)
+        first["udid"] = "changed"
+        self.config.ios.platform_version = "18.0"
+        second = DeviceOptionsFactory.create_options(self.config, PlatformName.IOS)
+        assert "udid" not in second
+        assert second["platformVersion"] == "18.0"
+
+    def test_locator_overrides_per_platform(self) -> None:
+        ios = SampleLocators.for_platform(PlatformName.IOS)
+        assert ios.HEADING == ("accessibility id", "Today")
+        assert ios.BUTTON == SampleLocators.BUTTON
+        assert SampleLocators.for_platform(PlatformName.IOS) is ios
+        assert SampleLocators.for_platform(PlatformName.WEB) is SampleLocators
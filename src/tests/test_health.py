@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from src.tests.core import CONFIG_PATH, ConfigLoader, TestCore
+from src.utils.health import Endpoint, HealthMonitor
+
+PROBE_BUDGET = 2
+
+
+class FakeAppiumServer(ThreadingHTTPServer):
+    """Local stand-in for an Appium server that can answer `/status` or hang."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:  # noqa: D107
+        self.hang = False
+        self.release = threading.Event()
+        super().__init__(("127.0.0.1", 0), FakeStatusHandler)
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    @property
+    def url(self) -> str:  # noqa: D102
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def close(self) -> None:  # noqa: D102
+        self.release.set()
+        self.shutdown()
+        self.server_close()
+
+
+class FakeStatusHandler(BaseHTTPRequestHandler):
+    """Handles `/status`, blocking until released while the server simulates a hang."""
+
+    server: FakeAppiumServer
+
+    def do_GET(self) -> None:  # noqa: D102
+        if self.server.hang:
+            self.server.release.wait()
+            return
+        body = json.dumps({"value": {"ready": True, "message": "ok"}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args: object) -> None:  # noqa: D102
+        return
+
+
+class TestsHealth:
+
+    def setup_method(self) -> None:
+        self.servers = [FakeAppiumServer(), FakeAppiumServer()]
+        self.endpoints = [Endpoint(f"device-{i}", server.url) for i, server in enumerate(self.servers)]
+        self.monitor = HealthMonitor(self.endpoints, timeout=0.5)
+
+    def teardown_method(self) -> None:
+        TestCore.stop_health_monitor()
+        for server in self.servers:
+            server.close()
+
+    def test_healthy_servers_pass(self) -> None:
+        statuses = self.monitor.check()
+        assert all(status.healthy for status in statuses.values())
+        assert not self.monitor.quarantined
+
+    def test_hung_server_is_quarantined_within_timeout(self) -> None:
+        self.servers[1].hang = True
+        start = time.monotonic()
+        statuses = self.monitor.check()
+        assert time.monotonic() - start < PROBE_BUDGET
+        assert statuses["device-0"].healthy
+        assert not statuses["device-1"].healthy
+        assert self.monitor.quarantined == {"device-1"}
+
+    def test_recovered_server_leaves_quarantine(self) -> None:
+        self.servers[1].hang = True
+        self.monitor.check()
+        assert self.monitor.healthy() == self.endpoints[:1]
+        self.servers[1].hang = False
+        self.servers[1].release.set()
+        assert self.monitor.check()["device-1"].healthy
+        assert self.monitor.healthy() == self.endpoints
+
+    def test_worker_moves_off_a_quarantined_slot(self) -> None:
+        self.servers[0].hang = True
+        core = TestCore()
+        core.config = ConfigLoader.load_config(CONFIG_PATH)
+        core.config.health.probe_timeout = 0.5
+        with mock.patch.dict(os.environ, {"PYTEST_XDIST_WORKER": "gw0"}):
+            assert core.check_health(self.endpoints) == self.endpoints[1]
+        assert TestCore._health_monitor.endpoints == self.endpoints  # noqa: SLF001
+
+    def test_update_adds_the_device_serial_and_stop_ends_probing(self) -> None:
+        self.monitor.start()
+        self.monitor.update(Endpoint("device-1", self.servers[1].url, "emulator-5556"))
+        assert self.monitor.endpoints[1].udid == "emulator-5556"
+        thread = self.monitor._thread  # noqa: SLF001
+        self.monitor.stop()
+        assert not thread.is_alive()
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from src.utils.idle_profiler import IdleProfiler, TimeCategory, TimeProfile, _call_site, _pause_seconds
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+TAP_SITE = "src/pages/home/page.py:40 open_add_plant"
+WAIT_SITE = "src/pages/garden/page.py:35 confirm_ready"
+
+
+def profile(nodeid: str, wall: float, sites: dict[tuple[TimeCategory, str], list[float]]) -> TimeProfile:
+    result = TimeProfile(nodeid, wall)
+    for (category, site), (seconds, count) in sites.items():
+        result.totals[category] += seconds
+        result.sites[(category, site)] = [seconds, count]
+    return result
+
+
+def sleeping_helper() -> str:
+    return _call_site()
+
+
+class TestsIdleProfiler:
+
+    def setup_method(self) -> None:
+        self.profiler = IdleProfiler(Path("idle-profile.json"))
+        tap, wait = (TimeCategory.SLEEP, TAP_SITE), (TimeCategory.POLLING, WAIT_SITE)
+        self.profiler.profiles = [
+            profile("test_a", 10.0, {tap: [1.0, 2], wait: [3.0, 1]}),
+            profile("test_b", 5.0, {tap: [2.5, 5], (TimeCategory.DEVICE, "app"): [2.0, 1]}),
+        ]
+
+    def test_pause_seconds_takes_the_longest_input_source(self) -> None:
+        params = {
+            "actions": [
+                {"type": "pointer", "actions": [{"type": "pause", "duration": 100}, {"type": "pointerDown"}]},
+                {"type": "key", "actions": [{"type": "pause", "duration": 250}, {"type": "keyDown", "value": "a"}]},
+            ],
+        }
+        assert _pause_seconds(params) == pytest.approx(0.25)
+        assert _pause_seconds({"actions": [{"type": "pointer", "actions": [{"type": "pointerUp"}]}]}) == 0
+        assert _pause_seconds(None) == 0
+
+    def test_profile_idle_counts_sleeps_and_polling_only(self) -> None:
+        test_a, test_b = self.profiler.profiles
+        assert test_a.idle_ratio == pytest.approx(0.4)
+        assert test_b.as_dict()["totals"] == {"device": 2.0, "network": 0.0, "sleep": 2.5, "polling": 0.0, "other": 0.0}
+        assert not TimeProfile("test_c").idle_ratio
+
+    def test_waits_are_ranked_across_tests(self) -> None:
+        assert self.profiler.ranked_waits()[:2] == [
+            {"category": "sleep", "site": TAP_SITE, "seconds": 3.5, "count": 7},
+            {"category": "polling", "site": WAIT_SITE, "seconds": 3.0, "count": 1},
+        ]
+        summary = self.profiler.summary()
+        assert summary["wall"] == pytest.approx(15.0)
+        assert summary["idle_ratio"] == pytest.approx(6.5 / 15, abs=0.001)
+        assert [test["nodeid"] for test in summary["tests"]] == ["test_a", "test_b"]
+
+    def test_worker_records_round_trip_to_the_controller(self) -> None:
+        controller = IdleProfiler(Path("idle-profile.json"))
+        for profile in self.profiler.profiles:
+            controller.profiles.append(TimeProfile.from_record(json.loads(json.dumps(profile.to_record()))))
+        assert controller.summary() == self.profiler.summary()
+
+    def test_call_site_names_the_calling_line(self) -> None:
+        assert sleeping_helper().startswith("src/tests/test_idle_profiler.py:")
+        assert sleeping_helper().endswith(" test_call_site_names_the_calling_line")
+
+    def test_xdist_workers_write_one_merged_report(self) -> None:
+        pytest.importorskip("xdist")
+        tmp_dir = Path(tempfile.mkdtemp())
+        try:
+            (tmp_dir / "test_sample.py").write_text("def test_first():\n    pass\n\ndef test_second():\n    pass\n")
+            report_path = tmp_dir / "idle-profile.json"
+            result = subprocess.run(  # noqa: S603
+                [
+                    sys.executable, "-m", "pytest", "-p", "src.utils.idle_profiler", "test_sample.py", "-n", "2",
+                    "--idle-profile", f"--idle-profile-report={report_path}",
+                ],
+                capture_output=True, text=True, cwd=tmp_dir, env={**os.environ, "PYTHONPATH": str(PROJECT_ROOT)},
+                check=False,
+            )
+            assert result.returncode == 0, result.stdout
+            tests = json.loads(report_path.read_text())["tests"]
+            assert sorted(test["nodeid"] for test in tests) == [
+                "test_sample.py::test_first", "test_sample.py::test_second",
+            ]
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
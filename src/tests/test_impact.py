@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from src.utils.impact import environment_fingerprint
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+CONFIG = """
+[APP]
+android_apk = app/florae.apk
+ios_ipa = NONE
+"""
+
+
+class TestsImpact:
+
+    def setup_method(self) -> None:
+        self.tmp_dir = Path(tempfile.mkdtemp())
+        self.map_path = self.tmp_dir / "impact-map.json"
+        (self.tmp_dir / "config.cfg").write_text(CONFIG)
+        (self.tmp_dir / "app").mkdir()
+        (self.tmp_dir / "app" / "florae.apk").write_bytes(b"apk v1")
+        (self.tmp_dir / "test_home.py").write_text("def test_home():\n    pass\n")
+        (self.tmp_dir / "test_garden.py").write_text("def test_garden():\n    pass\n")
+
+    def teardown_method(self) -> None:
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def run_pytest(self, *args: str) -> str:
+        env = {**os.environ, "PYTHONPATH": str(PROJECT_ROOT)}
+        result = subprocess.run(  # noqa: S603
+            [
+                sys.executable, "-m", "pytest", "-p", "src.utils.impact", f"--rootdir={self.tmp_dir}",
+                "--impact", f"--impact-map={self.map_path}", "test_home.py", "test_garden.py", *args,
+            ],
+            capture_output=True, text=True, cwd=self.tmp_dir, env=env, check=False,
+        )
+        assert result.returncode in (0, 5), result.stdout
+        return result.stdout
+
+    def test_unchanged_tests_are_deselected(self) -> None:
+        assert "2 passed" in self.run_pytest()
+        assert sorted(json.loads(self.map_path.read_text())["tests"]) == [
+            "test_garden.py::test_garden", "test_home.py::test_home",
+        ]
+        assert "2 deselected" in self.run_pytest()
+
+        (self.tmp_dir / "test_garden.py").write_text("def test_garden():\n    assert True\n")
+        output = self.run_pytest()
+        assert "1 passed, 1 deselected" in output
+
+    def test_config_change_selects_every_test(self) -> None:
+        self.run_pytest()
+        with (self.tmp_dir / "config.cfg").open("a") as config:
+            config.write("package = cat.naval.florae\n")
+        assert "2 passed" in self.run_pytest()
+        assert "2 deselected" in self.run_pytest()
+
+    def test_app_artifact_change_selects_every_test(self) -> None:
+        self.run_pytest()
+        before = environment_fingerprint(self.tmp_dir)
+        (self.tmp_dir / "app" / "florae.apk").write_bytes(b"apk v2")
+        assert environment_fingerprint(self.tmp_dir) != before
+        assert "2 passed" in self.run_pytest()
+
+    def test_xdist_workers_merge_into_one_map(self) -> None:
+        pytest.importorskip("xdist")
+        assert "2 passed" in self.run_pytest("-n", "2")
+        assert sorted(json.loads(self.map_path.read_text())["tests"]) == [
+            "test_garden.py::test_garden", "test_home.py::test_home",
+        ]
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+IMPORT_BUDGET_MS = 250
+RUNS = 3
+HEAVY_MODULES = ("appium", "selenium", "allure", "allure_commons", "numpy", "PIL")
+
+
+def run_python(code: str, *flags: str) -> subprocess.CompletedProcess:
+    """Run code in a fresh interpreter outside the project directory, as a parallel worker would."""
+    env = {**os.environ, "PYTHONPATH": str(PROJECT_ROOT)}
+    with tempfile.TemporaryDirectory() as cwd:
+        return subprocess.run(  # noqa: S603
+            [sys.executable, *flags, "-c", code], capture_output=True, text=True, cwd=cwd, env=env, check=True,
+        )
+
+
+class TestsImportTime:
+
+    def test_core_import_skips_driver_modules(self) -> None:
+        result = run_python(
+            "import sys, src.tests.core\n"
+            f"print(sorted({{m.split('.')[0] for m in sys.modules}} & set({HEAVY_MODULES!r})))",
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_config_resolves_from_project_root(self) -> None:
+        result = run_python("import src.tests.core as core; print(core.CONFIG_PATH.exists())")
+        assert result.stdout.strip() == "True"
+
+    def test_core_import_within_budget(self) -> None:
+        timings = []
+        for _ in range(RUNS):
+            stderr = run_python("import src.tests.core", "-X", "importtime").stderr
+            match = re.search(r"\|\s*(\d+) \| src\.tests\.core$", stderr, re.MULTILINE)
+            timings.append(int(match.group(1)) / 1000)
+        assert min(timings) < IMPORT_BUDGET_MS, f"import src.tests.core took {min(timings):.0f} ms"
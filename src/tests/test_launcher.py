@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import shutil
+import socket
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from src.utils.launcher import Launcher, LauncherDaemon
+
+STUB_APPIUM = """
+import json, sys
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = json.dumps({"value": {"ready": True}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+HTTPServer(("127.0.0.1", int(sys.argv[sys.argv.index("--port") + 1])), Handler).serve_forever()
+"""
+STUB_EMULATOR = """
+import time
+while True:
+    time.sleep(1)
+"""
+STUB_ADB = """
+print("1")
+"""
+STARTUP_TIMEOUT = 30
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestsLauncher:
+
+    def setup_method(self) -> None:
+        self.tmp_dir = Path(tempfile.mkdtemp())
+        self.stubs = {}
+        for name, source in {"appium": STUB_APPIUM, "emulator": STUB_EMULATOR, "adb": STUB_ADB}.items():
+            stub = self.tmp_dir / name
+            stub.write_text(f"#!{sys.executable}\n{source}")
+            stub.chmod(0o755)
+            self.stubs[name] = str(stub)
+        self.ports = [free_port(), free_port()]
+
+    def teardown_method(self) -> None:
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def launcher(self) -> Launcher:
+        return Launcher(
+            self.ports,
+            ["Pixel_7_Pro"],
+            self.tmp_dir / "logs",
+            appium_executable=self.stubs["appium"],
+            emulator_executable=self.stubs["emulator"],
+            adb_executable=self.stubs["adb"],
+            boot_timeout=20,
+        )
+
+    def test_starts_slots_in_parallel_and_stops(self) -> None:
+        launcher = self.launcher()
+        try:
+            slots = launcher.start()
+            assert [slot.udid for slot in slots] == ["emulator-5554", "emulator-5556"]
+            assert all(Launcher.appium_ready(port) for port in self.ports)
+            assert "-read-only" in launcher.processes["emulator-5554"].command
+        finally:
+            launcher.stop()
+        assert not any(process.is_alive() for process in launcher.processes.values())
+
+    def test_supervisor_restarts_exited_process(self) -> None:
+        launcher = self.launcher()
+        try:
+            launcher.start()
+            launcher.supervise(interval=0.1)
+            emulator = launcher.processes["emulator-5556"]
+            emulator.process.kill()
+            emulator.process.wait()
+            deadline = time.monotonic() + 5
+            while not emulator.is_alive() and time.monotonic() < deadline:
+                time.sleep(0.1)
+            assert emulator.is_alive()
+        finally:
+            launcher.stop()
+
+    def daemon_args(self, boot_timeout: int = 20) -> list[str]:
+        return [f"--port={port}" for port in self.ports] + [
+            f"--appium={self.stubs['appium']}",
+            f"--emulator={self.stubs['emulator']}",
+            f"--adb={self.stubs['adb']}",
+            f"--boot-timeout={boot_timeout}",
+        ]
+
+    def test_daemon_is_reused_across_invocations(self) -> None:
+        daemon = LauncherDaemon(self.tmp_dir / "state")
+        args = self.daemon_args()
+        try:
+            first = daemon.ensure_running(args, timeout=30)
+            pid = daemon.read_state()["pid"]
+            second = daemon.ensure_running(args, timeout=30)
+            assert first == second
+            assert daemon.read_state()["pid"] == pid
+        finally:
+            daemon.stop()
+        assert daemon.read_state() is None
+        assert not any(Launcher.appium_ready(port) for port in self.ports)
+
+    def test_concurrent_workers_start_one_daemon(self) -> None:
+        daemons = [LauncherDaemon(self.tmp_dir / "state") for _ in range(3)]
+        try:
+            with ThreadPoolExecutor(len(daemons)) as pool:
+                results = list(pool.map(lambda daemon: daemon.ensure_running(self.daemon_args(), timeout=30), daemons))
+            assert results[0] == results[1] == results[2]
+            state_dir = str(self.tmp_dir / "state").encode()
+            servers = [
+                cmdline for cmdline in (path.read_bytes() for path in Path("/proc").glob("[0-9]*/cmdline"))
+                if b"serve" in cmdline and state_dir in cmdline
+            ]
+            assert len(servers) == 1
+        finally:
+            daemons[0].stop()
+
+    def test_daemon_exiting_during_startup_fails_fast(self) -> None:
+        daemon = LauncherDaemon(self.tmp_dir / "state")
+        args = [
+            f"--port={self.ports[0]}",
+            "--avd=Pixel_7_Pro",
+            f"--appium={self.stubs['appium']}",
+            f"--emulator={self.tmp_dir / 'missing-emulator'}",
+        ]
+        start = time.monotonic()
+        try:
+            with pytest.raises(RuntimeError, match="missing-emulator"):
+                daemon.ensure_running(args, timeout=STARTUP_TIMEOUT)
+            assert time.monotonic() - start < STARTUP_TIMEOUT / 2
+        finally:
+            daemon.stop()
+
+    def test_daemon_with_other_arguments_is_restarted(self) -> None:
+        daemon = LauncherDaemon(self.tmp_dir / "state")
+        try:
+            daemon.ensure_running(self.daemon_args(), timeout=30)
+            pid = daemon.read_state()["pid"]
+            daemon.ensure_running(self.daemon_args(boot_timeout=30), timeout=30)
+            assert daemon.read_state()["pid"] != pid
+            assert "--boot-timeout=30.0" in daemon.read_state()["args"]
+        finally:
+            daemon.stop()
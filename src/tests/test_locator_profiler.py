@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from unittest import mock
+
+from appium.webdriver.common.appiumby import AppiumBy
+from selenium.common.exceptions import TimeoutException
+
+from src.utils.locator_profiler import LocatorProfiler, discover_locators
+
+ADD_BUTTON = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().className("android.widget.Button").instance(3)')
+ADD_BUTTON_ID = (AppiumBy.ID, "cat.naval.florae:id/add")
+ADD_BUTTON_TEXT = (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().text("Add")')
+TODAY_HEADING = (AppiumBy.ACCESSIBILITY_ID, "Today")
+GARDEN_HEADING = (AppiumBy.ACCESSIBILITY_ID, "Garden")
+ADD_BUTTON_MS = 400
+
+
+class FakeElement:
+    """Element with fixed attributes."""
+
+    def __init__(self, element_id: str, **attributes: str) -> None:
+        self.id = element_id
+        self.attributes = attributes
+
+    def get_attribute(self, name: str) -> str | None:
+        return self.attributes.get(name.replace("-", "_"))
+
+
+class FakeDriver:
+    """Resolves locators from a table, advancing a fake clock by each lookup's cost."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        add_button = FakeElement("add", resource_id=ADD_BUTTON_ID[1], text="Add")
+        self.screen = {
+            ADD_BUTTON: (ADD_BUTTON_MS / 1000, [add_button]),
+            ADD_BUTTON_ID: (0.02, [add_button]),
+            ADD_BUTTON_TEXT: (0.01, [add_button, FakeElement("label", text="Add")]),
+            TODAY_HEADING: (0.03, [FakeElement("today", content_desc="Today")]),
+        }
+
+    def perf_counter(self) -> float:
+        return self.now
+
+    def find_elements(self, by: str, value: str) -> list[FakeElement]:
+        cost, elements = self.screen.get((by, value), (0.05, []))
+        self.now += cost
+        return elements
+
+
+class TestsLocatorProfiler:
+
+    def setup_method(self) -> None:
+        self.driver = FakeDriver()
+        self.profiler = LocatorProfiler(self.driver, rounds=4)
+        mock.patch("src.utils.locator_profiler.time.perf_counter", self.driver.perf_counter).start()
+
+    def teardown_method(self) -> None:
+        mock.patch.stopall()
+
+    def test_slow_locator_gets_a_unique_cheaper_suggestion(self) -> None:
+        locators = {"HomeLocators.ADD_PLANT_BUTTON": ADD_BUTTON, "HomeLocators.TODAY": TODAY_HEADING}
+        profiles = self.profiler.profile(locators)
+        assert [profile.name for profile in profiles] == ["HomeLocators.ADD_PLANT_BUTTON", "HomeLocators.TODAY"]
+        slow, fast = profiles
+        assert round(slow.median_ms) == ADD_BUTTON_MS
+        assert slow.matches == 1
+        assert slow.suggestion == ADD_BUTTON_ID
+        assert fast.suggestion is None
+        assert "suggest (id, 'cat.naval.florae:id/add')" in LocatorProfiler.format_report(profiles)
+
+    def test_missing_locator_is_ranked_without_suggestion(self) -> None:
+        (profile,) = self.profiler.profile({"GardenLocators.PLACEHOLDER": (AppiumBy.ID, "missing")})
+        assert profile.matches == 0
+        assert profile.suggestion is None
+
+    def test_discovers_every_page_locator(self) -> None:
+        locators = discover_locators()
+        assert locators["HomeLocators.TODAY_HEADING"][1] == 'new UiSelector().description("Today")'
+        assert all(name.split(".")[0].endswith("Locators") for name in locators)
+        assert "GardenLocators.PLANT_CARD" not in locators
+
+    def test_profiles_each_group_on_its_own_screen(self) -> None:
+        garden_screen = {TODAY_HEADING: (0.03, [])}
+        garden_screen[GARDEN_HEADING] = (0.02, [FakeElement("garden", content_desc="Garden")])
+        opened = []
+
+        def open_garden() -> None:
+            opened.append("GardenLocators")
+            self.driver.screen = garden_screen
+
+        locators = {"GardenLocators.GARDEN_HEADING": GARDEN_HEADING, "HomeLocators.TODAY_HEADING": TODAY_HEADING}
+        profiles = self.profiler.profile(locators, screens={"GardenLocators": open_garden})
+        matches = {profile.name: profile.matches for profile in profiles}
+        assert opened == ["GardenLocators"]
+        assert matches == {"GardenLocators.GARDEN_HEADING": 1, "HomeLocators.TODAY_HEADING": 1}
+
+    def test_group_is_skipped_when_its_screen_fails_to_open(self) -> None:
+        def fail() -> None:
+            raise TimeoutException
+
+        locators = {"GardenLocators.GARDEN_HEADING": GARDEN_HEADING, "HomeLocators.TODAY_HEADING": TODAY_HEADING}
+        profiles = self.profiler.profile(locators, screens={"GardenLocators": fail})
+        assert [profile.name for profile in profiles] == ["HomeLocators.TODAY_HEADING"]
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import pytest
+from selenium.webdriver.common.keys import Keys
+
+from src.utils.action import Action
+from src.utils.device import Device
+from src.utils.platform import PlatformName
+
+
+class FakeElement:
+    """Focused element recording typed keys."""
+
+    def __init__(self) -> None:
+        self.keys: list[str] = []
+
+    def send_keys(self, value: str) -> None:
+        self.keys.append(value)
+
+
+class FakeDriver:
+    """Records the commands a platform-aware helper sends."""
+
+    def __init__(self, keyboard_shown: bool = True) -> None:  # noqa: FBT001, FBT002
+        self.commands: list[str] = []
+        self.keyboard_shown = keyboard_shown
+        self.active_element = FakeElement()
+        self.switch_to = self
+        self.current_url = "http://127.0.0.1:8080"
+
+    def execute_script(self, script: str, *_args: object) -> bool:
+        self.commands.append(script)
+        return self.keyboard_shown
+
+    def __getattr__(self, name: str) -> object:
+        return lambda *_args: self.commands.append(name)
+
+
+class TestsPlatformActions:
+
+    def test_android_uses_keycodes_and_hide_keyboard(self) -> None:
+        driver = FakeDriver()
+        action = Action(driver)
+        action.send_enter_key()
+        action.dismiss_keyboard()
+        Device(driver, "cat.naval.florae", "output").refresh_app_instance()
+        assert driver.commands == ["press_keycode", "hide_keyboard", "terminate_app", "activate_app"]
+
+    def test_web_types_into_the_focused_element_and_reloads(self) -> None:
+        driver = FakeDriver()
+        action = Action(driver, PlatformName.WEB)
+        action.send_keycodes("06/01/2024")
+        action.send_enter_key()
+        action.dismiss_keyboard()
+        Device(driver, "cat.naval.florae", "output", PlatformName.WEB).refresh_app_instance()
+        assert driver.active_element.keys == ["06/01/2024", Keys.ENTER]
+        assert "blur()" in driver.commands[0]
+        assert driver.commands[1:] == ["refresh"]
+
+    def test_ios_hides_the_keyboard_only_when_shown(self) -> None:
+        driver = FakeDriver(keyboard_shown=False)
+        Action(driver, PlatformName.IOS).dismiss_keyboard()
+        assert driver.commands == ["mobile: isKeyboardShown"]
+        with pytest.raises(NotImplementedError):
+            Action(driver, PlatformName.IOS).send_back_key()
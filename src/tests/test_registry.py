@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from src.pages.registry import PageRegistry
+from src.utils.platform import PlatformName
+
+
+class FakePage:
+    """Counts how often a page object is constructed."""
+
+    created = 0
+
+    def __init__(
+        self,
+        driver: object,
+        action: object = None,
+        wait: object = None,
+        swipe: object = None,
+        platform: PlatformName = PlatformName.ANDROID,
+    ) -> None:
+        type(self).created += 1
+        self.driver = driver
+        self.action = action
+        self.wait = wait
+        self.swipe = swipe
+        self.platform = platform
+
+
+class FakeListPage(FakePage):
+    created = 0
+
+
+class FakeDetailPage(FakePage):
+    created = 0
+
+
+class TestsPageRegistry:
+
+    def setup_method(self) -> None:
+        FakeListPage.created = FakeDetailPage.created = 0
+        self.registry = PageRegistry(object(), object(), object(), "swipe", PlatformName.IOS)
+
+    def test_pages_are_created_on_first_access_and_shared(self) -> None:
+        assert not FakeListPage.created
+        page = self.registry.get(FakeListPage)
+        assert self.registry.get(FakeListPage) is page
+        assert FakeListPage.created == 1
+        assert not FakeDetailPage.created
+        assert page.swipe == "swipe"
+        assert page.platform is PlatformName.IOS
+
+    def test_accessing_a_page_makes_it_current(self) -> None:
+        page = self.registry.get(FakeListPage)
+        assert self.registry.current is page
+        detail = self.registry.get(FakeDetailPage)
+        assert self.registry.current is detail
+        assert self.registry.get(FakeListPage) is page
+        assert self.registry.current is page
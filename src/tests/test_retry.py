@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+
+from src.utils.exception import FailedTestError
+from src.utils.retry import APP_RUNNING_IN_FOREGROUND, StepRetrier
+
+
+class FakeDevice:
+    """Reports the app in the foreground and counts relaunches."""
+
+    activity = "cat.naval.florae"
+
+    def __init__(self) -> None:
+        self.driver = self
+        self.refreshes = 0
+
+    def query_app_state(self, _activity: str) -> int:
+        return APP_RUNNING_IN_FOREGROUND
+
+    def refresh_app_instance(self) -> None:
+        self.refreshes += 1
+
+
+class FlakyStep:
+    """Fails with a stale element the given number of times, then passes."""
+
+    def __init__(self, failures: int) -> None:
+        self.failures = failures
+
+    def __call__(self) -> str:
+        if self.failures:
+            self.failures -= 1
+            msg = "element is not attached to the page document"
+            raise StaleElementReferenceException(msg)
+        return "done"
+
+
+class TestsStepRetrier:
+
+    def setup_method(self) -> None:
+        self.retrier = StepRetrier(FakeDevice(), max_attempts=2)
+
+    def test_each_call_gets_its_own_attempts(self) -> None:
+        assert self.retrier.step("Find Plant", FlakyStep(1)) == "done"
+        assert self.retrier.step("Find Plant", FlakyStep(1)) == "done"
+        stats = self.retrier.stats["Find Plant"]
+        assert (stats.calls, stats.attempts, stats.passed) == (2, 4, True)
+        assert stats.failures == {"TransientStepError": 2}
+
+    def test_passed_reflects_the_latest_call(self) -> None:
+        self.retrier.step("Find Plant", FlakyStep(0))
+        with pytest.raises(FailedTestError):
+            self.retrier.step("Find Plant", FlakyStep(2))
+        assert not self.retrier.stats["Find Plant"].passed
+        assert list(self.retrier.retried_steps()) == ["Find Plant"]
+
+    def test_steps_without_retries_are_not_reported(self) -> None:
+        self.retrier.step("Confirm Garden", FlakyStep(0))
+        self.retrier.step("Confirm Garden", FlakyStep(0))
+        assert not self.retrier.retried_steps()
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from src.utils.snapshot import SnapshotStrategy, StateSnapshot
+
+PACKAGE = "cat.naval.florae"
+ADB_PATH = "/opt/android-sdk/platform-tools/adb"
+
+
+class FakeDriver:
+    """Records app lifecycle, shell and file push calls."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple] = []
+        self.capabilities = {"udid": "emulator-5554"}
+
+    def terminate_app(self, package: str) -> None:
+        self.calls.append(("terminate", package))
+
+    def activate_app(self, package: str) -> None:
+        self.calls.append(("activate", package))
+
+    def execute_script(self, script: str, params: dict) -> str:
+        self.calls.append((script, *params["args"]))
+        return "YXJjaGl2ZQ==\n"
+
+    def push_file(self, path: str, data: str) -> None:
+        self.calls.append(("push", path, data))
+
+
+class TestsStateSnapshot:
+
+    def setup_method(self) -> None:
+        StateSnapshot._captured.clear()  # noqa: SLF001
+        self.tmp_dir = Path(tempfile.mkdtemp())
+        self.driver = FakeDriver()
+        self.builds = 0
+
+    def teardown_method(self) -> None:
+        StateSnapshot._captured.clear()  # noqa: SLF001
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def snapshot(self, strategy: SnapshotStrategy = SnapshotStrategy.APP_DATA) -> StateSnapshot:
+        return StateSnapshot(self.driver, PACKAGE, str(self.tmp_dir), strategy)
+
+    def build(self) -> None:
+        self.builds += 1
+
+    def test_builds_on_miss_and_restores_on_hit(self) -> None:
+        assert not self.snapshot().ensure("garden", self.build)
+        assert self.snapshot().has("garden")
+        assert not self.snapshot().has("home")
+        assert self.snapshot().ensure("garden", self.build)
+        assert self.builds == 1
+
+    def test_captures_are_kept_per_strategy(self) -> None:
+        self.snapshot().ensure("garden", self.build)
+        with mock.patch("src.utils.snapshot.subprocess.run"):
+            assert not self.snapshot(SnapshotStrategy.EMULATOR).ensure("garden", self.build)
+        assert self.builds == 2  # noqa: PLR2004
+
+    def test_app_data_restore_pushes_archive(self) -> None:
+        snapshot = self.snapshot()
+        snapshot.capture("garden")
+        assert (self.tmp_dir / f"{PACKAGE}_garden.tar.b64").read_text() == "YXJjaGl2ZQ==\n"
+        self.driver.calls.clear()
+        snapshot.restore("garden")
+        assert self.driver.calls[0] == ("terminate", PACKAGE)
+        assert self.driver.calls[1] == ("push", f"/data/local/tmp/{PACKAGE}_garden.tar", "YXJjaGl2ZQ==")
+        assert self.driver.calls[-1] == ("activate", PACKAGE)
+
+    def test_emulator_restore_loads_avd_snapshot(self) -> None:
+        snapshot = StateSnapshot(self.driver, PACKAGE, str(self.tmp_dir), SnapshotStrategy.EMULATOR, adb_path=ADB_PATH)
+        with mock.patch("src.utils.snapshot.subprocess.run") as run:
+            snapshot.capture("garden")
+            snapshot.restore("garden")
+        commands = [call.args[0] for call in run.call_args_list]
+        assert commands == [
+            [ADB_PATH, "-s", "emulator-5554", "emu", "avd", "snapshot", "save", "garden"],
+            [ADB_PATH, "-s", "emulator-5554", "emu", "avd", "snapshot", "load", "garden"],
+        ]
+        assert not self.driver.calls
+
+    def test_rebuild_builds_every_time_without_device_calls(self) -> None:
+        snapshot = self.snapshot(SnapshotStrategy.REBUILD)
+        assert not snapshot.ensure("garden", self.build)
+        assert not snapshot.ensure("garden", self.build)
+        assert self.builds == 2  # noqa: PLR2004
+        assert not snapshot.has("garden")
+        assert not self.driver.calls
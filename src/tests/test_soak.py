@@ -0,0 +1,55 @@
+import allure
+import pytest
+
+from src.tests.core import CONFIG_PATH, ConfigLoader, TestCore
+from src.utils.exception import AppCrashError, FailedTestError, ResourceDriftError, TransientStepError
+from src.utils.platform import PlatformName
+from src.utils.soak import ResourceSampler, SoakRunner
+
+SOAK_DURATION = ConfigLoader.load_config(CONFIG_PATH).soak.duration
+
+
+@allure.title("Add New Plant Soak Test")
+@allure.tag("Soak Test")
+@pytest.mark.skipif(SOAK_DURATION <= 0, reason="Set [SOAK] duration in config.cfg to run soak tests")
+class TestsSoak(TestCore):
+
+    def open_app(self) -> None:
+        self.retry.step("Open App", self.pages.home.confirm_ready, retry_on=(TransientStepError, AppCrashError))
+
+    def add_plant(self) -> None:
+        # A restore relaunches the app (and reloads the VM with EMULATOR snapshots), which resets the
+        # metrics being watched, so the empty garden is only restored every `restore_every` iterations.
+        restore_every = self.config.soak.restore_every
+        restore = self.iteration == 0 or (restore_every and self.iteration % restore_every == 0)
+        self.iteration += 1
+        if restore and self.use_state("empty_garden", self.open_app):
+            self.sampler.driver = self.driver  # An EMULATOR restore starts a new session.
+            self.open_app()
+        self.pages.home.open_add_plant()
+        self.pages.plant.set_details("Tulips", "Very pretty!", "5th Floor Dungeon")
+        self.pages.plant.set_day_planted("06/01/2024")
+        self.retry.step("Confirm Garden", self.pages.garden.confirm_ready)
+        self.retry.step("Find Plant", self.pages.garden.verify_plant, "Tulips")
+
+    def test_add_new_plant_soak(self) -> None:
+        soak = self.config.soak
+        package = self.config.android.package if self.platform_name is PlatformName.ANDROID else None
+        self.sampler = ResourceSampler(self.driver, package)
+        self.iteration = 0
+        runner = SoakRunner(
+            self.sampler,
+            soak.duration,
+            sample_every=soak.sample_every,
+            baseline_samples=soak.baseline_samples,
+            alpha=soak.ewma_alpha,
+            tolerance=soak.drift_tolerance,
+        )
+        try:
+            report = runner.run(self.add_plant)
+            runner.attach_report(report)
+            runner.assert_stable(report)
+            self.platform.remove_output_folder()
+        except (FailedTestError, ResourceDriftError) as e:
+            pytest.fail(reason=e.message)
+
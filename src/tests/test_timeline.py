@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+from src.utils.timeline import TimelineReport
+
+PIXEL_BUSY_MS = 7000
+PIXEL_IDLE_MS = 2000
+STEP_MS = 1500
+
+
+def result(uuid: str, device: str, start: int, stop: int, **fields: object) -> dict:
+    return {
+        "uuid": uuid,
+        "name": f"test_{uuid}",
+        "status": "passed",
+        "start": start,
+        "stop": stop,
+        "labels": [{"name": "device", "value": device}],
+        **fields,
+    }
+
+
+class TestsTimeline:
+
+    def setup_method(self) -> None:
+        self.tmp_dir = Path(tempfile.mkdtemp())
+        self.results = self.tmp_dir / "allure-results"
+        self.results.mkdir()
+        self.output = self.tmp_dir / "timeline.html"
+
+    def teardown_method(self) -> None:
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def write(self, name: str, data: dict) -> None:
+        (self.results / name).write_text(json.dumps(data))
+
+    def test_lanes_idle_gaps_and_slowest_steps(self) -> None:
+        steps = [
+            {
+                "name": "Open <App>",
+                "status": "passed",
+                "start": 0,
+                "stop": STEP_MS,
+                "steps": [{"name": "Tap", "status": "passed", "start": 0, "stop": 100}],
+                "attachments": [{"source": "shot.png"}],
+            },
+        ]
+        self.write("a-result.json", result("a", "Pixel_7_Pro", 1000, 4000, steps=steps))
+        self.write("b-result.json", result("b", "Pixel_7_Pro", 7000, 10000, status="failed"))
+        self.write("c-result.json", result("c", "iPhone 15", 2000, 3000))
+        self.write("d-container.json", {"children": ["b"], "befores": [{"name": "setup", "start": 6000, "stop": 7000}]})
+        (self.results / "e-result.json").write_text("{truncated")
+
+        report = TimelineReport(self.results)
+        report.write(self.output)
+
+        pixel, iphone = report.lane_stats
+        assert (pixel.name, pixel.results, pixel.busy_ms, pixel.idle_ms) == (
+            "Pixel_7_Pro", 2, PIXEL_BUSY_MS, PIXEL_IDLE_MS,
+        )
+        assert pixel.gaps == [(4000, 6000)]
+        assert (iphone.name, iphone.results, iphone.gaps) == ("iPhone 15", 1, [])
+        assert report.statuses == {"passed": 2, "failed": 1}
+        assert max(report.slowest) == (STEP_MS, "test_a", "Open <App>")
+        page = self.output.read_text()
+        assert "Open &lt;App&gt;" in page
+        assert "Open &lt;App&gt; &gt; Tap" in page
+        assert 'data-results="allure-results"' in page
+        assert page.count('class="bar gap"') == 1
+
+    def test_empty_results(self) -> None:
+        TimelineReport(self.results).write(self.output)
+        assert "No results found." in self.output.read_text()
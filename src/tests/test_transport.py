@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import gzip
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from src.utils.exception import ReplayMismatchError
+from src.utils.transport import CASSETTE_VERSION, Cassette, ReplayConnection
+
+WINDOW_WIDTH = 1440
+
+
+def new_session(app: str, udid: str, platform_version: str = "13") -> dict:
+    return {
+        "capabilities": {
+            "alwaysMatch": {
+                "platformName": "Android",
+                "appium:app": app,
+                "appium:udid": udid,
+                "appium:deviceName": udid,
+                "appium:platformVersion": platform_version,
+            },
+            "firstMatch": [{}],
+        },
+    }
+
+
+class TestsTransport:
+
+    def setup_method(self) -> None:
+        self.tmp_dir = Path(tempfile.mkdtemp())
+        self.cassette_path = self.tmp_dir / "TestsBasic.test_add_new_plant.json.gz"
+        cassette = Cassette(self.cassette_path)
+        cassette.append(
+            "newSession",
+            new_session("/home/ci/florae/resources/app/florae.apk", "emulator-5554"),
+            {"value": {"sessionId": "recorded"}},
+        )
+        cassette.append("getWindowSize", {"sessionId": "recorded"}, {"value": {"width": WINDOW_WIDTH, "height": 3120}})
+        cassette.save()
+
+    def teardown_method(self) -> None:
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_replay_on_another_machine_and_device(self) -> None:
+        replay = ReplayConnection("http://127.0.0.1:4723", self.cassette_path)
+        response = replay.execute("newSession", new_session("C:\\work\\resources\\app\\florae.apk", "R58M123"))
+        assert response == {"value": {"sessionId": "recorded"}}
+        assert replay.execute("getWindowSize", {"sessionId": "replayed"})["value"]["width"] == WINDOW_WIDTH
+        replay.close()
+        assert not replay.mismatches
+
+    def test_different_app_does_not_match(self) -> None:
+        replay = ReplayConnection("http://127.0.0.1:4723", self.cassette_path)
+        with pytest.raises(ReplayMismatchError):
+            replay.execute("newSession", new_session("/home/ci/florae/resources/app/florae_3.1.0.apk", "emulator-5554"))
+
+    def test_different_platform_version_does_not_match(self) -> None:
+        replay = ReplayConnection("http://127.0.0.1:4723", self.cassette_path)
+        params = new_session("/home/ci/florae/resources/app/florae.apk", "emulator-5554", platform_version="14")
+        with pytest.raises(ReplayMismatchError):
+            replay.execute("newSession", params)
+
+    def test_cassette_from_another_format_version_is_rejected(self) -> None:
+        with gzip.open(self.cassette_path, "rt", encoding="utf-8") as file:
+            payload = json.load(file)
+        payload["version"] = CASSETTE_VERSION - 1
+        with gzip.open(self.cassette_path, "wt", encoding="utf-8") as file:
+            json.dump(payload, file)
+        with pytest.raises(ReplayMismatchError, match="re-record"):
+            Cassette.load(self.cassette_path)
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import pytest
+
+from src.utils.soak import TrendStats
+
+FLAT_SLOPE_PER_HOUR = 100
+
+
+class TestsTrendStats:
+
+    def test_flat_metric_is_stable(self) -> None:
+        stats = TrendStats("app_pss_kb", baseline_samples=10, alpha=0.1, tolerance=0.2)
+        for i in range(1000):
+            stats.add(i * 60.0, 100_000 + (i % 7) * 500)
+        assert not stats.drifting
+        assert abs(stats.slope) < FLAT_SLOPE_PER_HOUR
+
+    def test_leaking_metric_drifts(self) -> None:
+        stats = TrendStats("app_pss_kb", baseline_samples=10, alpha=0.1, tolerance=0.2)
+        for i in range(1000):
+            stats.add(i * 60.0, 100_000 + i * 100)
+        assert stats.drifting
+        assert stats.slope == pytest.approx(6000)
+        assert stats.baseline_mean == pytest.approx(100_450)
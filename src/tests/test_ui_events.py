@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import socket
+import threading
+import time
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
+
+from src.utils.ui_events import UiEventStream
+from src.utils.wait import Wait
+
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+APPEAR_DELAY = 1.0
+# Between two WebDriverWait polls, so polling sees the element up to half a poll late.
+UNALIGNED_DELAY = 0.75
+LATENCY_SLACK = 0.15
+APP_PID = "4321"
+MAX_QUERIES_WITHOUT_CHANGES = 3
+QUERIES_AROUND_ONE_CHANGE = 2
+
+
+class FakeEventServer:
+    """Local websocket server that pushes text messages to every connected client, like Appium's log broadcast."""
+
+    def __init__(self) -> None:  # noqa: D107
+        self.sock = socket.create_server(("127.0.0.1", 0))
+        self.clients: list[socket.socket] = []
+        self.connected = threading.Event()
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    @property
+    def url(self) -> str:  # noqa: D102
+        return f"ws://127.0.0.1:{self.sock.getsockname()[1]}/ws/session/fake/appium/device/logcat"
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                client, _ = self.sock.accept()
+            except OSError:
+                return
+            request = client.recv(4096).decode()
+            headers = dict(line.split(":", 1) for line in request.split("\r\n")[1:] if ":" in line)
+            key = next(value.strip() for name, value in headers.items() if name.lower() == "sec-websocket-key")
+            accept = base64.b64encode(hashlib.sha1((key + WEBSOCKET_GUID).encode()).digest()).decode()  # noqa: S324
+            client.sendall(
+                (
+                    "HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                    f"Sec-WebSocket-Accept: {accept}\r\n\r\n"
+                ).encode(),
+            )
+            self.clients.append(client)
+            self.connected.set()
+
+    def emit(self, message: str) -> None:  # noqa: D102
+        payload = message.encode()
+        for client in self.clients:
+            client.sendall(bytes([0x81, len(payload)]) + payload)
+
+    def close(self) -> None:  # noqa: D102
+        for client in self.clients:
+            client.close()
+        self.clients.clear()
+        self.sock.close()
+
+
+class FakeElement:
+
+    def is_displayed(self) -> bool:
+        return True
+
+
+class FakeDriver:
+    """Counts hierarchy queries; the element exists once `ready` is set."""
+
+    def __init__(self) -> None:
+        self.ready = False
+        self.queries = 0
+
+    def find_element(self, by: str, value: str) -> FakeElement:
+        self.queries += 1
+        if not self.ready:
+            msg = f"{by}={value}"
+            raise NoSuchElementException(msg)
+        return FakeElement()
+
+
+class FakeSession:
+    """Records the mobile: commands of a session, optionally without log broadcast support."""
+
+    session_id = "fake"
+    capabilities = {"platformName": "Android"}  # noqa: RUF012
+
+    def __init__(self, broadcast: bool = True) -> None:  # noqa: FBT001, FBT002
+        self.broadcast = broadcast
+        self.scripts: list[str] = []
+
+    def execute_script(self, script: str, *_args: object) -> str:
+        self.scripts.append(script)
+        if not self.broadcast:
+            msg = f"Unknown mobile command: {script}"
+            raise WebDriverException(msg)
+        return f"{APP_PID}\n"
+
+
+class TestsUiEvents:
+
+    def setup_method(self) -> None:
+        self.server = FakeEventServer()
+        self.events = UiEventStream(self.server.url, pattern="ViewRootImpl")
+        assert self.events.start()
+        self.server.connected.wait(5)
+        self.driver = FakeDriver()
+
+    def teardown_method(self) -> None:
+        self.server.close()
+        self.events.stop()
+
+    def timed_wait(self, events: UiEventStream | None, delay: float, message: str) -> tuple[float, int]:
+        self.driver = FakeDriver()
+        wait = Wait(self.driver, timeout=5, events=events)
+        self.appear_after(delay, message)
+        start = time.monotonic()
+        wait.for_element_to_be_visible("id", "plant")
+        return time.monotonic() - start, self.driver.queries
+
+    def appear_after(self, delay: float, message: str = "I ViewRootImpl: draw finished") -> None:
+        def appear() -> None:
+            time.sleep(delay)
+            self.driver.ready = True
+            self.server.emit(message)
+
+        threading.Thread(target=appear, daemon=True).start()
+
+    def test_matching_messages_advance_generation(self) -> None:
+        self.server.emit("D Unrelated: noise")
+        assert self.events.wait_for_change(0, 0.3) == 0
+        self.server.emit("I ViewRootImpl: relayout")
+        assert self.events.wait_for_change(0, 2) == 1
+
+    def test_wait_rechecks_only_after_ui_change(self) -> None:
+        wait = Wait(self.driver, timeout=5, events=self.events, fallback_interval=5)
+        self.appear_after(APPEAR_DELAY)
+        start = time.monotonic()
+        wait.for_element_to_be_visible("id", "plant")
+        assert time.monotonic() - start < APPEAR_DELAY + 0.5
+        assert self.driver.queries == QUERIES_AROUND_ONE_CHANGE
+
+    def test_wait_times_out_without_changes(self) -> None:
+        wait = Wait(self.driver, timeout=1, events=self.events, fallback_interval=0.5)
+        with pytest.raises(TimeoutException):
+            wait.for_element_to_be_visible("id", "plant")
+        assert self.driver.queries <= MAX_QUERIES_WITHOUT_CHANGES
+
+    def test_wait_polls_when_stream_closes(self) -> None:
+        wait = Wait(self.driver, timeout=5, events=self.events, fallback_interval=5)
+        self.server.close()
+        self.appear_after(0.5, "D Unrelated: noise")
+        wait.for_element_to_be_visible("id", "plant")
+        assert self.driver.ready
+
+    def test_session_stream_stops_the_log_broadcast(self) -> None:
+        session = FakeSession()
+        appium_url = self.server.url.split("/ws/")[0].replace("ws", "http", 1)
+        stream = UiEventStream.for_session(session, appium_url)
+        assert stream.connected
+        stream.stop()
+        assert session.scripts == ["mobile: startLogsBroadcast", "mobile: stopLogsBroadcast"]
+
+    def test_session_without_broadcast_is_not_stopped(self) -> None:
+        session = FakeSession(broadcast=False)
+        stream = UiEventStream.for_session(session, "http://127.0.0.1:4723")
+        assert not stream.connected
+        stream.stop()
+        assert session.scripts == ["mobile: startLogsBroadcast"]
+
+    def test_events_react_sooner_than_polling_with_no_more_queries(self) -> None:
+        polling_latency, polling_queries = self.timed_wait(None, UNALIGNED_DELAY, "I ViewRootImpl: draw")
+        events_latency, events_queries = self.timed_wait(self.events, UNALIGNED_DELAY, "I ViewRootImpl: draw")
+        assert events_latency < polling_latency - LATENCY_SLACK
+        assert events_queries <= polling_queries
+
+    def test_unreported_change_is_seen_no_later_than_polling(self) -> None:
+        polling_latency, polling_queries = self.timed_wait(None, APPEAR_DELAY, "D Unrelated: noise")
+        events_latency, events_queries = self.timed_wait(self.events, APPEAR_DELAY, "D Unrelated: noise")
+        assert events_latency < polling_latency + LATENCY_SLACK
+        assert events_queries <= polling_queries + 1
+
+    def test_only_the_app_process_counts_and_restarts_are_followed(self) -> None:
+        stream = UiEventStream(self.server.url, package="cat.naval.florae")
+        assert stream.start()
+        try:
+            stream.pid = APP_PID
+            self.server.emit("10-19 12:00:00.000   999   999 I ViewRootImpl: other app")
+            assert stream.wait_for_change(0, 0.3) == 0
+            self.server.emit(f"10-19 12:00:00.100  {APP_PID}  {APP_PID} I ViewRootImpl: draw")
+            assert stream.wait_for_change(0, 2) == 1
+            self.server.emit("10-19 12:00:01.000   600   700 I ActivityManager: Start proc 5555:cat.naval.florae/u0a1")
+            self.server.emit("10-19 12:00:01.100  5555  5555 I flutter: frame")
+            assert stream.wait_for_change(1, 2) > 1
+            assert stream.pid == "5555"
+        finally:
+            stream.stop()
+
+    def test_session_stream_reads_the_app_pid(self) -> None:
+        appium_url = self.server.url.split("/ws/")[0].replace("ws", "http", 1)
+        stream = UiEventStream.for_session(FakeSession(), appium_url, package="cat.naval.florae")
+        assert stream.pid == APP_PID
+        stream.stop()
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import io
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from src.utils.exception import FailedTestError
+from src.utils.visual import VisualCheck
+
+BADGE = (40, 40, 10, 10)
+
+
+def encode(pixels: np.ndarray, compress_level: int = 6) -> bytes:
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, format="PNG", compress_level=compress_level)
+    return buffer.getvalue()
+
+
+class TestsVisualCheck:
+
+    def setup_method(self) -> None:
+        self.tmp_dir = Path(tempfile.mkdtemp())
+        self.visual = VisualCheck(str(self.tmp_dir))
+        self.screen = np.zeros((100, 100, 3), dtype=np.uint8)
+        self.screen[:, 50:] = 200
+        self.changed = self.screen.copy()
+        x, y, width, height = BADGE
+        self.changed[y : y + height, x : x + width] += 40
+        self.attach = mock.patch("src.utils.visual.allure.attach").start()
+
+    def teardown_method(self) -> None:
+        mock.patch.stopall()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_missing_baseline_is_stored(self) -> None:
+        result = self.visual.compare("home", encode(self.screen))
+        assert result.matched
+        assert result.new_baseline
+        assert (self.tmp_dir / "home.png").read_bytes() == encode(self.screen)
+
+    def test_identical_png_skips_the_pixel_comparison(self) -> None:
+        self.visual.compare("home", encode(self.screen))
+        assert self.visual.compare("home", encode(self.screen)).skipped
+        result = self.visual.compare("home", encode(self.screen, compress_level=1))
+        assert result.matched is True
+        assert not result.skipped
+        assert result.diff_ratio == 0
+
+    def test_small_change_is_a_mismatch(self) -> None:
+        self.visual.compare("home", encode(self.screen))
+        result = self.visual.compare("home", encode(self.changed))
+        assert result.matched is False
+        assert not result.skipped
+        assert result.diff_ratio == pytest.approx(0.01)
+        self.attach.assert_called_once()
+        with pytest.raises(FailedTestError):
+            self.visual.assert_matches("home", encode(self.changed))
+
+    def test_masked_region_is_ignored(self) -> None:
+        self.visual.compare("home", encode(self.screen))
+        result = self.visual.assert_matches("home", encode(self.changed), masks=[BADGE])
+        assert result.matched is True
+        assert result.diff_ratio == 0
+        self.attach.assert_not_called()
@@ -9,24 +9,34 @@ from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.actions import interaction
 from selenium.webdriver.common.actions.action_builder import ActionBuilder
 from selenium.webdriver.common.actions.pointer_input import PointerInput
+from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 
 from src.utils.helpers import Helpers
+from src.utils.platform import PlatformName
 
 
 class Action:
-    """Handles various actions on mobile elements."""
+    """
+    Handles various actions on mobile elements.
 
-    def __init__(self, driver: WebDriver) -> None:
+    Key presses and the keyboard go through Android keycodes and `hide_keyboard` on Android, and
+    through the focused element and script equivalents on iOS and web, so pages call the same
+    methods on every platform.
+    """
+
+    def __init__(self, driver: WebDriver, platform: PlatformName = PlatformName.ANDROID) -> None:
         """
         Initialize the Action instance.
 
         Args:
             driver: The Appium driver instance.
+            platform: The platform the session targets.
 
         """
         self.driver = driver
+        self.platform = platform
         self.helpers = Helpers()
         self.logger = logging.getLogger(self.__class__.__name__)
 
@@ -113,6 +123,8 @@ class Action:
         """
         Send a keycode to the device.
 
+        Android only; other platforms have no keycodes.
+
         Args:
             keycode (int): The keycode to send.
 
@@ -124,29 +136,52 @@ class Action:
         """
         Send keycodes to the device.
 
-        These are converted/mapped from their regular values to the keycode value.
+        On Android these are converted/mapped from their regular values to the keycode value. Other
+        platforms type the values into the focused element.
 
         Args:
             value (str): The values to send.
 
         """
+        if self.platform is not PlatformName.ANDROID:
+            self.driver.switch_to.active_element.send_keys(value)
+            self.logger.info("Successfully typed into the focused element: %s", value)
+            return
         codes = self.helpers.convert_string_to_nativekey(value)
         for code in codes:
             self.send_keycode(code)
 
     def send_enter_key(self) -> None:
-        """Send the enter key (keycode 66)."""
+        """Send the enter key (keycode 66 on Android)."""
+        if self.platform is not PlatformName.ANDROID:
+            self.driver.switch_to.active_element.send_keys(Keys.ENTER)
+            self.logger.info("ENTER sent to the focused element")
+            return
         self.send_keycode(66)
         self.logger.info("Keycode 66 (ENTER) sent")
 
     def send_back_key(self) -> None:
-        """Send the back key (keycode 4)."""
+        """Send the back key (keycode 4 on Android, browser back on web)."""
+        if self.platform is PlatformName.WEB:
+            self.driver.back()
+            self.logger.info("Navigated back")
+            return
+        if self.platform is PlatformName.IOS:
+            msg = "iOS has no back key; tap the page's back button instead"
+            raise NotImplementedError(msg)
         self.send_keycode(4)
         self.logger.info("Keycode 4 (BACK) sent")
 
     def dismiss_keyboard(self) -> None:
         """Dismiss the keyboard if it's visible."""
-        self.driver.hide_keyboard()
+        if self.platform is PlatformName.WEB:
+            # Browsers have no on-screen keyboard; blurring the field is what closes it on mobile web.
+            self.driver.execute_script("if (document.activeElement) { document.activeElement.blur(); }")
+        elif self.platform is PlatformName.IOS:
+            if self.driver.execute_script("mobile: isKeyboardShown"):
+                self.driver.execute_script("mobile: hideKeyboard")
+        else:
+            self.driver.hide_keyboard()
         self.logger.info("Keyboard dismissed")
 
     def get_element_text(
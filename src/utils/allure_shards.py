@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import shutil
+import uuid
+from importlib.metadata import version
+from pathlib import Path
+
+import allure_pytest.plugin
+import pytest
+from allure_commons import hookimpl
+from allure_commons.logger import INDENT, AllureFileLogger
+from attr import asdict
+
+DEFAULT_SHARD_DIR = "reporting/allure-shards"
+DEFAULT_RESULTS_DIR = "reporting/allure-results"
+LEDGER_NAME = "completed.txt"
+RESUME_NAME = "resume.txt"
+TEMP_SUFFIX = ".tmp"
+# allure_pytest creates its file logger through the module-level AllureFileLogger name; checked before swapping it.
+SUPPORTED_ALLURE_PYTEST = "2.13"
+
+logger = logging.getLogger(__name__)
+
+
+def worker_id() -> str:
+    """
+    Get the name of this process's shard.
+
+    Returns:
+        str: The xdist worker id, or `main` outside xdist workers.
+
+    """
+    return os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """
+    Write a file so readers never see it partially written.
+
+    Args:
+        path (Path): Destination file.
+        data (bytes): File content.
+
+    """
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}{TEMP_SUFFIX}")
+    temp_path.write_bytes(data)
+    temp_path.replace(path)
+
+
+class AtomicFileLogger(AllureFileLogger):
+    """AllureFileLogger that writes results, containers and attachments through a temporary file and a rename."""
+
+    def __init__(self, report_dir: str | Path, clean: bool = False) -> None:  # noqa: FBT001, FBT002, D107
+        super().__init__(report_dir, clean)
+        self.report_dir = Path(report_dir).absolute()
+
+    def write_item(self, item: object) -> None:
+        """
+        Write a result or container as JSON, the way AllureFileLogger does.
+
+        Args:
+            item (object): An allure_commons.model2 result or container.
+
+        """
+        indent = INDENT if os.environ.get("ALLURE_INDENT_OUTPUT") else None
+        data = asdict(item, filter=lambda _, v: v or v is False)
+        file_name = item.file_pattern.format(prefix=uuid.uuid4())
+        write_atomic(self.report_dir / file_name, json.dumps(data, indent=indent, ensure_ascii=False).encode())
+
+    @hookimpl
+    def report_result(self, result: object) -> None:  # noqa: D102
+        self.write_item(result)
+
+    @hookimpl
+    def report_container(self, container: object) -> None:  # noqa: D102
+        self.write_item(container)
+
+    @hookimpl
+    def report_attached_file(self, source: str, file_name: str) -> None:  # noqa: D102
+        temp_path = self.report_dir / f".{file_name}.{os.getpid()}{TEMP_SUFFIX}"
+        shutil.copy2(source, temp_path)
+        temp_path.replace(self.report_dir / file_name)
+
+    @hookimpl
+    def report_attached_data(self, body: str | bytes, file_name: str) -> None:  # noqa: D102
+        write_atomic(self.report_dir / file_name, body.encode() if isinstance(body, str) else body)
+
+
+def supports_atomic_logger() -> bool:
+    """
+    Check that the installed allure-pytest creates its file logger the way AtomicFileLogger expects.
+
+    Returns:
+        bool: True for the pinned allure-pytest minor version.
+
+    """
+    installed = version("allure-pytest")
+    supported = installed.split(".")[:2] == SUPPORTED_ALLURE_PYTEST.split(".")
+    if supported and hasattr(allure_pytest.plugin, "AllureFileLogger"):
+        return True
+    logger.warning(
+        "allure-pytest %s is not %s.x; shards are written without atomic renames", installed, SUPPORTED_ALLURE_PYTEST,
+    )
+    return False
+
+
+def completed_tests(shard_root: Path) -> set[str]:
+    """
+    Read the node ids of tests whose results were written to any shard.
+
+    Args:
+        shard_root (Path): Directory holding one shard per worker.
+
+    Returns:
+        set[str]: Completed node ids.
+
+    """
+    completed: set[str] = set()
+    for ledger in shard_root.glob(f"*/{LEDGER_NAME}"):
+        completed.update(line for line in ledger.read_text().splitlines() if line)
+    return completed
+
+
+def _stage_shards(shard_root: Path, staging: Path) -> None:
+    """Hard-link, or copy, the finished files of every shard into `staging`."""
+    shards = sorted(path for path in shard_root.iterdir() if path.is_dir()) if shard_root.is_dir() else []
+    for shard in shards:
+        with os.scandir(shard) as entries:
+            for entry in entries:
+                if not entry.is_file() or entry.name.startswith(".") or entry.name in (LEDGER_NAME, RESUME_NAME):
+                    continue
+                destination = staging / entry.name
+                if destination.exists():
+                    continue
+                try:
+                    os.link(entry.path, destination)
+                except OSError:
+                    shutil.copy2(entry.path, destination)
+
+
+def merge_shards(shard_root: Path, results_dir: Path, clean: bool = True) -> int:  # noqa: FBT001, FBT002
+    """
+    Merge every shard into one allure-results directory.
+
+    Files are streamed one at a time into a staging directory next to `results_dir`, hard-linked
+    where possible, then each one is moved into `results_dir` with an atomic replace, so
+    `results_dir` is never missing and never holds a partial file. With `clean`, results that were
+    not part of the merge are removed afterwards. Leftover temporary files of interrupted writes
+    are skipped.
+
+    Args:
+        shard_root (Path): Directory holding one shard per worker.
+        results_dir (Path): The merged allure-results directory.
+        clean (bool): Drop results already in `results_dir` instead of keeping them.
+
+    Returns:
+        int: Number of files in the merged directory.
+
+    """
+    staging = results_dir.with_name(f".{results_dir.name}.merging")
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir(parents=True)
+    _stage_shards(shard_root, staging)
+    if not results_dir.exists():
+        staging.rename(results_dir)
+    else:
+        merged = set()
+        for path in staging.iterdir():
+            path.replace(results_dir / path.name)
+            merged.add(path.name)
+        if clean:
+            for path in results_dir.iterdir():
+                if path.is_file() and path.name not in merged:
+                    path.unlink()
+        staging.rmdir()
+    return sum(1 for path in results_dir.iterdir() if path.is_file())
+
+
+class AllureShardPlugin:
+    """
+    Writes allure results to one shard per worker and merges the shards at the end of the run.
+
+    Enabled with `--allure-shards`. Each process writes to `<shard dir>/<worker id>` through an
+    AtomicFileLogger, so workers never share a directory and a crash leaves no partial files. Node
+    ids of finished tests are appended to a ledger in the shard. The controlling process merges the
+    shards into `--alluredir` when the session finishes; `--clean-alluredir` then applies to the
+    merged directory rather than to each worker's output. With `--allure-resume`, shards from the
+    previous run are kept and tests listed in their ledgers are deselected.
+    """
+
+    def __init__(self, shard_root: Path, results_dir: Path, clean: bool, resume: bool) -> None:  # noqa: FBT001, D107
+        self.shard_root = shard_root
+        self.results_dir = results_dir
+        self.clean = clean
+        self.resume = resume
+        self.is_worker = "PYTEST_XDIST_WORKER" in os.environ
+        self.shard_dir = shard_root / worker_id()
+        self.skip: set[str] = set()
+        self.file_logger: type[AllureFileLogger] | None = None
+
+    def prepare(self) -> None:
+        """Reset the shards, or snapshot the completed tests when resuming, before any worker starts."""
+        resume_path = self.shard_root / RESUME_NAME
+        if not self.is_worker:
+            if self.resume:
+                self.shard_root.mkdir(parents=True, exist_ok=True)
+                write_atomic(resume_path, "\n".join(sorted(completed_tests(self.shard_root))).encode())
+            else:
+                shutil.rmtree(self.shard_root, ignore_errors=True)
+        if self.resume and resume_path.exists():
+            self.skip = set(resume_path.read_text().splitlines())
+        self.shard_dir.mkdir(parents=True, exist_ok=True)
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_sessionstart(self) -> None:  # noqa: D102
+        if self.file_logger is not None:
+            allure_pytest.plugin.AllureFileLogger = self.file_logger
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config: pytest.Config, items: list[pytest.Item]) -> None:  # noqa: D102
+        if not self.skip:
+            return
+        selected, deselected = [], []
+        for item in items:
+            (deselected if item.nodeid in self.skip else selected).append(item)
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+        logger.info("Resuming allure run: %d already have results, %d to run", len(deselected), len(selected))
+
+    @pytest.hookimpl(hookwrapper=True, tryfirst=True)
+    def pytest_runtest_protocol(self, item: pytest.Item, nextitem: pytest.Item | None):  # noqa: ANN201, ARG002, D102
+        yield
+        # Outermost wrapper: allure has written the result by now.
+        with (self.shard_dir / LEDGER_NAME).open("a") as ledger:
+            ledger.write(f"{item.nodeid}\n")
+
+    def pytest_sessionfinish(self) -> None:  # noqa: D102
+        if self.is_worker:
+            return
+        count = merge_shards(self.shard_root, self.results_dir, self.clean)
+        logger.info("Merged %d allure files from %s into %s", count, self.shard_root, self.results_dir)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:  # noqa: D103
+    group = parser.getgroup("allure-shards", "sharded allure results")
+    group.addoption(
+        "--allure-shards",
+        action="store_true",
+        help="Write allure results to one shard per worker and merge them into --alluredir at the end.",
+    )
+    group.addoption(
+        "--allure-shard-dir",
+        default=DEFAULT_SHARD_DIR,
+        help=f"Directory holding the per-worker shards (default: {DEFAULT_SHARD_DIR}).",
+    )
+    group.addoption(
+        "--allure-resume",
+        action="store_true",
+        help="Keep the shards of an interrupted run and skip tests that already have results.",
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config: pytest.Config) -> None:  # noqa: D103
+    report_dir = getattr(config.option, "allure_report_dir", None)
+    if not (config.getoption("allure_shards") and report_dir) or config.option.collectonly:
+        return
+    shard_root = Path(config.getoption("allure_shard_dir"))
+    if not shard_root.is_absolute():
+        shard_root = config.rootpath / shard_root
+    plugin = AllureShardPlugin(
+        shard_root,
+        Path(report_dir).absolute(),
+        clean=config.option.clean_alluredir,
+        resume=config.getoption("allure_resume"),
+    )
+    plugin.prepare()
+    # Runs before allure_pytest's pytest_configure, which then logs into this process's shard.
+    config.option.allure_report_dir = str(plugin.shard_dir)
+    config.option.clean_alluredir = False
+    if supports_atomic_logger():
+        # Only allure_pytest's pytest_configure sees the swap; the plugin restores it at session start.
+        plugin.file_logger = allure_pytest.plugin.AllureFileLogger
+        allure_pytest.plugin.AllureFileLogger = AtomicFileLogger
+    config.pluginmanager.register(plugin, "allure-shards")
+
+
+def main() -> None:
+    """Merge the shards of an interrupted run into an allure-results directory."""
+    parser = argparse.ArgumentParser(description="Merge per-worker allure result shards.")
+    parser.add_argument("shard_dir", type=Path, nargs="?", default=Path(DEFAULT_SHARD_DIR))
+    parser.add_argument("-o", "--output", type=Path, default=Path(DEFAULT_RESULTS_DIR))
+    parser.add_argument("--keep", action="store_true", help="Keep results already in the output directory.")
+    args = parser.parse_args()
+    count = merge_shards(args.shard_dir, args.output, clean=not args.keep)
+    print(f"Merged {count} files into {args.output}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
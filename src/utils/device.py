@@ -8,12 +8,15 @@ from pathlib import Path
 from selenium.webdriver.remote.webdriver import WebDriver
 
 from src.utils.exception import AppRefreshFailureError, ContextSwitchingFailureError, ScreenshotFailureError
+from src.utils.platform import PlatformName
 
 
 class Device:
     """Represents the connected device used during testing, providing associated methods for interaction."""
 
-    def __init__(self, driver: WebDriver, activity: str, output_dir: str) -> None:
+    def __init__(
+        self, driver: WebDriver, activity: str, output_dir: str, platform: PlatformName = PlatformName.ANDROID,
+    ) -> None:
         """
         Initialize the Device instance.
 
@@ -21,11 +24,13 @@ class Device:
             driver (WebDriver): The driver instance for device control.
             activity (str): The activity name of the app being tested.
             output_dir (str): The directory for storing runtime files.
+            platform (PlatformName): The platform the session targets.
 
         """
         self.driver = driver
         self.activity = activity
         self.output_dir = output_dir
+        self.platform = platform
         self.logger = logging.getLogger(self.__class__.__name__)
 
     def screenshot(self) -> str:
@@ -49,8 +54,12 @@ class Device:
             raise ScreenshotFailureError(error_message, e) from e
 
     def refresh_app_instance(self) -> None:
-        """Refresh the app by terminating and reactivating it."""
+        """Refresh the app by terminating and reactivating it, or by reloading the page on web."""
         try:
+            if self.platform is PlatformName.WEB:
+                self.driver.refresh()
+                self.logger.info("Page %s reloaded", self.driver.current_url)
+                return
             self.driver.terminate_app(self.activity)
             time.sleep(1.5)
             self.driver.activate_app(self.activity)
@@ -34,3 +34,57 @@ class ScreenshotFailureError(Exception):
         self.message = message
         self.original_error = original_error
         super().__init__(self.message)
+
+
+class SnapshotFailureError(Exception):
+    """Custom exception raised when a device state snapshot cannot be captured or restored."""
+
+    def __init__(self, message: str, original_error: Exception | None = None) -> None:  # noqa: D107
+        self.message = message
+        self.original_error = original_error
+        super().__init__(self.message)
+
+
+class DeviceUnhealthyError(Exception):
+    """Custom exception raised when a device or Appium server fails its health probe."""
+
+    def __init__(self, message: str, original_error: Exception | None = None) -> None:  # noqa: D107
+        self.message = message
+        self.original_error = original_error
+        super().__init__(self.message)
+
+
+class ReplayMismatchError(Exception):
+    """Custom exception raised when a replayed command diverges from the recorded cassette."""
+
+    def __init__(self, message: str, original_error: Exception | None = None) -> None:  # noqa: D107
+        self.message = message
+        self.original_error = original_error
+        super().__init__(self.message)
+
+
+class TransientStepError(Exception):
+    """Custom exception raised for step failures that may pass on retry, such as stale elements or wait timeouts."""
+
+    def __init__(self, message: str, original_error: Exception | None = None) -> None:  # noqa: D107
+        self.message = message
+        self.original_error = original_error
+        super().__init__(self.message)
+
+
+class AppCrashError(Exception):
+    """Custom exception raised when the app or UiAutomator2 server crashed and the app must be relaunched."""
+
+    def __init__(self, message: str, original_error: Exception | None = None) -> None:  # noqa: D107
+        self.message = message
+        self.original_error = original_error
+        super().__init__(self.message)
+
+
+class ResourceDriftError(Exception):
+    """Custom exception raised when a soak run shows app, session or runner resources degrading over time."""
+
+    def __init__(self, message: str, original_error: Exception | None = None) -> None:  # noqa: D107
+        self.message = message
+        self.original_error = original_error
+        super().__init__(self.message)
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+from src.utils.exception import DeviceUnhealthyError
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    """
+    A device and the Appium server driving it.
+
+    Attributes:
+        name (str): Unique name used for scheduling.
+        appium_url (str): Base URL of the Appium server.
+        udid (str | None): ADB serial of the device, if known before the session starts.
+
+    """
+
+    name: str
+    appium_url: str
+    udid: str | None = None
+
+
+@dataclass
+class HealthStatus:
+    """
+    Result of probing an endpoint.
+
+    Attributes:
+        healthy (bool): Whether every probe succeeded.
+        latency (float): Total probe time, in seconds.
+        reason (str): Failure description, empty when healthy.
+
+    """
+
+    healthy: bool
+    latency: float
+    reason: str = ""
+
+
+class HealthMonitor:
+    """
+    Probes devices and Appium servers with cheap status calls.
+
+    Appium servers are probed with `GET /status` and devices with `adb get-state`, each bounded by
+    `timeout`, so a hung endpoint fails in seconds instead of waiting out `newCommandTimeout`.
+    Endpoints failing `failure_threshold` consecutive probes are quarantined.
+    """
+
+    def __init__(
+        self,
+        endpoints: list[Endpoint],
+        timeout: float = 5.0,
+        interval: float = 30.0,
+        failure_threshold: int = 1,
+        adb_path: str = "adb",
+    ) -> None:
+        """
+        Initialize the HealthMonitor instance.
+
+        Args:
+            endpoints (list[Endpoint]): The endpoints to monitor.
+            timeout (float): Maximum time for each probe, in seconds.
+            interval (float): Time between periodic probe rounds, in seconds.
+            failure_threshold (int): Consecutive failures before an endpoint is quarantined.
+            adb_path (str): Path of the adb executable.
+
+        """
+        self.endpoints = endpoints
+        self.timeout = timeout
+        self.interval = interval
+        self.failure_threshold = failure_threshold
+        self.adb_path = adb_path
+        self.quarantined: set[str] = set()
+        self.statuses: dict[str, HealthStatus] = {}
+        self._failures: dict[str, int] = {endpoint.name: 0 for endpoint in endpoints}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def probe_appium(self, appium_url: str) -> None:
+        """
+        Check that an Appium server answers `/status` as ready.
+
+        Args:
+            appium_url (str): Base URL of the Appium server.
+
+        Raises:
+            DeviceUnhealthyError: If the server does not answer, or answers as not ready.
+
+        """
+        url = urlsplit(appium_url)
+        path = f"{url.path.rstrip('/')}/status"
+        reader, writer = await asyncio.open_connection(url.hostname, url.port or 80)
+        try:
+            request = f"GET {path} HTTP/1.1\r\nHost: {url.netloc}\r\nConnection: close\r\n\r\n"
+            writer.write(request.encode())
+            await writer.drain()
+            response = await reader.read()
+        finally:
+            writer.close()
+        head, _, body = response.partition(b"\r\n\r\n")
+        status_line = head.split(b"\r\n", 1)[0].decode(errors="replace")
+        if " 200 " not in f"{status_line} ":
+            msg = f"Appium /status returned: {status_line or 'no response'}"
+            raise DeviceUnhealthyError(msg)
+        value = json.loads(body or b"{}").get("value", {})
+        if not value.get("ready", True):
+            msg = f"Appium not ready: {value.get('message', '')}"
+            raise DeviceUnhealthyError(msg)
+
+    async def probe_device(self, udid: str) -> None:
+        """
+        Check that adb reports the device as online.
+
+        Args:
+            udid (str): ADB serial of the device.
+
+        Raises:
+            DeviceUnhealthyError: If the device is offline or missing.
+
+        """
+        process = await asyncio.create_subprocess_exec(
+            self.adb_path, "-s", udid, "get-state",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await process.communicate()
+        except asyncio.CancelledError:
+            process.kill()
+            raise
+        state = stdout.decode().strip()
+        if state != "device":
+            msg = f"Device {udid} state: {state or stderr.decode().strip()}"
+            raise DeviceUnhealthyError(msg)
+
+    async def probe(self, endpoint: Endpoint) -> HealthStatus:
+        """
+        Probe an endpoint and update its quarantine state.
+
+        Args:
+            endpoint (Endpoint): The endpoint to probe.
+
+        Returns:
+            HealthStatus: The probe result.
+
+        """
+        start = time.monotonic()
+        probes = [self.probe_appium(endpoint.appium_url)]
+        if endpoint.udid:
+            probes.append(self.probe_device(endpoint.udid))
+        try:
+            await asyncio.wait_for(asyncio.gather(*probes), timeout=self.timeout)
+            status = HealthStatus(healthy=True, latency=time.monotonic() - start)
+        except asyncio.TimeoutError:
+            reason = f"No response within {self.timeout}s"
+            status = HealthStatus(healthy=False, latency=time.monotonic() - start, reason=reason)
+        except (OSError, ValueError, DeviceUnhealthyError) as e:
+            status = HealthStatus(healthy=False, latency=time.monotonic() - start, reason=str(e))
+        self._record(endpoint, status)
+        return status
+
+    def _record(self, endpoint: Endpoint, status: HealthStatus) -> None:
+        self.statuses[endpoint.name] = status
+        if status.healthy:
+            self._failures[endpoint.name] = 0
+            if endpoint.name in self.quarantined:
+                self.quarantined.discard(endpoint.name)
+                self.logger.info("Endpoint %s recovered", endpoint.name)
+            return
+        self._failures[endpoint.name] += 1
+        self.logger.warning("Endpoint %s unhealthy: %s", endpoint.name, status.reason)
+        if self._failures[endpoint.name] >= self.failure_threshold and endpoint.name not in self.quarantined:
+            self.quarantined.add(endpoint.name)
+            self.logger.error("Endpoint %s quarantined", endpoint.name)
+
+    async def probe_all(self) -> dict[str, HealthStatus]:
+        """
+        Probe every endpoint concurrently.
+
+        Returns:
+            dict[str, HealthStatus]: Probe results by endpoint name.
+
+        """
+        results = await asyncio.gather(*(self.probe(endpoint) for endpoint in self.endpoints))
+        return {endpoint.name: status for endpoint, status in zip(self.endpoints, results)}
+
+    def check(self) -> dict[str, HealthStatus]:
+        """
+        Probe every endpoint once, blocking until done.
+
+        Returns:
+            dict[str, HealthStatus]: Probe results by endpoint name.
+
+        """
+        return asyncio.run(self.probe_all())
+
+    def update(self, endpoint: Endpoint) -> None:
+        """
+        Replace the monitored endpoint with the same name, e.g. once its device serial is known.
+
+        Args:
+            endpoint (Endpoint): The new endpoint details.
+
+        """
+        self.endpoints = [endpoint if current.name == endpoint.name else current for current in self.endpoints]
+
+    def healthy(self) -> list[Endpoint]:
+        """
+        Get the endpoints that are not quarantined.
+
+        Returns:
+            list[Endpoint]: Endpoints available for scheduling.
+
+        """
+        return [endpoint for endpoint in self.endpoints if endpoint.name not in self.quarantined]
+
+    async def _run(self) -> None:
+        while not self._stop.is_set():
+            await self.probe_all()
+            await asyncio.to_thread(self._stop.wait, self.interval)
+
+    def start(self) -> None:
+        """Start probing every `interval` seconds in a background thread."""
+        self._stop.clear()
+        self._thread = threading.Thread(target=asyncio.run, args=(self._run(),), name="health-monitor", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background probing."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.timeout + 1)
+            self._thread = None
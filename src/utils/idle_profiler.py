@@ -0,0 +1,366 @@
+from __future__ import annotations
+
+import json
+import logging
+import statistics
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+SRC_DIR = ROOT_DIR / "src"
+UTILS_DIR = SRC_DIR / "utils"
+DEFAULT_REPORT_PATH = "reporting/idle-profile.json"
+TOP_WAITS = 10
+
+logger = logging.getLogger(__name__)
+
+
+class TimeCategory(Enum):
+    """Where a test's wall time went."""
+
+    DEVICE = "device"
+    NETWORK = "network"
+    SLEEP = "sleep"
+    POLLING = "polling"
+    OTHER = "other"
+
+
+IDLE_CATEGORIES = (TimeCategory.SLEEP, TimeCategory.POLLING)
+
+
+@dataclass
+class TimeProfile:
+    """
+    Wall time of one test split by category.
+
+    Attributes:
+        nodeid (str): The pytest node id.
+        wall (float): Total time of setup, call and teardown, in seconds.
+        totals (dict[TimeCategory, float]): Time by category, in seconds.
+        sites (dict[tuple[TimeCategory, str], list[float]]): Total time and count of idle time by call site.
+
+    """
+
+    nodeid: str
+    wall: float = 0.0
+    totals: dict[TimeCategory, float] = field(default_factory=lambda: defaultdict(float))
+    sites: dict[tuple[TimeCategory, str], list[float]] = field(default_factory=lambda: defaultdict(lambda: [0.0, 0]))
+
+    @property
+    def idle(self) -> float:  # noqa: D102
+        return sum(self.totals[category] for category in IDLE_CATEGORIES)
+
+    @property
+    def idle_ratio(self) -> float:  # noqa: D102
+        return self.idle / self.wall if self.wall else 0.0
+
+    def as_dict(self) -> dict[str, Any]:  # noqa: D102
+        return {
+            "nodeid": self.nodeid,
+            "wall": round(self.wall, 3),
+            "idle_ratio": round(self.idle_ratio, 3),
+            "totals": {category.value: round(self.totals[category], 3) for category in TimeCategory},
+        }
+
+    def to_record(self) -> dict[str, Any]:
+        """
+        Convert the profile to plain values that pytest-xdist can send from a worker.
+
+        Returns:
+            dict[str, Any]: The unrounded profile.
+
+        """
+        return {
+            "nodeid": self.nodeid,
+            "wall": self.wall,
+            "totals": {category.value: seconds for category, seconds in self.totals.items()},
+            "sites": [
+                [category.value, site, seconds, count] for (category, site), (seconds, count) in self.sites.items()
+            ],
+        }
+
+    @classmethod
+    def from_record(cls, record: dict[str, Any]) -> TimeProfile:
+        """
+        Rebuild a profile sent by `to_record`.
+
+        Args:
+            record (dict[str, Any]): The plain profile.
+
+        Returns:
+            TimeProfile: The profile.
+
+        """
+        profile = cls(record["nodeid"], record["wall"])
+        for category, seconds in record["totals"].items():
+            profile.totals[TimeCategory(category)] = seconds
+        for category, site, seconds, count in record["sites"]:
+            profile.sites[(TimeCategory(category), site)] = [seconds, count]
+        return profile
+
+
+def _call_site() -> str:
+    """Describe the innermost page-object or test line on the stack, and the helper it went through."""
+    frame = sys._getframe(2)  # noqa: SLF001
+    helper = None
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(str(SRC_DIR)) and filename != __file__:
+            site = f"{Path(filename).relative_to(ROOT_DIR).as_posix()}:{frame.f_lineno} {frame.f_code.co_name}"
+            if not filename.startswith(str(UTILS_DIR)):
+                return f"{site} via {helper}" if helper else site
+            helper = helper or site
+        frame = frame.f_back
+    return helper or "<unknown>"
+
+
+def _pause_seconds(params: dict[str, Any] | None) -> float:
+    sources = (params or {}).get("actions", [])
+    durations = (
+        sum(action.get("duration", 0) for action in source.get("actions", []) if action.get("type") == "pause")
+        for source in sources
+    )
+    return max(durations, default=0) / 1000
+
+
+class IdleProfiler:
+    """
+    Splits each test's wall time into device work, network, explicit sleeps and polling waits.
+
+    Enabled with `--idle-profile`. Driver commands are timed at `RemoteConnection.execute`; a
+    per-command network cost is estimated from the median round trip of Appium's `/status` and the
+    rest is device work, except W3C `pause` actions (such as the ones in `Action.send_keys` and
+    `Action.click_element_centre`), which count as sleeps. `time.sleep` calls count as sleeps and
+    everything inside `Wait._wait_for_condition` counts as polling. Idle time is attributed to the
+    calling page-object or test line so the costliest avoidable waits can be ranked. Under
+    pytest-xdist, workers send their profiles to the controller, which writes one merged report.
+    """
+
+    def __init__(self, report_path: Path) -> None:  # noqa: D107
+        self.report_path = report_path
+        self.profiles: list[TimeProfile] = []
+        self.current: TimeProfile | None = None
+        self.network_baseline: float | None = None
+        self._thread: threading.Thread | None = None
+        self._depth = 0
+        self._originals: list[tuple[Any, str, Any]] = []
+
+    def _charge(self, category: TimeCategory, seconds: float, site: str | None = None) -> None:
+        self.current.totals[category] += seconds
+        if site is not None:
+            entry = self.current.sites[(category, site)]
+            entry[0] += seconds
+            entry[1] += 1
+
+    def _tracking(self) -> bool:
+        return self.current is not None and self._depth == 0 and threading.current_thread() is self._thread
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+
+    def _measure_network(self, connection: Any) -> float:  # noqa: ANN401
+        samples = []
+        for _ in range(3):
+            start = time.perf_counter()
+            try:
+                with urllib.request.urlopen(f"{connection._url}/status", timeout=5):  # noqa: S310, SLF001
+                    pass
+            except (urllib.error.URLError, OSError, AttributeError, ValueError):
+                return 0.0
+            samples.append(time.perf_counter() - start)
+        return statistics.median(samples)
+
+    def _patch(self, owner: Any, name: str, replacement: Any) -> None:  # noqa: ANN401
+        self._originals.append((owner, name, getattr(owner, name)))
+        setattr(owner, name, replacement)
+
+    def install(self) -> None:
+        """Wrap the driver executor, `time.sleep` and `Wait._wait_for_condition`."""
+        from selenium.webdriver.remote.remote_connection import RemoteConnection  # noqa: PLC0415
+
+        from src.utils.wait import Wait  # noqa: PLC0415
+
+        profiler = self
+        execute = RemoteConnection.execute
+        sleep = time.sleep
+        wait_for_condition = Wait._wait_for_condition  # noqa: SLF001
+
+        def profiled_execute(connection: RemoteConnection, command: str, params: dict) -> Any:  # noqa: ANN401
+            if not profiler._tracking():
+                return execute(connection, command, params)
+            if profiler.network_baseline is None:
+                profiler.network_baseline = profiler._measure_network(connection)
+            pauses = _pause_seconds(params)
+            start = time.perf_counter()
+            with profiler._exclusive():
+                try:
+                    return execute(connection, command, params)
+                finally:
+                    elapsed = time.perf_counter() - start
+                    network = min(profiler.network_baseline, elapsed)
+                    paused = min(pauses, elapsed - network)
+                    profiler._charge(TimeCategory.NETWORK, network)
+                    profiler._charge(TimeCategory.DEVICE, elapsed - network - paused)
+                    if paused:
+                        profiler._charge(TimeCategory.SLEEP, paused, _call_site())
+
+        def profiled_sleep(seconds: float) -> None:
+            if not profiler._tracking():
+                sleep(seconds)
+                return
+            start = time.perf_counter()
+            sleep(seconds)
+            profiler._charge(TimeCategory.SLEEP, time.perf_counter() - start, _call_site())
+
+        def profiled_wait(wait: Wait, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+            if not profiler._tracking():
+                wait_for_condition(wait, *args, **kwargs)
+                return
+            site = _call_site()
+            start = time.perf_counter()
+            with profiler._exclusive():
+                try:
+                    wait_for_condition(wait, *args, **kwargs)
+                finally:
+                    profiler._charge(TimeCategory.POLLING, time.perf_counter() - start, site)
+
+        self._patch(RemoteConnection, "execute", profiled_execute)
+        self._patch(time, "sleep", profiled_sleep)
+        self._patch(Wait, "_wait_for_condition", profiled_wait)
+
+    def uninstall(self) -> None:
+        """Restore the wrapped functions."""
+        for owner, name, original in reversed(self._originals):
+            setattr(owner, name, original)
+        self._originals.clear()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item: pytest.Item, nextitem: pytest.Item | None):  # noqa: ANN201, ARG002, D102
+        self.current = TimeProfile(item.nodeid)
+        self._thread = threading.current_thread()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            profile, self.current = self.current, None
+            profile.wall = time.perf_counter() - start
+            accounted = sum(profile.totals.values())
+            profile.totals[TimeCategory.OTHER] = max(profile.wall - accounted, 0.0)
+            self.profiles.append(profile)
+
+    def ranked_waits(self) -> list[dict[str, Any]]:
+        """
+        Rank idle call sites across the suite.
+
+        Returns:
+            list[dict[str, Any]]: Call sites by total idle time, largest first.
+
+        """
+        sites: dict[tuple[TimeCategory, str], list[float]] = defaultdict(lambda: [0.0, 0])
+        for profile in self.profiles:
+            for key, (seconds, count) in profile.sites.items():
+                sites[key][0] += seconds
+                sites[key][1] += count
+        ranked = sorted(sites.items(), key=lambda item: item[1][0], reverse=True)
+        return [
+            {"category": category.value, "site": site, "seconds": round(seconds, 3), "count": count}
+            for (category, site), (seconds, count) in ranked
+        ]
+
+    def summary(self) -> dict[str, Any]:
+        """
+        Build the suite report.
+
+        Returns:
+            dict[str, Any]: Suite totals, idle ratio, ranked waits and per-test breakdowns.
+
+        """
+        wall = sum(profile.wall for profile in self.profiles)
+        totals = {category: sum(profile.totals[category] for profile in self.profiles) for category in TimeCategory}
+        idle = sum(totals[category] for category in IDLE_CATEGORIES)
+        return {
+            "wall": round(wall, 3),
+            "idle_ratio": round(idle / wall, 3) if wall else 0.0,
+            "network_baseline": round(self.network_baseline or 0.0, 4),
+            "totals": {category.value: round(seconds, 3) for category, seconds in totals.items()},
+            "waits": self.ranked_waits(),
+            "tests": [profile.as_dict() for profile in self.profiles],
+        }
+
+    def pytest_terminal_summary(self, terminalreporter: Any) -> None:  # noqa: ANN401, D102
+        report = self.summary()
+        terminalreporter.section("idle time")
+        terminalreporter.write_line(
+            f"suite idle ratio {report['idle_ratio']:.0%} of {report['wall']:.1f} s "
+            + ", ".join(f"{name} {seconds:.1f} s" for name, seconds in report["totals"].items()),
+        )
+        for test in report["tests"]:
+            terminalreporter.write_line(f"{test['idle_ratio']:>5.0%}  {test['wall']:>7.1f} s  {test['nodeid']}")
+        terminalreporter.write_line("biggest waits:")
+        for wait in report["waits"][:TOP_WAITS]:
+            terminalreporter.write_line(
+                f"{wait['seconds']:>8.1f} s  {wait['count']:>4}x  {wait['category']:<8} {wait['site']}",
+            )
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node: Any, error: object) -> None:  # noqa: ANN401, ARG002, D102
+        # pytest-xdist controller: collect the worker's profiles into one report.
+        output = node.workeroutput.get("idle_profile")
+        if output is None:
+            return
+        self.profiles.extend(TimeProfile.from_record(record) for record in output["profiles"])
+        if self.network_baseline is None:
+            self.network_baseline = output["network_baseline"]
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:  # noqa: D102
+        self.uninstall()
+        workeroutput = getattr(session.config, "workeroutput", None)
+        if workeroutput is not None:
+            # pytest-xdist worker: the controller writes the merged report.
+            workeroutput["idle_profile"] = {
+                "profiles": [profile.to_record() for profile in self.profiles],
+                "network_baseline": self.network_baseline,
+            }
+            return
+        self.report_path.parent.mkdir(parents=True, exist_ok=True)
+        self.report_path.write_text(json.dumps(self.summary(), indent=2))
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:  # noqa: D103
+    group = parser.getgroup("idle-profile", "idle time attribution")
+    group.addoption(
+        "--idle-profile",
+        action="store_true",
+        help="Split each test's wall time into device, network, sleep and polling time.",
+    )
+    group.addoption(
+        "--idle-profile-report",
+        default=DEFAULT_REPORT_PATH,
+        help=f"Path of the JSON report (default: {DEFAULT_REPORT_PATH}).",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:  # noqa: D103
+    if config.getoption("idle_profile"):
+        report_path = Path(config.getoption("idle_profile_report"))
+        if not report_path.is_absolute():
+            report_path = config.rootpath / report_path
+        profiler = IdleProfiler(report_path)
+        profiler.install()
+        config.pluginmanager.register(profiler, "idle-profiler")
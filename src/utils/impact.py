@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import ast
+import configparser
+import hashlib
+import importlib
+import inspect
+import json
+import logging
+import os
+import sys
+import textwrap
+from pathlib import Path
+from types import FrameType
+from typing import Any
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+SRC_DIR = ROOT_DIR / "src"
+PAGES_DIR = SRC_DIR / "pages"
+DEFAULT_MAP_PATH = "reporting/impact-map.json"
+CONFIG_NAME = "config.cfg"
+APP_ARTIFACT_KEYS = ("android_apk", "ios_ipa")
+CHUNK_SIZE = 1 << 20
+
+logger = logging.getLogger(__name__)
+
+
+def _digest(value: str | bytes) -> str:
+    if isinstance(value, str):
+        value = value.encode()
+    return hashlib.sha1(value).hexdigest()[:16]  # noqa: S324
+
+
+def environment_fingerprint(root: Path) -> str:
+    """
+    Hash the inputs every test depends on but no recorder sees: config.cfg and the app artifacts.
+
+    Args:
+        root (Path): Project root holding config.cfg; artifact paths are relative to it.
+
+    Returns:
+        str: The combined hash. A missing config or artifact hashes as absent.
+
+    """
+    digest = hashlib.sha1()  # noqa: S324
+    config_path = root / CONFIG_NAME
+    parser = configparser.ConfigParser()
+    if config_path.exists():
+        digest.update(config_path.read_bytes())
+        parser.read(config_path)
+    for key in APP_ARTIFACT_KEYS:
+        artifact = parser.get("APP", key, fallback="NONE")
+        digest.update(f"\0{key}={artifact}\0".encode())
+        path = root / artifact
+        if artifact == "NONE" or not path.is_file():
+            continue
+        with path.open("rb") as file:
+            for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+class DependencyRecorder:
+    """Records the page-object methods and source files called while a test runs."""
+
+    def __init__(self, root: Path = ROOT_DIR) -> None:  # noqa: D107
+        self.root = root
+        self.methods: set[str] = set()
+        self.files: set[str] = set()
+        self._seen_codes: set[Any] = set()
+
+    def _profile(self, frame: FrameType, event: str, _arg: object) -> None:
+        if event != "call" or frame.f_code in self._seen_codes:
+            return
+        code = frame.f_code
+        self._seen_codes.add(code)
+        filename = code.co_filename
+        if not filename.startswith(str(SRC_DIR)) or filename == __file__:
+            return
+        if filename.startswith(str(PAGES_DIR)) and code.co_name != "<module>":
+            qualname = getattr(code, "co_qualname", code.co_name)
+            self.methods.add(f"{frame.f_globals['__name__']}:{qualname}")
+        else:
+            self.files.add(Path(os.path.relpath(filename, self.root)).as_posix())
+
+    def start(self) -> None:
+        """Start recording calls."""
+        sys.setprofile(self._profile)
+
+    def stop(self) -> None:
+        """Stop recording calls."""
+        sys.setprofile(None)
+
+
+class DependencyHasher:
+    """Computes content hashes for recorded dependencies."""
+
+    def __init__(self, root: Path = ROOT_DIR) -> None:  # noqa: D107
+        self.root = root
+        self._cache: dict[str, str | None] = {}
+
+    def hash(self, key: str) -> str | None:
+        """
+        Hash a dependency key.
+
+        Args:
+            key (str): `file:<path>`, `method:<module>:<qualname>` or `locator:<module>:<Class.NAME>`.
+
+        Returns:
+            str | None: The content hash, or None if the dependency no longer exists.
+
+        """
+        if key not in self._cache:
+            kind, _, target = key.partition(":")
+            try:
+                self._cache[key] = getattr(self, f"_hash_{kind}")(target)
+            except (AttributeError, ImportError, OSError, TypeError):
+                self._cache[key] = None
+        return self._cache[key]
+
+    @staticmethod
+    def _resolve(target: str) -> tuple[Any, Any]:
+        module_name, _, qualname = target.partition(":")
+        module = importlib.import_module(module_name)
+        obj = module
+        for part in qualname.split("."):
+            obj = getattr(obj, part)
+        return module, obj
+
+    def _hash_file(self, target: str) -> str:
+        return _digest((self.root / target).read_bytes())
+
+    def _hash_method(self, target: str) -> str:
+        _, method = self._resolve(target)
+        return _digest(inspect.getsource(method))
+
+    def _hash_locator(self, target: str) -> str:
+        module_name, _, qualname = target.partition(":")
+        class_name, _, name = qualname.rpartition(".")
+        _, locator_class = self._resolve(f"{module_name}:{class_name}")
+        overrides = [getattr(locator_class, platform, {}).get(name) for platform in ("IOS", "WEB")]
+        return _digest(repr((getattr(locator_class, name), overrides)))
+
+    def locators_used_by(self, method_key: str) -> list[str]:
+        """
+        Find the locator constants referenced by a page-object method.
+
+        Args:
+            method_key (str): `method:<module>:<qualname>` dependency key.
+
+        Returns:
+            list[str]: `locator:` dependency keys for each `*Locators.NAME` or `self.locators.NAME` reference.
+
+        """
+        target = method_key.partition(":")[2]
+        try:
+            module, method = self._resolve(target)
+            tree = ast.parse(textwrap.dedent(inspect.getsource(method)))
+        except (AttributeError, ImportError, OSError, TypeError, SyntaxError):
+            return []
+        page_tables = [name for name in vars(module) if name.endswith("Locators") and name != "PlatformLocators"]
+        keys = []
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.Attribute):
+                continue
+            if isinstance(node.value, ast.Name) and node.value.id.endswith("Locators"):
+                class_names = [node.value.id]
+            elif (
+                isinstance(node.value, ast.Attribute)
+                and node.value.attr == "locators"
+                and isinstance(node.value.value, ast.Name)
+                and node.value.value.id == "self"
+            ):
+                class_names = page_tables
+            else:
+                continue
+            for class_name in class_names:
+                locator_class = getattr(module, class_name, None)
+                if locator_class is not None and hasattr(locator_class, node.attr):
+                    keys.append(f"locator:{locator_class.__module__}:{class_name}.{node.attr}")
+        return sorted(set(keys))
+
+
+class ImpactPlugin:
+    """
+    Deselects unaffected tests and records the dependencies of the tests that run.
+
+    Enabled with `--impact`. Each test's page-object methods, the locator constants they reference
+    and the other source files it touches are hashed into the map at `--impact-map`. On the next run,
+    tests that last passed and whose dependency hashes are unchanged are deselected. The map also
+    stores a fingerprint of config.cfg and the app artifacts; when it changes, the whole map is
+    discarded and every test runs. Under pytest-xdist, workers hand their records to the controller,
+    which writes the map once.
+    """
+
+    def __init__(self, map_path: Path, root: Path = ROOT_DIR) -> None:  # noqa: D107
+        self.map_path = map_path
+        self.root = root
+        self.hasher = DependencyHasher(root)
+        self.environment = environment_fingerprint(root)
+        self.recorded: dict[str, dict[str, Any]] = {}
+        self.previous: dict[str, dict[str, Any]] = {}
+        if map_path.exists():
+            stored = json.loads(map_path.read_text())
+            if stored.get("environment") == self.environment:
+                self.previous = stored.get("tests", {})
+            else:
+                logger.info("Config or app artifact changed, discarding impact map %s", map_path)
+
+    def _is_unaffected(self, nodeid: str) -> bool:
+        entry = self.previous.get(nodeid)
+        if entry is None or entry.get("outcome") != "passed":
+            return False
+        return all(self.hasher.hash(key) == digest for key, digest in entry["dependencies"].items())
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config: pytest.Config, items: list[pytest.Item]) -> None:  # noqa: D102
+        selected, deselected = [], []
+        for item in items:
+            (deselected if self._is_unaffected(item.nodeid) else selected).append(item)
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+        logger.info("Impact analysis: %d selected, %d unaffected", len(selected), len(deselected))
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item: pytest.Item, nextitem: pytest.Item | None):  # noqa: ANN201, ARG002, D102
+        recorder = DependencyRecorder(self.root)
+        recorder.start()
+        try:
+            yield
+        finally:
+            recorder.stop()
+        keys = {f"file:{Path(os.path.relpath(item.path, self.root)).as_posix()}"}
+        keys.update(f"file:{path}" for path in recorder.files)
+        for method in recorder.methods:
+            method_key = f"method:{method}"
+            keys.add(method_key)
+            keys.update(self.hasher.locators_used_by(method_key))
+        entry = self.recorded.setdefault(item.nodeid, {"outcome": "passed"})
+        entry["dependencies"] = {key: self.hasher.hash(key) for key in sorted(keys)}
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:  # noqa: D102
+        if report.outcome != "passed":
+            self.recorded.setdefault(report.nodeid, {})["outcome"] = report.outcome
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node: Any, error: object) -> None:  # noqa: ANN401, ARG002, D102
+        # pytest-xdist controller: collect what the worker recorded.
+        for nodeid, entry in node.workeroutput.get("impact", {}).items():
+            self.recorded.setdefault(nodeid, {}).update(entry)
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:  # noqa: D102
+        workeroutput = getattr(session.config, "workeroutput", None)
+        if workeroutput is not None:
+            # pytest-xdist worker: only the controller writes the map, so workers cannot overwrite each other.
+            workeroutput["impact"] = self.recorded
+            return
+        merged = {"environment": self.environment, "tests": {**self.previous, **self.recorded}}
+        self.map_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.map_path.with_suffix(f".{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(merged, indent=2, sort_keys=True))
+        temp_path.replace(self.map_path)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:  # noqa: D103
+    group = parser.getgroup("impact", "test impact analysis")
+    group.addoption(
+        "--impact",
+        action="store_true",
+        help="Only run tests whose page objects, locators or source files changed since they last passed.",
+    )
+    group.addoption(
+        "--impact-map",
+        default=DEFAULT_MAP_PATH,
+        help=f"Path of the persisted dependency map (default: {DEFAULT_MAP_PATH}).",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:  # noqa: D103
+    if config.getoption("impact"):
+        map_path = Path(config.getoption("impact_map"))
+        if not map_path.is_absolute():
+            map_path = config.rootpath / map_path
+        config.pluginmanager.register(ImpactPlugin(map_path, config.rootpath), "impact-plugin")
@@ -0,0 +1,461 @@
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+FIRST_EMULATOR_PORT = 5554
+POLL_INTERVAL = 0.5
+
+
+@dataclass
+class WorkerSlot:
+    """
+    A warm Appium server and the emulator it drives.
+
+    Attributes:
+        appium_port (int): Port of the Appium server.
+        avd (str | None): Name of the AVD booted for this slot.
+        udid (str | None): ADB serial of the booted emulator.
+
+    """
+
+    appium_port: int
+    avd: str | None = None
+    udid: str | None = None
+
+
+class ManagedProcess:
+    """A supervised child process with its output written to a log file."""
+
+    def __init__(self, name: str, command: list[str], log_dir: Path) -> None:
+        """
+        Initialize the ManagedProcess instance.
+
+        Args:
+            name (str): Name used for logging and the log file.
+            command (list[str]): The command line to run.
+            log_dir (Path): Directory for the process log.
+
+        """
+        self.name = name
+        self.command = command
+        self.log_path = log_dir / f"{name}.log"
+        self.process: subprocess.Popen | None = None
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def start(self) -> None:
+        """Start the process."""
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.log_path, "ab") as log:  # noqa: PTH123
+            self.process = subprocess.Popen(  # noqa: S603
+                self.command, stdout=log, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL,
+            )
+        self.logger.info("Started %s (pid %d)", self.name, self.process.pid)
+
+    def is_alive(self) -> bool:
+        """
+        Check whether the process is running.
+
+        Returns:
+            bool: True if started and not exited.
+
+        """
+        return self.process is not None and self.process.poll() is None
+
+    def stop(self, timeout: float = 10) -> None:
+        """
+        Terminate the process, killing it if it does not exit in time.
+
+        Args:
+            timeout (float): Seconds to wait after terminating.
+
+        """
+        if not self.is_alive():
+            return
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        self.logger.info("Stopped %s", self.name)
+
+
+class Launcher:
+    """
+    Starts and supervises one Appium server per worker port and boots the virtual devices in parallel.
+
+    Emulators are started without `-no-snapshot-load`, so they quick-boot from their default snapshot,
+    and with `-read-only` when several slots share an AVD.
+    The executables are configurable, which lets tests substitute stub scripts.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        ports: list[int],
+        avds: list[str],
+        log_dir: Path,
+        *,
+        appium_executable: str = "appium",
+        emulator_executable: str = "emulator",
+        adb_executable: str = "adb",
+        boot_timeout: float = 300,
+    ) -> None:
+        """
+        Initialize the Launcher instance.
+
+        Args:
+            ports (list[int]): Appium server ports, one per worker.
+            avds (list[str]): AVD names; slot i boots avds[i % len(avds)] when given.
+            log_dir (Path): Directory for process logs.
+            appium_executable (str): Path of the appium executable.
+            emulator_executable (str): Path of the emulator executable.
+            adb_executable (str): Path of the adb executable.
+            boot_timeout (float): Maximum time to wait for a server or device to become ready, in seconds.
+
+        """
+        self.log_dir = log_dir
+        self.appium_executable = appium_executable
+        self.emulator_executable = emulator_executable
+        self.adb_executable = adb_executable
+        self.boot_timeout = boot_timeout
+        self.slots = [WorkerSlot(port, avds[i % len(avds)] if avds else None) for i, port in enumerate(ports)]
+        self.processes: dict[str, ManagedProcess] = {}
+        self._stop = threading.Event()
+        self._supervisor: threading.Thread | None = None
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def _appium_process(self, slot: WorkerSlot) -> ManagedProcess:
+        command = [self.appium_executable, "--port", str(slot.appium_port)]
+        return ManagedProcess(f"appium-{slot.appium_port}", command, self.log_dir)
+
+    def _emulator_process(self, slot: WorkerSlot, index: int) -> ManagedProcess:
+        console_port = FIRST_EMULATOR_PORT + 2 * index
+        slot.udid = f"emulator-{console_port}"
+        command = [self.emulator_executable, "-avd", str(slot.avd), "-port", str(console_port), "-no-boot-anim"]
+        if sum(other.avd == slot.avd for other in self.slots) > 1:
+            command.append("-read-only")
+        return ManagedProcess(slot.udid, command, self.log_dir)
+
+    def _wait_until(self, check: Callable[[], bool], description: str) -> None:
+        deadline = time.monotonic() + self.boot_timeout
+        while time.monotonic() < deadline:
+            if check():
+                return
+            time.sleep(POLL_INTERVAL)
+        msg = f"{description} not ready after {self.boot_timeout}s"
+        raise TimeoutError(msg)
+
+    @staticmethod
+    def appium_ready(port: int) -> bool:
+        """
+        Check whether an Appium server on localhost answers `/status`.
+
+        Args:
+            port (int): The server port.
+
+        Returns:
+            bool: True if the server responded with HTTP 200.
+
+        """
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/status", timeout=2) as response:
+                return response.status == 200  # noqa: PLR2004
+        except (urllib.error.URLError, OSError):
+            return False
+
+    def device_ready(self, udid: str) -> bool:
+        """
+        Check whether a device has finished booting.
+
+        Args:
+            udid (str): ADB serial of the device.
+
+        Returns:
+            bool: True if `sys.boot_completed` is 1.
+
+        """
+        try:
+            result = subprocess.run(  # noqa: S603
+                [self.adb_executable, "-s", udid, "shell", "getprop", "sys.boot_completed"],
+                capture_output=True, text=True, timeout=10, check=False,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+        return result.stdout.strip() == "1"
+
+    def _start_slot(self, index: int, slot: WorkerSlot) -> None:
+        processes = [self._appium_process(slot)]
+        if slot.avd:
+            processes.append(self._emulator_process(slot, index))
+        for process in processes:
+            self.processes[process.name] = process
+            process.start()
+        self._wait_until(lambda: self.appium_ready(slot.appium_port), f"Appium on port {slot.appium_port}")
+        if slot.udid:
+            self._wait_until(lambda: self.device_ready(slot.udid), f"Emulator {slot.udid}")
+        self.logger.info("Slot ready: %s", slot)
+
+    def start(self) -> list[WorkerSlot]:
+        """
+        Start every slot in parallel and wait until all are ready.
+
+        Returns:
+            list[WorkerSlot]: The ready slots.
+
+        """
+        with ThreadPoolExecutor(max_workers=max(len(self.slots), 1)) as pool:
+            futures = [pool.submit(self._start_slot, index, slot) for index, slot in enumerate(self.slots)]
+            for future in futures:
+                future.result()
+        return self.slots
+
+    def supervise(self, interval: float = 5) -> None:
+        """
+        Restart processes that exit, checking every `interval` seconds in a background thread.
+
+        Args:
+            interval (float): Seconds between checks.
+
+        """
+        def loop() -> None:
+            while not self._stop.wait(interval):
+                for process in list(self.processes.values()):
+                    if not process.is_alive():
+                        self.logger.warning("%s exited, restarting", process.name)
+                        process.start()
+
+        self._stop.clear()
+        self._supervisor = threading.Thread(target=loop, name="launcher-supervisor", daemon=True)
+        self._supervisor.start()
+
+    def stop(self) -> None:
+        """Stop supervising and terminate every process."""
+        self._stop.set()
+        if self._supervisor is not None:
+            self._supervisor.join()
+        for process in self.processes.values():
+            process.stop()
+
+
+class LauncherDaemon:
+    """
+    Keeps a Launcher running in a detached process across pytest invocations.
+
+    The daemon writes its pid, arguments and ready slots to `state_dir/launcher.json`. Clients call
+    `ensure_running`, which reuses a live daemon started with the same arguments whose servers still
+    answer, and otherwise spawns one. Clients hold an exclusive lock on `state_dir/launcher.lock`
+    from the check until the daemon is ready, so concurrent workers start a single daemon.
+    """
+
+    def __init__(self, state_dir: Path) -> None:
+        """
+        Initialize the LauncherDaemon instance.
+
+        Args:
+            state_dir (Path): Directory for the state file and process logs.
+
+        """
+        self.state_dir = state_dir
+        self.state_path = state_dir / "launcher.json"
+        self.lock_path = state_dir / "launcher.lock"
+        self.log_path = state_dir / "daemon.log"
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def read_state(self) -> dict | None:
+        """
+        Read the state of a live daemon.
+
+        Returns:
+            dict | None: The state, or None if no daemon is running.
+
+        """
+        try:
+            state = json.loads(self.state_path.read_text())
+            os.kill(state["pid"], 0)
+        except (OSError, ValueError, KeyError):
+            return None
+        return state
+
+    def ensure_running(self, launcher_args: list[str], timeout: float = 300) -> list[WorkerSlot]:
+        """
+        Get the warm slots, starting the daemon if no matching, answering daemon is running.
+
+        A running daemon is restarted if it was started with other arguments or its servers stopped
+        answering.
+
+        Args:
+            launcher_args (list[str]): Arguments for `python -m src.utils.launcher serve`.
+            timeout (float): Maximum time to wait for the daemon to become ready, in seconds.
+
+        Returns:
+            list[WorkerSlot]: The ready slots.
+
+        Raises:
+            TimeoutError: If the daemon does not become ready in time.
+            RuntimeError: If the daemon exits before becoming ready.
+
+        """
+        import fcntl  # noqa: PLC0415
+
+        launcher_args = normalize_launcher_args(launcher_args)
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        with self.lock_path.open("w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                return self._ensure_running(launcher_args, timeout)
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _ensure_running(self, launcher_args: list[str], timeout: float) -> list[WorkerSlot]:
+        state = self.read_state()
+        if state and state.get("args") != launcher_args:
+            self.logger.info("Restarting launcher daemon started with %s", state.get("args"))
+        elif state and all(Launcher.appium_ready(slot["appium_port"]) for slot in state["slots"]):
+            return [WorkerSlot(**slot) for slot in state["slots"]]
+        if state:
+            self.stop()
+        self.state_path.unlink(missing_ok=True)
+        with self.log_path.open("wb") as log:
+            command = [sys.executable, "-m", "src.utils.launcher", "serve", "--state-dir", str(self.state_dir)]
+            process = subprocess.Popen(  # noqa: S603
+                [*command, *launcher_args],
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                stdin=subprocess.DEVNULL,
+                cwd=ROOT_DIR,
+                start_new_session=True,
+            )
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            state = self.read_state()
+            if state:
+                return [WorkerSlot(**slot) for slot in state["slots"]]
+            if process.poll() is not None:
+                output = self.log_path.read_text(errors="replace").strip()
+                msg = f"Launcher daemon exited with code {process.returncode} before becoming ready:\n{output}"
+                raise RuntimeError(msg)
+            time.sleep(POLL_INTERVAL)
+        msg = f"Launcher daemon not ready after {timeout}s"
+        raise TimeoutError(msg)
+
+    def serve(self, launcher: Launcher, launcher_args: list[str]) -> None:
+        """
+        Run the launcher until SIGTERM or SIGINT, publishing the state once ready.
+
+        Args:
+            launcher (Launcher): The launcher to keep running.
+            launcher_args (list[str]): The normalized arguments the launcher was built from.
+
+        """
+        stop = threading.Event()
+        signal.signal(signal.SIGTERM, lambda *_: stop.set())
+        signal.signal(signal.SIGINT, lambda *_: stop.set())
+        try:
+            slots = launcher.start()
+            launcher.supervise()
+            self.state_dir.mkdir(parents=True, exist_ok=True)
+            temp_path = self.state_path.with_suffix(".tmp")
+            state = {"pid": os.getpid(), "args": launcher_args, "slots": [asdict(slot) for slot in slots]}
+            temp_path.write_text(json.dumps(state))
+            temp_path.replace(self.state_path)
+            stop.wait()
+        finally:
+            launcher.stop()
+            self.state_path.unlink(missing_ok=True)
+
+    def stop(self, timeout: float = 30) -> None:
+        """
+        Stop a running daemon and the processes it supervises.
+
+        Args:
+            timeout (float): Seconds to wait for the daemon to exit.
+
+        """
+        state = self.read_state()
+        if not state:
+            return
+        os.kill(state["pid"], signal.SIGTERM)
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline and self.read_state():
+            time.sleep(POLL_INTERVAL)
+
+
+def _launcher_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--state-dir", type=Path, default=Path("output/launcher"))
+    parser.add_argument("--port", type=int, action="append", dest="ports", help="Appium port, repeat per worker.")
+    parser.add_argument("--avd", action="append", dest="avds", default=[], help="AVD to boot, repeat per worker.")
+    parser.add_argument("--appium", default="appium")
+    parser.add_argument("--emulator", default="emulator")
+    parser.add_argument("--adb", default="adb")
+    parser.add_argument("--boot-timeout", type=float, default=300)
+
+
+def _format_launcher_args(args: argparse.Namespace) -> list[str]:
+    launcher_args = [f"--port={port}" for port in args.ports or [4723]]
+    launcher_args += [f"--avd={avd}" for avd in args.avds]
+    launcher_args += [f"--appium={args.appium}", f"--emulator={args.emulator}", f"--adb={args.adb}"]
+    launcher_args.append(f"--boot-timeout={args.boot_timeout}")
+    return launcher_args
+
+
+def normalize_launcher_args(launcher_args: list[str]) -> list[str]:
+    """
+    Put launcher arguments in the canonical form stored by the daemon, with defaults filled in.
+
+    Args:
+        launcher_args (list[str]): Arguments for `python -m src.utils.launcher serve`.
+
+    Returns:
+        list[str]: The canonical arguments.
+
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    _launcher_arguments(parser)
+    return _format_launcher_args(parser.parse_args(launcher_args))
+
+
+def main() -> None:
+    """Start, stop or serve the launcher daemon."""
+    parser = argparse.ArgumentParser(description="Keep Appium servers and emulators warm across test runs.")
+    parser.add_argument("command", choices=["start", "stop", "serve"])
+    _launcher_arguments(parser)
+    args = parser.parse_args()
+    daemon = LauncherDaemon(args.state_dir)
+    if args.command == "stop":
+        daemon.stop()
+        return
+    launcher_args = _format_launcher_args(args)
+    if args.command == "start":
+        for slot in daemon.ensure_running(launcher_args, args.boot_timeout):
+            print(slot)  # noqa: T201
+        return
+    logging.basicConfig(level=logging.INFO)
+    launcher = Launcher(
+        args.ports or [4723],
+        args.avds,
+        args.state_dir,
+        appium_executable=args.appium,
+        emulator_executable=args.emulator,
+        adb_executable=args.adb,
+        boot_timeout=args.boot_timeout,
+    )
+    daemon.serve(launcher, launcher_args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import logging
+import pkgutil
+import statistics
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable
+
+from appium.webdriver.common.appiumby import AppiumBy
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+if TYPE_CHECKING:
+    from src.pages.registry import PageRegistry
+
+PAGES_PACKAGE = "src.pages"
+SLOW_THRESHOLD_MS = 150.0
+TEMPLATE_FIELD = "{}"
+TOUR_PLANT = ("Locator profile", "Created by the locator profiler", "Nowhere")
+TOUR_PLANT_DATE = "06/01/2024"
+
+
+@dataclass
+class LocatorProfile:
+    """
+    Lookup cost of a locator constant.
+
+    Attributes:
+        name (str): `<Locators class>.<CONSTANT>`.
+        by (str): The locator strategy.
+        value (str): The locator value.
+        median_ms (float): Median `find_elements` time, in milliseconds.
+        p95_ms (float): 95th percentile `find_elements` time, in milliseconds.
+        matches (int): Number of elements matched on the current screen.
+        suggestion (tuple[str, str] | None): A cheaper, unique locator for the same element.
+        suggestion_median_ms (float | None): Median lookup time of the suggestion, in milliseconds.
+        samples (list[float]): Individual lookup times, in milliseconds.
+
+    """
+
+    name: str
+    by: str
+    value: str
+    median_ms: float = 0.0
+    p95_ms: float = 0.0
+    matches: int = 0
+    suggestion: tuple[str, str] | None = None
+    suggestion_median_ms: float | None = None
+    samples: list[float] = field(default_factory=list, repr=False)
+
+
+def discover_locators(package: str = PAGES_PACKAGE) -> dict[str, tuple[str, str]]:
+    """
+    Find every locator constant in the `*Locators` classes of the page packages.
+
+    Template locators such as `GardenLocators.PLANT_CARD` only resolve once formatted, so they are skipped.
+
+    Args:
+        package (str): Package containing one sub-package per page.
+
+    Returns:
+        dict[str, tuple[str, str]]: Locator tuples by `<Locators class>.<CONSTANT>`.
+
+    """
+    locators: dict[str, tuple[str, str]] = {}
+    for page in pkgutil.iter_modules(importlib.import_module(package).__path__):
+        if not page.ispkg:
+            continue
+        try:
+            module = importlib.import_module(f"{package}.{page.name}.locators")
+        except ModuleNotFoundError:
+            continue
+        for class_name, locator_class in vars(module).items():
+            if not (class_name.endswith("Locators") and isinstance(locator_class, type)):
+                continue
+            for constant, locator in vars(locator_class).items():
+                if not (constant.isupper() and isinstance(locator, tuple) and len(locator) == 2):  # noqa: PLR2004
+                    continue
+                if TEMPLATE_FIELD not in locator[1]:
+                    locators[f"{class_name}.{constant}"] = locator
+    return locators
+
+
+def screen_tour(pages: PageRegistry) -> dict[str, Callable[[], None]]:
+    """
+    Build the navigation steps that bring up each page's screen, in app flow order.
+
+    Reaching the Garden screen saves a plant, so tour a disposable app state.
+
+    Args:
+        pages (PageRegistry): The page registry bound to the session being profiled.
+
+    Returns:
+        dict[str, Callable[[], None]]: Navigation steps by `*Locators` class name.
+
+    """
+
+    def open_home() -> None:
+        pages.home.confirm_ready()
+
+    def open_plant() -> None:
+        pages.home.open_add_plant()
+
+    def open_garden() -> None:
+        pages.plant.set_details(*TOUR_PLANT)
+        pages.plant.set_day_planted(TOUR_PLANT_DATE)
+        pages.garden.confirm_ready()
+
+    return {
+        "HomeLocators": open_home,
+        "PlantLocators": open_plant,
+        "GardenLocators": open_garden,
+    }
+
+
+class LocatorProfiler:
+    """
+    Times locator resolution per screen and suggests cheaper equivalents.
+
+    Locators are grouped by their `*Locators` class, and each group is resolved after running its
+    navigation step, so it is timed on the screen it belongs to. Each locator is resolved `rounds`
+    times with `find_elements`. For slow locators that match an element, the element's resource-id,
+    content-desc and text are tried as ID, accessibility id and text selectors, and the fastest one
+    that matches only that element is suggested.
+    """
+
+    def __init__(self, driver: WebDriver, rounds: int = 20, slow_threshold_ms: float = SLOW_THRESHOLD_MS) -> None:
+        """
+        Initialize the LocatorProfiler instance.
+
+        Args:
+            driver (WebDriver): The driver instance, showing the screen to profile.
+            rounds (int): Number of resolutions per locator.
+            slow_threshold_ms (float): Median lookup time above which a cheaper locator is searched for.
+
+        """
+        self.driver = driver
+        self.rounds = rounds
+        self.slow_threshold_ms = slow_threshold_ms
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def _time(self, by: str, value: str, rounds: int) -> tuple[list[float], list[WebElement]]:
+        samples, elements = [], []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            elements = self.driver.find_elements(by, value)
+            samples.append((time.perf_counter() - start) * 1000)
+        return samples, elements
+
+    def _candidates(self, element: WebElement) -> list[tuple[str, str]]:
+        candidates = []
+        resource_id = element.get_attribute("resource-id")
+        if resource_id:
+            candidates.append((AppiumBy.ID, resource_id))
+        description = element.get_attribute("content-desc")
+        if description:
+            candidates.append((AppiumBy.ACCESSIBILITY_ID, description))
+        text = element.get_attribute("text")
+        if text:
+            escaped = text.replace("\\", "\\\\").replace('"', '\\"')
+            candidates.append((AppiumBy.ANDROID_UIAUTOMATOR, f'new UiSelector().text("{escaped}")'))
+        return candidates
+
+    def _suggest(self, profile: LocatorProfile, element: WebElement) -> None:
+        rounds = max(self.rounds // 4, 3)
+        for by, value in self._candidates(element):
+            if (by, value) == (profile.by, profile.value):
+                continue
+            try:
+                samples, matches = self._time(by, value, rounds)
+            except WebDriverException:
+                continue
+            if len(matches) != 1 or matches[0].id != element.id:
+                continue
+            median = statistics.median(samples)
+            if median < profile.median_ms and (
+                profile.suggestion_median_ms is None or median < profile.suggestion_median_ms
+            ):
+                profile.suggestion = (by, value)
+                profile.suggestion_median_ms = median
+
+    def profile(
+        self,
+        locators: dict[str, tuple[str, str]] | None = None,
+        screens: dict[str, Callable[[], None]] | None = None,
+    ) -> list[LocatorProfile]:
+        """
+        Profile locators, each on the screen of its page.
+
+        Groups without a navigation step are profiled first, on the current screen. A group whose
+        navigation step fails is skipped rather than reported as not found.
+
+        Args:
+            locators (dict[str, tuple[str, str]] | None): Locators to profile; defaults to every discovered locator.
+            screens (dict[str, Callable[[], None]] | None): Navigation steps by `*Locators` class name,
+                in the order to run them.
+
+        Returns:
+            list[LocatorProfile]: Profiles ranked by median lookup cost, most expensive first.
+
+        """
+        screens = screens or {}
+        groups: dict[str, dict[str, tuple[str, str]]] = {}
+        for name, locator in (locators or discover_locators()).items():
+            groups.setdefault(name.split(".")[0], {})[name] = locator
+        order = [group for group in groups if group not in screens] + [group for group in screens if group in groups]
+        profiles = []
+        for group in order:
+            if group in screens:
+                try:
+                    screens[group]()
+                except WebDriverException:
+                    self.logger.exception("Failed to open the screen of %s, skipping its locators", group)
+                    continue
+            profiles.extend(self._profile_screen(groups[group]))
+        return sorted(profiles, key=lambda profile: profile.median_ms, reverse=True)
+
+    def _profile_screen(self, locators: dict[str, tuple[str, str]]) -> list[LocatorProfile]:
+        profiles = []
+        for name, (by, value) in locators.items():
+            profile = LocatorProfile(name, by, value)
+            try:
+                profile.samples, elements = self._time(by, value, self.rounds)
+            except WebDriverException:
+                self.logger.exception("Failed to resolve %s", name)
+                continue
+            profile.median_ms = statistics.median(profile.samples)
+            profile.p95_ms = max(profile.samples)
+            if len(profile.samples) > 1:
+                profile.p95_ms = statistics.quantiles(profile.samples, n=20)[-1]
+            profile.matches = len(elements)
+            if elements and profile.median_ms > self.slow_threshold_ms:
+                self._suggest(profile, elements[0])
+            self.logger.info("%s: %.1f ms median over %d rounds", name, profile.median_ms, self.rounds)
+            profiles.append(profile)
+        return profiles
+
+    @staticmethod
+    def format_report(profiles: list[LocatorProfile]) -> str:
+        """
+        Format profiles as a ranked text table.
+
+        Args:
+            profiles (list[LocatorProfile]): Ranked profiles.
+
+        Returns:
+            str: The report.
+
+        """
+        lines = [f"{'Rank':>4}  {'Median ms':>9}  {'p95 ms':>8}  {'Matches':>7}  Locator"]
+        for rank, profile in enumerate(profiles, start=1):
+            lines.append(
+                f"{rank:>4}  {profile.median_ms:>9.1f}  {profile.p95_ms:>8.1f}  {profile.matches:>7}  {profile.name}",
+            )
+            if profile.suggestion:
+                by, value = profile.suggestion
+                lines.append(f"{'':>36}suggest ({by}, {value!r}): {profile.suggestion_median_ms:.1f} ms")
+        return "\n".join(lines)
+
+
+def main() -> None:
+    """Profile every locator of every page, touring the app's screens in a new session."""
+    from appium import webdriver  # noqa: PLC0415
+    from appium.options.android import UiAutomator2Options  # noqa: PLC0415
+    from appium.swipe.actions import SwipeActions  # noqa: PLC0415
+
+    from src.pages.registry import PageRegistry  # noqa: PLC0415
+    from src.tests.core import CONFIG_PATH, ConfigLoader, DeviceOptionsFactory  # noqa: PLC0415
+    from src.utils.action import Action  # noqa: PLC0415
+    from src.utils.wait import Wait  # noqa: PLC0415
+
+    parser = argparse.ArgumentParser(description="Rank locator lookup cost and suggest cheaper locators.")
+    parser.add_argument("--rounds", type=int, default=20, help="Resolutions per locator.")
+    parser.add_argument("--json", type=Path, help="Also write the report as JSON to this path.")
+    args = parser.parse_args()
+
+    config = ConfigLoader.load_config(CONFIG_PATH)
+    options = DeviceOptionsFactory.create_options(config)
+    driver = webdriver.Remote(
+        f"http://{config.appium.host}:{config.appium.port}",
+        options=UiAutomator2Options().load_capabilities(options),
+    )
+    try:
+        pages = PageRegistry(driver, Action(driver), Wait(driver), SwipeActions(driver))
+        profiles = LocatorProfiler(driver, rounds=args.rounds).profile(screens=screen_tour(pages))
+    finally:
+        driver.quit()
+    print(LocatorProfiler.format_report(profiles))  # noqa: T201
+    if args.json:
+        args.json.write_text(json.dumps([asdict(profile) for profile in profiles], indent=2))
+
+
+if __name__ == "__main__":
+    main()
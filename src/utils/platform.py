@@ -2,9 +2,18 @@
 
 import datetime
 import shutil
+from enum import Enum
 from pathlib import Path
 
 
+class PlatformName(Enum):
+    """Platforms a session can target."""
+
+    ANDROID = "ANDROID"
+    IOS = "IOS"
+    WEB = "WEB"
+
+
 class Platform:
     """
     A class representing a platform with output management capabilities.
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import json
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, TypeVar
+
+import allure
+from selenium.common.exceptions import (
+    InvalidSessionIdException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+
+from src.utils.device import Device
+from src.utils.exception import AppCrashError, FailedTestError, TransientStepError
+
+ResultT = TypeVar("ResultT")
+
+APP_RUNNING_IN_FOREGROUND = 4
+CRASH_MESSAGES = (
+    "instrumentation process is not running",
+    "uiautomator2 server",
+    "cannot be proxied",
+    "socket hang up",
+    "econnreset",
+)
+
+
+class FailureClassifier:
+    """Maps exceptions raised during a step onto the failure types in `src.utils.exception`."""
+
+    def __init__(self, device: Device) -> None:
+        """
+        Initialize the FailureClassifier instance.
+
+        Args:
+            device (Device): The device under test, used to check whether the app is still running.
+
+        """
+        self.device = device
+
+    def _app_in_foreground(self) -> bool:
+        try:
+            state = self.device.driver.query_app_state(self.device.activity)
+        except WebDriverException:
+            return False
+        return state == APP_RUNNING_IN_FOREGROUND
+
+    def classify(self, error: Exception) -> Exception:
+        """
+        Classify an exception raised during a step.
+
+        Args:
+            error (Exception): The exception to classify.
+
+        Returns:
+            Exception: A TransientStepError, AppCrashError or FailedTestError wrapping the original error.
+
+        """
+        if isinstance(error, (TransientStepError, AppCrashError, FailedTestError)):
+            return error
+        message = f"{type(error).__name__}: {getattr(error, 'msg', None) or error}"
+        if isinstance(error, InvalidSessionIdException):
+            return FailedTestError(message, error)
+        if isinstance(error, WebDriverException) and any(
+            crash in str(error).lower() for crash in CRASH_MESSAGES
+        ):
+            return AppCrashError(message, error)
+        if isinstance(error, (StaleElementReferenceException, TimeoutException)):
+            if not self._app_in_foreground():
+                return AppCrashError(message, error)
+            return TransientStepError(message, error)
+        return FailedTestError(message, error)
+
+
+@dataclass
+class StepStats:
+    """
+    Retry statistics for one step title, summed over every call with that title.
+
+    Attributes:
+        calls (int): Number of times the step was run.
+        attempts (int): Number of attempts made across all calls.
+        failures (Counter[str]): Failure types seen across attempts.
+        passed (bool): Whether the latest call eventually passed.
+
+    """
+
+    calls: int = 0
+    attempts: int = 0
+    failures: Counter[str] = field(default_factory=Counter)
+    passed: bool = False
+
+
+class StepRetrier:
+    """
+    Runs allure steps, retrying only the failed step when its failure type allows it.
+
+    Transient failures are retried in place. App crashes relaunch the app through
+    `Device.refresh_app_instance` first, so they should only be retried for steps that can start
+    from a freshly launched app. Every other failure is raised as FailedTestError.
+    """
+
+    def __init__(self, device: Device, max_attempts: int = 2) -> None:
+        """
+        Initialize the StepRetrier instance.
+
+        Args:
+            device (Device): The device under test.
+            max_attempts (int): Maximum attempts per retryable step.
+
+        """
+        self.device = device
+        self.classifier = FailureClassifier(device)
+        self.max_attempts = max_attempts
+        self.stats: dict[str, StepStats] = {}
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def step(
+        self,
+        title: str,
+        func: Callable[..., ResultT],
+        *args: Any,  # noqa: ANN401
+        retry_on: tuple[type[Exception], ...] = (TransientStepError,),
+        **kwargs: Any,  # noqa: ANN401
+    ) -> ResultT:
+        """
+        Run a function as an allure step, retrying classified failures listed in `retry_on`.
+
+        Args:
+            title (str): The allure step title.
+            func (Callable[..., ResultT]): The step body.
+            *args: Positional arguments for `func`.
+            retry_on (tuple[type[Exception], ...]): Failure types that are safe to retry for this step.
+                Pass `()` for steps that must not be repeated.
+            **kwargs: Keyword arguments for `func`.
+
+        Returns:
+            ResultT: The return value of `func`.
+
+        Raises:
+            FailedTestError: If the step fails with a non-retryable failure or runs out of attempts.
+
+        """
+        stats = self.stats.setdefault(title, StepStats())
+        stats.calls += 1
+        stats.passed = False
+        attempt = 0
+        with allure.step(title):
+            while True:
+                attempt += 1
+                stats.attempts += 1
+                try:
+                    result = func(*args, **kwargs)
+                except Exception as e:
+                    failure = self.classifier.classify(e)
+                    stats.failures[type(failure).__name__] += 1
+                    if not isinstance(failure, retry_on) or attempt >= self.max_attempts:
+                        if isinstance(failure, FailedTestError):
+                            if failure is e:
+                                raise
+                            raise failure from e
+                        raise FailedTestError(failure.message, e) from e
+                    self.logger.warning("Retrying %s after %s", title, failure.message)
+                    if isinstance(failure, AppCrashError):
+                        self.device.refresh_app_instance()
+                    continue
+                stats.passed = True
+                return result
+
+    def retried_steps(self) -> dict[str, StepStats]:
+        """
+        Get the steps that needed more than one attempt in at least one call.
+
+        Returns:
+            dict[str, StepStats]: Statistics by step title.
+
+        """
+        return {title: stats for title, stats in self.stats.items() if stats.attempts > stats.calls}
+
+    def attach_stats(self) -> None:
+        """Attach retry statistics to the allure report and tag the test as flaky if any step was retried."""
+        retried = self.retried_steps()
+        if not retried:
+            return
+        allure.dynamic.tag("flaky")
+        summary = {
+            title: {
+                "calls": stats.calls,
+                "attempts": stats.attempts,
+                "failures": dict(stats.failures),
+                "passed": stats.passed,
+            }
+            for title, stats in retried.items()
+        }
+        allure.attach(
+            json.dumps(summary, indent=2),
+            name="Retry Statistics",
+            attachment_type=allure.attachment_type.JSON,
+        )
+        self.logger.warning("Retried steps: %s", summary)
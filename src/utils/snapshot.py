@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import logging
+import subprocess
+from enum import Enum
+from pathlib import Path
+from typing import Callable, ClassVar
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from src.utils.exception import SnapshotFailureError
+
+REMOTE_ARCHIVE_DIR = "/data/local/tmp"
+
+
+class SnapshotStrategy(Enum):
+    """Ways of capturing a device state."""
+
+    APP_DATA = "APP_DATA"
+    EMULATOR = "EMULATOR"
+    REBUILD = "REBUILD"
+
+
+class StateSnapshot:
+    """
+    Captures named precondition states once per run and restores them for later tests.
+
+    APP_DATA archives the app's private data directory through `mobile: shell` (requires the
+    Appium server to allow the `adb_shell` insecure feature). EMULATOR saves a full AVD snapshot
+    through the emulator console, which also resets the UiAutomator2 server, so the caller must
+    start a new session after restoring one. REBUILD captures nothing, so every test builds its
+    states through the UI; it is used where neither snapshot is available, such as iOS and web.
+    """
+
+    _captured: ClassVar[dict[str, SnapshotStrategy]] = {}
+
+    def __init__(
+        self,
+        driver: WebDriver,
+        package: str,
+        snapshot_dir: str,
+        strategy: SnapshotStrategy = SnapshotStrategy.APP_DATA,
+        *,
+        adb_path: str = "adb",
+    ) -> None:
+        """
+        Initialize the StateSnapshot instance.
+
+        Args:
+            driver (WebDriver): The driver instance for device control.
+            package (str): The package name of the app being tested.
+            snapshot_dir (str): The local directory for storing app data archives.
+            strategy (SnapshotStrategy): How states are captured and restored.
+            adb_path (str): Path of the adb executable used to reach the emulator console.
+
+        """
+        self.driver = driver
+        self.package = package
+        self.snapshot_dir = Path(snapshot_dir)
+        self.strategy = strategy
+        self.adb_path = adb_path
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def has(self, key: str) -> bool:
+        """
+        Check whether a state has been captured during this run.
+
+        Args:
+            key (str): The name of the precondition state.
+
+        Returns:
+            bool: True if the state can be restored.
+
+        """
+        return self.strategy is not SnapshotStrategy.REBUILD and self._captured.get(key) is self.strategy
+
+    def ensure(self, key: str, builder: Callable[[], None]) -> bool:
+        """
+        Restore a state if it was captured earlier, otherwise build and capture it.
+
+        Args:
+            key (str): The name of the precondition state.
+            builder (Callable[[], None]): Reaches the state through the UI.
+
+        Returns:
+            bool: True if the state was restored from a snapshot, False if it was built.
+
+        """
+        if self.has(key):
+            self.restore(key)
+            return True
+        builder()
+        self.capture(key)
+        return False
+
+    def capture(self, key: str) -> None:
+        """
+        Capture the current device state under the given name.
+
+        Args:
+            key (str): The name of the precondition state.
+
+        Raises:
+            SnapshotFailureError: If the state could not be captured.
+
+        """
+        if self.strategy is SnapshotStrategy.REBUILD:
+            return
+        try:
+            if self.strategy is SnapshotStrategy.EMULATOR:
+                self._emulator_console("save", key)
+            else:
+                self._capture_app_data(key)
+        except Exception as e:
+            error_message = f"Failed to capture state {key}: {e}"
+            self.logger.exception(error_message)
+            raise SnapshotFailureError(error_message, e) from e
+        self._captured[key] = self.strategy
+        self.logger.info("State %s captured (%s)", key, self.strategy.value)
+
+    def restore(self, key: str) -> None:
+        """
+        Restore a state captured earlier in this run.
+
+        Args:
+            key (str): The name of the precondition state.
+
+        Raises:
+            SnapshotFailureError: If the state was never captured or could not be restored.
+
+        """
+        if not self.has(key):
+            error_message = f"State {key} has not been captured in this run"
+            raise SnapshotFailureError(error_message)
+        try:
+            if self.strategy is SnapshotStrategy.EMULATOR:
+                self._emulator_console("load", key)
+            else:
+                self._restore_app_data(key)
+        except Exception as e:
+            error_message = f"Failed to restore state {key}: {e}"
+            self.logger.exception(error_message)
+            raise SnapshotFailureError(error_message, e) from e
+        self.logger.info("State %s restored (%s)", key, self.strategy.value)
+
+    def _archive_path(self, key: str) -> Path:
+        return self.snapshot_dir / f"{self.package}_{key}.tar.b64"
+
+    def _shell(self, command: str, *args: str) -> str:
+        return self.driver.execute_script(
+            "mobile: shell", {"command": command, "args": list(args)},
+        )
+
+    def _capture_app_data(self, key: str) -> None:
+        self.driver.terminate_app(self.package)
+        encoded = self._shell(
+            "run-as", self.package, "sh", "-c", "'tar -cf - --exclude=./lib --exclude=./cache . | base64'",
+        )
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        self._archive_path(key).write_text(encoded)
+        self.driver.activate_app(self.package)
+
+    def _restore_app_data(self, key: str) -> None:
+        remote_archive = f"{REMOTE_ARCHIVE_DIR}/{self.package}_{key}.tar"
+        self.driver.terminate_app(self.package)
+        self.driver.push_file(remote_archive, "".join(self._archive_path(key).read_text().split()))
+        self._shell(
+            "run-as",
+            self.package,
+            "sh",
+            "-c",
+            f"'find . -mindepth 1 -maxdepth 1 ! -name lib -exec rm -rf {{}} + && tar -xf {remote_archive}'",
+        )
+        self.driver.activate_app(self.package)
+
+    def _emulator_console(self, action: str, key: str) -> None:
+        udid = self.driver.capabilities.get("udid") or self.driver.capabilities.get("deviceUDID")
+        subprocess.run(  # noqa: S603
+            [self.adb_path, "-s", udid, "emu", "avd", "snapshot", action, key],
+            check=True,
+            capture_output=True,
+            timeout=120,
+        )
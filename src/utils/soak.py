@@ -0,0 +1,345 @@
+from __future__ import annotations
+
+import json
+import logging
+import math
+import re
+import resource
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from src.utils.exception import ResourceDriftError
+
+UIAUTOMATOR2_PACKAGE = "io.appium.uiautomator2.server"
+MEMINFO_TOTAL = re.compile(r"^\s*TOTAL(?:\s+PSS:)?\s+(\d+)", re.MULTILINE)
+STATM_PATH = Path("/proc/self/statm")
+PAGE_SIZE_KB = resource.getpagesize() // 1024
+
+
+class TrendStats:
+    """
+    Streaming statistics of one metric, in constant memory.
+
+    The first `baseline_samples` values form the baseline (mean and variance by Welford's
+    algorithm). Every value updates an exponentially weighted moving average of the current level
+    and a least-squares slope against elapsed time, both from running sums. The metric is drifting
+    when the current level has moved above the baseline by more than `tolerance` of the baseline
+    mean and three baseline standard deviations while the slope still points upwards.
+    """
+
+    def __init__(self, name: str, baseline_samples: int, alpha: float, tolerance: float) -> None:
+        """
+        Initialize the TrendStats instance.
+
+        Args:
+            name (str): Metric name used in reports.
+            baseline_samples (int): Number of leading samples forming the baseline.
+            alpha (float): Smoothing factor of the moving average, between 0 and 1.
+            tolerance (float): Allowed rise above the baseline mean, as a fraction of it.
+
+        """
+        self.name = name
+        self.baseline_samples = baseline_samples
+        self.alpha = alpha
+        self.tolerance = tolerance
+        self.count = 0
+        self.baseline_count = 0
+        self.baseline_mean = 0.0
+        self._baseline_m2 = 0.0
+        self.ewma: float | None = None
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self._sums = [0.0, 0.0, 0.0, 0.0]
+
+    def add(self, elapsed: float, value: float) -> None:
+        """
+        Record a sample.
+
+        Args:
+            elapsed (float): Seconds since the run started.
+            value (float): The sampled value.
+
+        """
+        self.count += 1
+        if self.baseline_count < self.baseline_samples:
+            self.baseline_count += 1
+            delta = value - self.baseline_mean
+            self.baseline_mean += delta / self.baseline_count
+            self._baseline_m2 += delta * (value - self.baseline_mean)
+        self.ewma = value if self.ewma is None else self.alpha * value + (1 - self.alpha) * self.ewma
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        sums = self._sums
+        sums[0] += elapsed
+        sums[1] += value
+        sums[2] += elapsed * elapsed
+        sums[3] += elapsed * value
+
+    @property
+    def baseline_stddev(self) -> float:  # noqa: D102
+        return math.sqrt(self._baseline_m2 / (self.baseline_count - 1)) if self.baseline_count > 1 else 0.0
+
+    @property
+    def slope(self) -> float:
+        """float: Least-squares change of the metric per hour."""
+        sum_x, sum_y, sum_xx, sum_xy = self._sums
+        denominator = self.count * sum_xx - sum_x * sum_x
+        if self.count < 2 or denominator <= 0:  # noqa: PLR2004
+            return 0.0
+        return (self.count * sum_xy - sum_x * sum_y) / denominator * 3600
+
+    @property
+    def drifting(self) -> bool:
+        """bool: Whether the current level has risen beyond the baseline and is still rising."""
+        if self.count <= self.baseline_samples or self.ewma is None:
+            return False
+        allowed = max(self.tolerance * abs(self.baseline_mean), 3 * self.baseline_stddev)
+        return self.ewma - self.baseline_mean > allowed and self.slope > 0
+
+    def as_dict(self) -> dict[str, Any]:  # noqa: D102
+        return {
+            "samples": self.count,
+            "baseline_mean": round(self.baseline_mean, 3),
+            "baseline_stddev": round(self.baseline_stddev, 3),
+            "current": round(self.ewma or 0.0, 3),
+            "min": round(self.minimum, 3) if self.count else None,
+            "max": round(self.maximum, 3) if self.count else None,
+            "slope_per_hour": round(self.slope, 3),
+            "drifting": self.drifting,
+        }
+
+
+class ResourceSampler:
+    """
+    Samples app, UiAutomator2 and runner resources.
+
+    Device memory (PSS, KiB) and CPU (%) come from `dumpsys meminfo` and `dumpsys cpuinfo` over
+    `mobile: shell`, which needs Appium started with `--allow-insecure=adb_shell`. Without a
+    package, for example on iOS or web sessions, only the runner and latency metrics are sampled.
+    """
+
+    def __init__(self, driver: WebDriver, package: str | None) -> None:
+        """
+        Initialize the ResourceSampler instance.
+
+        Args:
+            driver (WebDriver): The driver of the session under soak.
+            package (str | None): Android package of the app, or None to skip device metrics.
+
+        """
+        self.driver = driver
+        self.package = package
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def _shell(self, command: str, *args: str) -> str:
+        try:
+            return self.driver.execute_script("mobile: shell", {"command": command, "args": list(args)}) or ""
+        except WebDriverException as e:
+            self.logger.warning("mobile: shell %s failed: %s", command, e.msg)
+            return ""
+
+    def memory_kb(self, package: str) -> float | None:
+        """
+        Get the total PSS of a package.
+
+        Args:
+            package (str): The Android package.
+
+        Returns:
+            float | None: PSS in KiB, or None if the process is not running.
+
+        """
+        match = MEMINFO_TOTAL.search(self._shell("dumpsys", "meminfo", package))
+        return float(match.group(1)) if match else None
+
+    def cpu_percent(self, package: str) -> float | None:
+        """
+        Get the recent CPU load of a package.
+
+        Args:
+            package (str): The Android package.
+
+        Returns:
+            float | None: CPU usage in percent, or None if the process is not listed.
+
+        """
+        match = re.search(rf"([\d.]+)% \d+/{re.escape(package)}:", self._shell("dumpsys", "cpuinfo"))
+        return float(match.group(1)) if match else None
+
+    @staticmethod
+    def runner_rss_kb() -> float:
+        """
+        Get the resident memory of this Python process.
+
+        Returns:
+            float: RSS in KiB; the peak RSS where /proc is unavailable.
+
+        """
+        if STATM_PATH.exists():
+            return float(int(STATM_PATH.read_text().split()[1]) * PAGE_SIZE_KB)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1024 if sys.platform == "darwin" else float(peak)
+
+    def command_latency_ms(self) -> float:
+        """
+        Time a cheap driver command.
+
+        Returns:
+            float: Round trip of `get_window_size`, in milliseconds.
+
+        """
+        start = time.perf_counter()
+        self.driver.get_window_size()
+        return (time.perf_counter() - start) * 1000
+
+    def sample(self) -> dict[str, float]:
+        """
+        Take one sample of every available metric.
+
+        Returns:
+            dict[str, float]: Values by metric name; metrics of processes that are not running are omitted.
+
+        """
+        values = {"runner_rss_kb": self.runner_rss_kb(), "command_latency_ms": self.command_latency_ms()}
+        if self.package is not None:
+            device_metrics = {
+                "app_pss_kb": self.memory_kb(self.package),
+                "app_cpu_percent": self.cpu_percent(self.package),
+                "uiautomator2_pss_kb": self.memory_kb(UIAUTOMATOR2_PACKAGE),
+            }
+            values.update({name: value for name, value in device_metrics.items() if value is not None})
+        return values
+
+
+class SoakRunner:
+    """
+    Repeats a flow for a fixed duration and tracks resource drift.
+
+    After every `sample_every` iterations the sampler is read and each metric, together with the
+    iteration duration, is folded into a TrendStats. Memory stays constant however long the run is.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        sampler: ResourceSampler,
+        duration: float,
+        *,
+        sample_every: int = 1,
+        baseline_samples: int = 10,
+        alpha: float = 0.1,
+        tolerance: float = 0.2,
+    ) -> None:
+        """
+        Initialize the SoakRunner instance.
+
+        Args:
+            sampler (ResourceSampler): Source of resource samples.
+            duration (float): Seconds to keep starting new iterations.
+            sample_every (int): Iterations between samples.
+            baseline_samples (int): Number of leading samples forming each metric's baseline.
+            alpha (float): Smoothing factor of the moving averages.
+            tolerance (float): Allowed rise above the baseline mean, as a fraction of it.
+
+        """
+        self.sampler = sampler
+        self.duration = duration
+        self.sample_every = sample_every
+        self.baseline_samples = baseline_samples
+        self.alpha = alpha
+        self.tolerance = tolerance
+        self.iterations = 0
+        self.metrics: dict[str, TrendStats] = {}
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def record(self, elapsed: float, values: dict[str, float]) -> None:
+        """
+        Fold a sample into the metric statistics.
+
+        Args:
+            elapsed (float): Seconds since the run started.
+            values (dict[str, float]): Values by metric name.
+
+        """
+        for name, value in values.items():
+            stats = self.metrics.get(name)
+            if stats is None:
+                stats = self.metrics[name] = TrendStats(name, self.baseline_samples, self.alpha, self.tolerance)
+            stats.add(elapsed, value)
+
+    def run(self, flow: Callable[[], None]) -> dict[str, Any]:
+        """
+        Run the flow repeatedly until the duration has passed.
+
+        Args:
+            flow (Callable[[], None]): One iteration, leaving the app ready for the next one.
+
+        Returns:
+            dict[str, Any]: The soak report.
+
+        """
+        start = time.monotonic()
+        while time.monotonic() - start < self.duration:
+            iteration_start = time.monotonic()
+            flow()
+            self.iterations += 1
+            if self.iterations % self.sample_every == 0:
+                values = self.sampler.sample()
+                values["iteration_s"] = time.monotonic() - iteration_start
+                self.record(time.monotonic() - start, values)
+                rounded = {name: round(value, 1) for name, value in values.items()}
+                self.logger.info("Iteration %d: %s", self.iterations, rounded)
+        return self.report(time.monotonic() - start)
+
+    def report(self, elapsed: float) -> dict[str, Any]:
+        """
+        Summarize the run.
+
+        Args:
+            elapsed (float): Seconds the run took.
+
+        Returns:
+            dict[str, Any]: Iterations, duration and statistics per metric.
+
+        """
+        return {
+            "iterations": self.iterations,
+            "elapsed_s": round(elapsed, 1),
+            "drifting": sorted(name for name, stats in self.metrics.items() if stats.drifting),
+            "metrics": {name: stats.as_dict() for name, stats in self.metrics.items()},
+        }
+
+    def attach_report(self, report: dict[str, Any]) -> None:
+        """
+        Attach the soak report to the current allure test.
+
+        Args:
+            report (dict[str, Any]): The report returned by `run`.
+
+        """
+        import allure  # noqa: PLC0415
+
+        allure.attach(json.dumps(report, indent=2), name="Soak Report", attachment_type=allure.attachment_type.JSON)
+
+    def assert_stable(self, report: dict[str, Any]) -> None:
+        """
+        Fail if any metric drifted.
+
+        Args:
+            report (dict[str, Any]): The report returned by `run`.
+
+        Raises:
+            ResourceDriftError: If at least one metric is drifting.
+
+        """
+        if report["drifting"]:
+            details = ", ".join(
+                f"{name} {report['metrics'][name]['baseline_mean']} -> {report['metrics'][name]['current']}"
+                for name in report["drifting"]
+            )
+            msg = f"Resources drifted over {report['iterations']} iterations: {details}"
+            raise ResourceDriftError(msg)
@@ -0,0 +1,322 @@
+from __future__ import annotations
+
+import argparse
+import heapq
+import html
+import json
+import logging
+import os
+import tempfile
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator
+
+LANE_HEIGHT = 28
+SLOWEST_STEPS = 25
+MIN_GAP_MS = 1000
+
+logger = logging.getLogger(__name__)
+
+PAGE_HEAD = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Run Timeline</title>
+<style>
+body{font-family:sans-serif;margin:16px;color:#222}
+table{border-collapse:collapse;margin-bottom:16px}td,th{border:1px solid #ccc;padding:2px 8px;text-align:left}
+#lanes{display:flex}#labels div{height:%(lane)dpx;line-height:%(lane)dpx;white-space:nowrap;padding-right:8px}
+#chart{position:relative;flex:1;overflow-x:auto;background:#fafafa}
+.bar{position:absolute;height:%(bar)dpx;min-width:1px;cursor:pointer;opacity:.85}
+.passed{background:#4caf50}.failed{background:#e53935}.broken{background:#fb8c00}.skipped,.unknown{background:#9e9e9e}
+.fixture{background:#90caf9}.gap{background:repeating-linear-gradient(45deg,#eee,#eee 4px,#ddd 4px,#ddd 8px)}
+#details{margin-top:16px;white-space:pre-wrap}#details img{max-height:480px;display:block;margin:4px 0}
+</style></head><body>
+"""
+
+PAGE_SCRIPT = """<script>
+const results = document.getElementById("chart").dataset.results;
+document.getElementById("chart").addEventListener("click", (event) => {
+  const bar = event.target.closest(".bar[data-info]");
+  if (!bar) return;
+  const info = JSON.parse(bar.dataset.info);
+  const panel = document.getElementById("details");
+  panel.textContent = "";
+  const title = document.createElement("h3");
+  title.textContent = `${info.name} (${info.status}, ${(info.duration / 1000).toFixed(1)} s)`;
+  panel.appendChild(title);
+  for (const step of info.steps) {
+    const line = document.createElement("div");
+    line.textContent = `${(step[1] / 1000).toFixed(2)} s  ${step[2]}  ${step[0]}`;
+    panel.appendChild(line);
+  }
+  for (const source of info.attachments) {
+    const link = document.createElement("a");
+    link.href = `${results}/${source}`;
+    link.textContent = source;
+    panel.appendChild(link);
+    if (/\\.(png|jpe?g|gif)$/.test(source)) {
+      const image = document.createElement("img");
+      image.loading = "lazy";
+      image.src = link.href;
+      panel.appendChild(image);
+    }
+  }
+});
+</script></body></html>
+"""
+
+
+@dataclass
+class LaneStats:
+    """
+    Occupancy of one device lane.
+
+    Attributes:
+        name (str): Lane label.
+        intervals (array): Flat start/stop pairs of everything that ran on the lane, in ms.
+        results (int): Number of test results on the lane.
+        busy_ms (int): Time covered by at least one result or fixture, in ms.
+        idle_ms (int): Time between the lane's first start and last stop not covered, in ms.
+        gaps (list[tuple[int, int]]): Idle gaps longer than MIN_GAP_MS.
+
+    """
+
+    name: str
+    intervals: array = field(default_factory=lambda: array("q"))
+    results: int = 0
+    busy_ms: int = 0
+    idle_ms: int = 0
+    gaps: list[tuple[int, int]] = field(default_factory=list)
+
+    def add(self, start: int, stop: int) -> None:  # noqa: D102
+        self.intervals.extend((start, stop))
+
+    def compute(self) -> None:
+        """Merge the intervals into busy time and idle gaps."""
+        pairs = sorted(zip(self.intervals[::2], self.intervals[1::2]))
+        self.intervals = array("q")
+        if not pairs:
+            return
+        current_start, current_stop = pairs[0]
+        for start, stop in pairs[1:]:
+            if start > current_stop:
+                self.busy_ms += current_stop - current_start
+                gap = start - current_stop
+                self.idle_ms += gap
+                if gap >= MIN_GAP_MS:
+                    self.gaps.append((current_stop, start))
+                current_start = start
+            current_stop = max(current_stop, stop)
+        self.busy_ms += current_stop - current_start
+
+
+def _lane_of(result: dict[str, Any]) -> str:
+    labels = {label.get("name"): label.get("value") for label in result.get("labels", [])}
+    if labels.get("device"):
+        return labels["device"]
+    return f"{labels.get('host', 'unknown')} / {labels.get('thread', 'main')}"
+
+
+def _flatten_steps(steps: list[dict[str, Any]], prefix: str = "") -> Iterator[tuple[str, int, str, list[str]]]:
+    for step in steps:
+        name = f"{prefix}{step.get('name', '')}"
+        duration = max(step.get("stop", 0) - step.get("start", 0), 0)
+        sources = [attachment["source"] for attachment in step.get("attachments", []) if "source" in attachment]
+        yield name, duration, step.get("status", "unknown"), sources
+        yield from _flatten_steps(step.get("steps", []), f"{name} > ")
+
+
+def _scan(results_dir: Path, pattern: str) -> Iterator[tuple[Path, dict[str, Any]]]:
+    with os.scandir(results_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith(pattern):
+                continue
+            try:
+                with open(entry.path, encoding="utf-8") as file:  # noqa: PTH123
+                    yield Path(entry.path), json.load(file)
+            except (OSError, ValueError):
+                logger.warning("Skipping unreadable result file: %s", entry.name)
+
+
+class TimelineReport:
+    """
+    Builds a static HTML timeline from allure results without the Allure CLI.
+
+    Result and container files are streamed one at a time. Each result is reduced to a compact bar
+    record spooled to a temporary file, so memory holds only per-lane intervals, a uuid-to-lane index
+    and the slowest steps rather than the parsed results.
+    """
+
+    def __init__(self, results_dir: Path) -> None:
+        """
+        Initialize the TimelineReport instance.
+
+        Args:
+            results_dir (Path): The allure-results directory.
+
+        """
+        self.results_dir = results_dir
+        self.lanes: dict[str, int] = {}
+        self.lane_stats: list[LaneStats] = []
+        self.result_lanes: dict[str, int] = {}
+        self.slowest: list[tuple[int, str, str]] = []
+        self.start = None
+        self.stop = None
+        self.statuses: dict[str, int] = {}
+
+    def _lane_index(self, name: str) -> int:
+        if name not in self.lanes:
+            self.lanes[name] = len(self.lane_stats)
+            self.lane_stats.append(LaneStats(name))
+        return self.lanes[name]
+
+    def _extend(self, start: int, stop: int) -> None:
+        self.start = start if self.start is None else min(self.start, start)
+        self.stop = stop if self.stop is None else max(self.stop, stop)
+
+    def _collect(self, spool: Any) -> None:  # noqa: ANN401
+        for _, result in _scan(self.results_dir, "-result.json"):
+            start, stop = result.get("start"), result.get("stop")
+            if start is None or stop is None:
+                continue
+            lane = self._lane_index(_lane_of(result))
+            self.result_lanes[result.get("uuid", "")] = lane
+            self.lane_stats[lane].add(start, stop)
+            self.lane_stats[lane].results += 1
+            self._extend(start, stop)
+            status = result.get("status", "unknown")
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+            steps = []
+            attachments = [
+                attachment["source"] for attachment in result.get("attachments", []) if "source" in attachment
+            ]
+            for name, duration, step_status, sources in _flatten_steps(result.get("steps", [])):
+                steps.append((name, duration, step_status))
+                attachments.extend(sources)
+                entry = (duration, result.get("name", ""), name)
+                if len(self.slowest) < SLOWEST_STEPS:
+                    heapq.heappush(self.slowest, entry)
+                else:
+                    heapq.heappushpop(self.slowest, entry)
+            record = {
+                "lane": lane,
+                "start": start,
+                "stop": stop,
+                "status": status,
+                "name": result.get("fullName") or result.get("name", ""),
+                "steps": steps,
+                "attachments": attachments,
+            }
+            spool.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+        for _, container in _scan(self.results_dir, "-container.json"):
+            lanes = {self.result_lanes[child] for child in container.get("children", []) if child in self.result_lanes}
+            for fixture in container.get("befores", []) + container.get("afters", []):
+                start, stop = fixture.get("start"), fixture.get("stop")
+                if start is None or stop is None:
+                    continue
+                for lane in lanes:
+                    self.lane_stats[lane].add(start, stop)
+                    self._extend(start, stop)
+                    record = {"lane": lane, "start": start, "stop": stop, "fixture": fixture.get("name", "")}
+                    spool.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def _position(self, start: int, stop: int) -> str:
+        span = max(self.stop - self.start, 1)
+        left = (start - self.start) / span * 100
+        width = max((stop - start) / span * 100, 0.01)
+        return f"left:{left:.4f}%;width:{width:.4f}%"
+
+    def _write_summary(self, out: Any) -> None:  # noqa: ANN401
+        span = (self.stop - self.start) / 1000
+        counts = ", ".join(f"{status}: {count}" for status, count in sorted(self.statuses.items()))
+        total_results = sum(self.statuses.values())
+        out.write(f"<h2>Run Timeline</h2><p>{total_results} results ({html.escape(counts)}) over {span:.1f} s</p>\n")
+        out.write(
+            "<table><tr><th>Device lane</th><th>Results</th><th>Busy s</th><th>Idle s</th><th>Utilisation</th></tr>\n",
+        )
+        for lane in self.lane_stats:
+            total = max(lane.busy_ms + lane.idle_ms, 1)
+            out.write(
+                f"<tr><td>{html.escape(lane.name)}</td><td>{lane.results}</td><td>{lane.busy_ms / 1000:.1f}</td>"
+                f"<td>{lane.idle_ms / 1000:.1f}</td><td>{lane.busy_ms / total:.0%}</td></tr>\n",
+            )
+        out.write("</table>\n<table><tr><th>Slowest steps</th><th>Test</th><th>Seconds</th></tr>\n")
+        for duration, test, step in sorted(self.slowest, reverse=True):
+            out.write(
+                f"<tr><td>{html.escape(step)}</td><td>{html.escape(test)}</td><td>{duration / 1000:.2f}</td></tr>\n",
+            )
+        out.write("</table>\n")
+
+    def _write_chart(self, out: Any, spool: Any, results_href: str) -> None:  # noqa: ANN401
+        out.write('<div id="lanes"><div id="labels">')
+        for lane in self.lane_stats:
+            out.write(f"<div>{html.escape(lane.name)}</div>")
+        height = LANE_HEIGHT * len(self.lane_stats)
+        out.write(f'</div><div id="chart" style="height:{height}px" data-results="{html.escape(results_href)}">\n')
+        for index, lane in enumerate(self.lane_stats):
+            for start, stop in lane.gaps:
+                out.write(
+                    f'<div class="bar gap" style="top:{index * LANE_HEIGHT}px;{self._position(start, stop)}" '
+                    f'title="idle {(stop - start) / 1000:.1f} s"></div>\n',
+                )
+        for line in spool:
+            record = json.loads(line)
+            top = record["lane"] * LANE_HEIGHT
+            position = self._position(record["start"], record["stop"])
+            seconds = (record["stop"] - record["start"]) / 1000
+            if "fixture" in record:
+                title = html.escape(f"{record['fixture']} {seconds:.1f} s")
+                out.write(f'<div class="bar fixture" style="top:{top}px;{position}" title="{title}"></div>\n')
+                continue
+            info = {
+                "name": record["name"],
+                "status": record["status"],
+                "duration": record["stop"] - record["start"],
+                "steps": record["steps"],
+                "attachments": record["attachments"],
+            }
+            title = html.escape(f"{record['name']} {seconds:.1f} s")
+            status = record["status"] if record["status"] in {"passed", "failed", "broken", "skipped"} else "unknown"
+            out.write(
+                f'<div class="bar {status}" style="top:{top}px;{position}" title="{title}" '
+                f'data-info="{html.escape(json.dumps(info, separators=(",", ":")))}"></div>\n',
+            )
+        out.write('</div></div>\n<div id="details"></div>\n')
+
+    def write(self, output: Path) -> None:
+        """
+        Generate the timeline page.
+
+        Args:
+            output (Path): Path of the HTML file to write.
+
+        """
+        output.parent.mkdir(parents=True, exist_ok=True)
+        results_href = Path(os.path.relpath(self.results_dir, output.parent)).as_posix()
+        with tempfile.TemporaryFile("w+", encoding="utf-8") as spool:
+            self._collect(spool)
+            for lane in self.lane_stats:
+                lane.compute()
+            spool.seek(0)
+            with open(output, "w", encoding="utf-8") as out:  # noqa: PTH123
+                out.write(PAGE_HEAD % {"lane": LANE_HEIGHT, "bar": LANE_HEIGHT - 6})
+                if self.start is None:
+                    out.write("<p>No results found.</p></body></html>\n")
+                    return
+                self._write_summary(out)
+                self._write_chart(out, spool, results_href)
+                out.write(PAGE_SCRIPT)
+        logger.info("Timeline written to %s", output)
+
+
+def main() -> None:
+    """Generate a timeline page from an allure-results directory."""
+    parser = argparse.ArgumentParser(description="Render allure results as a per-device HTML timeline.")
+    parser.add_argument("results_dir", type=Path, nargs="?", default=Path("reporting/allure-results"))
+    parser.add_argument("-o", "--output", type=Path, default=Path("reporting/timeline.html"))
+    args = parser.parse_args()
+    TimelineReport(args.results_dir).write(args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+import posixpath
+from collections import defaultdict, deque
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from appium.webdriver.appium_connection import AppiumConnection
+
+from src.utils.exception import ReplayMismatchError
+
+CASSETTE_VERSION = 2
+DEVICE_CAPABILITIES = frozenset({"udid", "deviceName", "avd"})
+PATH_CAPABILITIES = frozenset({"app"})
+
+
+class TransportMode(Enum):
+    """How driver commands reach the device."""
+
+    LIVE = "LIVE"
+    RECORD = "RECORD"
+    REPLAY = "REPLAY"
+
+
+def _normalize_capabilities(value: object) -> object:
+    if isinstance(value, list):
+        return [_normalize_capabilities(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    normalized = {}
+    for key, item in value.items():
+        name = key.removeprefix("appium:")
+        if name in DEVICE_CAPABILITIES:
+            continue
+        if name in PATH_CAPABILITIES and isinstance(item, str):
+            normalized[key] = posixpath.basename(item.replace("\\", "/"))
+        else:
+            normalized[key] = _normalize_capabilities(item)
+    return normalized
+
+
+def _request_key(command: str, params: dict[str, Any] | None) -> str:
+    canonical = {key: value for key, value in (params or {}).items() if key != "sessionId"}
+    if command == "newSession":
+        # Keep cassettes portable: the app path and the device differ between machines.
+        canonical = _normalize_capabilities(canonical)
+    payload = json.dumps([command, canonical], sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()[:20]  # noqa: S324
+
+
+class Cassette:
+    """
+    Ordered record of driver commands and their responses.
+
+    Stored as gzipped JSON. Entries are indexed by a hash of the command and its parameters (minus
+    the session id) so a replay can still find a response after the command order diverges. New
+    session capabilities are hashed without device ids and with the app reduced to its file name.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Initialize the Cassette instance.
+
+        Args:
+            path (Path): Location of the cassette file.
+
+        """
+        self.path = path
+        self.entries: list[dict[str, Any]] = []
+        self.index: dict[str, deque[int]] = defaultdict(deque)
+
+    def append(self, command: str, params: dict[str, Any] | None, response: dict[str, Any]) -> None:
+        """
+        Add a command and its response.
+
+        Args:
+            command (str): The WebDriver command name.
+            params (dict[str, Any] | None): The command parameters.
+            response (dict[str, Any]): The server response.
+
+        """
+        key = _request_key(command, params)
+        self.index[key].append(len(self.entries))
+        self.entries.append({"key": key, "command": command, "response": response})
+
+    def save(self) -> None:
+        """Write the cassette to disk."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps({"version": CASSETTE_VERSION, "entries": self.entries}, separators=(",", ":"))
+        with gzip.open(self.path, "wt", encoding="utf-8", compresslevel=6) as file:
+            file.write(payload)
+
+    @classmethod
+    def load(cls, path: Path) -> Cassette:
+        """
+        Read a cassette from disk.
+
+        Args:
+            path (Path): Location of the cassette file.
+
+        Returns:
+            Cassette: The loaded cassette.
+
+        Raises:
+            ReplayMismatchError: If the cassette was recorded in another format version.
+
+        """
+        cassette = cls(path)
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            payload = json.load(file)
+        version = payload.get("version")
+        if version != CASSETTE_VERSION:
+            message = (
+                f"Cassette {path} has format version {version}, expected {CASSETTE_VERSION}; "
+                "re-record it with transport_mode = RECORD"
+            )
+            raise ReplayMismatchError(message)
+        cassette.entries = payload["entries"]
+        for position, entry in enumerate(cassette.entries):
+            cassette.index[entry["key"]].append(position)
+        return cassette
+
+
+class RecordingConnection(AppiumConnection):
+    """Command executor that forwards commands to Appium and records them into a cassette."""
+
+    def __init__(self, remote_server_addr: str, cassette_path: Path, **kwargs: Any) -> None:  # noqa: ANN401
+        """
+        Initialize the RecordingConnection instance.
+
+        Args:
+            remote_server_addr (str): Appium server URL.
+            cassette_path (Path): Where the cassette is saved.
+            **kwargs: Passed to AppiumConnection.
+
+        """
+        super().__init__(remote_server_addr, **kwargs)
+        self.cassette = Cassette(cassette_path)
+        self.mismatches: list[str] = []
+
+    def execute(self, command: str, params: dict[str, Any]) -> dict[str, Any]:  # noqa: D102
+        recorded_params = dict(params) if params else None
+        response = super().execute(command, params)
+        self.cassette.append(command, recorded_params, response)
+        return response
+
+    def close(self) -> None:
+        """Save the cassette when the driver quits."""
+        super().close()
+        self.cassette.save()
+        logging.getLogger(self.__class__.__name__).info(
+            "Recorded %d commands to %s", len(self.cassette.entries), self.cassette.path,
+        )
+
+
+class ReplayConnection(AppiumConnection):
+    """
+    Command executor that serves recorded responses without contacting a server.
+
+    Commands are expected in recorded order. An out-of-order command is served from the index if
+    it was recorded and reported as a mismatch; an unrecorded command raises ReplayMismatchError.
+    With `strict`, any divergence raises.
+    """
+
+    def __init__(
+        self,
+        remote_server_addr: str,
+        cassette_path: Path,
+        strict: bool = False,  # noqa: FBT001, FBT002
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """
+        Initialize the ReplayConnection instance.
+
+        Args:
+            remote_server_addr (str): Appium server URL; never contacted.
+            cassette_path (Path): The cassette to replay.
+            strict (bool): Raise on the first out-of-order command.
+            **kwargs: Passed to AppiumConnection.
+
+        """
+        super().__init__(remote_server_addr, **kwargs)
+        self.cassette = Cassette.load(cassette_path)
+        self.strict = strict
+        self.mismatches: list[str] = []
+        self._cursor = 0
+        self._used: set[int] = set()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def _advance(self) -> None:
+        while self._cursor in self._used:
+            self._cursor += 1
+
+    def execute(self, command: str, params: dict[str, Any]) -> dict[str, Any]:  # noqa: D102
+        key = _request_key(command, params)
+        self._advance()
+        entries = self.cassette.entries
+        if self._cursor < len(entries) and entries[self._cursor]["key"] == key:
+            position = self._cursor
+        else:
+            expected = entries[self._cursor]["command"] if self._cursor < len(entries) else "end of cassette"
+            message = f"Command {self._cursor}: expected {expected}, got {command} {params}"
+            self.mismatches.append(message)
+            self.logger.warning("Replay mismatch: %s", message)
+            candidates = [p for p in self.cassette.index.get(key, ()) if p not in self._used]
+            if self.strict or not candidates:
+                raise ReplayMismatchError(message)
+            position = candidates[0]
+        self._used.add(position)
+        return entries[position]["response"]
+
+    def close(self) -> None:
+        """Report commands that were recorded but never replayed when the driver quits."""
+        super().close()
+        unused = len(self.cassette.entries) - len(self._used)
+        if unused:
+            message = f"{unused} recorded commands were not replayed"
+            self.mismatches.append(message)
+            self.logger.warning("Replay mismatch: %s", message)
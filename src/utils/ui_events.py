@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+
+import websocket
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+LOG_PATHS = {"android": "logcat", "ios": "syslog"}
+# logcat's threadtime format: date, time, pid, tid, level, tag and message.
+LOGCAT_PID = re.compile(r"^\S+\s+\S+\s+(\d+)\s")
+# ActivityManager's line for a new app process, e.g. "Start proc 4321:cat.naval.florae/u0a123 for ...".
+START_PROC = re.compile(r"Start proc (\d+):([\w.]+)")
+
+
+class UiEventStream:
+    """
+    Counts UI change notifications streamed over a websocket.
+
+    Every received message matching `pattern` advances `generation`. Waits record the generation
+    before checking a condition and block in `wait_for_change` until it advances, so a condition is
+    only re-checked after the device reported activity.
+
+    Device logs are device-wide, so with `package` set only logcat lines from the app's process
+    count. The process id is looked up when the session starts and followed across restarts through
+    ActivityManager's "Start proc" lines.
+    """
+
+    def __init__(
+        self, url: str, pattern: str | None = None, connect_timeout: float = 5, package: str | None = None,
+    ) -> None:
+        """
+        Initialize the UiEventStream instance.
+
+        Args:
+            url (str): Websocket URL of the event source.
+            pattern (str | None): Regular expression selecting the messages that count as UI changes;
+                all messages count if None.
+            connect_timeout (float): Seconds to wait for the websocket to open.
+            package (str | None): Android package whose process the messages must come from; any
+                process counts if None.
+
+        """
+        self.url = url
+        self.pattern = re.compile(pattern) if pattern else None
+        self.package = package
+        self.pid: str | None = None
+        self.connect_timeout = connect_timeout
+        self.generation = 0
+        self.connected = False
+        self._changed = threading.Condition()
+        self._opened = threading.Event()
+        self._app: websocket.WebSocketApp | None = None
+        self._broadcasting: WebDriver | None = None
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @classmethod
+    def for_session(
+        cls, driver: WebDriver, appium_url: str, pattern: str | None = None, package: str | None = None,
+    ) -> UiEventStream:
+        """
+        Start Appium's device log broadcast for a session and subscribe to it.
+
+        Args:
+            driver (WebDriver): The session to subscribe to.
+            appium_url (str): Base URL of the Appium server.
+            pattern (str | None): Regular expression selecting the log lines that count as UI changes.
+            package (str | None): Android package of the app under test, to ignore other processes' logs.
+
+        Returns:
+            UiEventStream: The stream, not connected if the driver does not support log broadcasts.
+
+        """
+        platform = str(driver.capabilities.get("platformName", "android")).lower()
+        session_url = f"{appium_url.replace('http', 'ws', 1)}/ws/session/{driver.session_id}"
+        stream = cls(f"{session_url}/appium/device/{LOG_PATHS.get(platform, 'logcat')}", pattern, package=package)
+        if package:
+            try:
+                pids = str(driver.execute_script("mobile: shell", {"command": "pidof", "args": [package]})).split()
+                stream.pid = pids[0] if pids else None
+            except WebDriverException as e:
+                stream.logger.info("App pid unavailable until the app restarts: %s", e.msg)
+        try:
+            driver.execute_script("mobile: startLogsBroadcast")
+        except WebDriverException as e:
+            stream.logger.warning("Log broadcast unavailable, waits fall back to polling: %s", e.msg)
+            return stream
+        stream._broadcasting = driver
+        stream.start()
+        return stream
+
+    def _on_open(self, _app: websocket.WebSocketApp) -> None:
+        self.connected = True
+        self._opened.set()
+
+    def _on_message(self, _app: websocket.WebSocketApp, message: str | bytes) -> None:
+        if isinstance(message, bytes):
+            message = message.decode(errors="replace")
+        if self.package:
+            started = START_PROC.search(message)
+            if started and started.group(2) == self.package:
+                self.pid = started.group(1)
+            column = LOGCAT_PID.match(message)
+            if column is None or column.group(1) != self.pid:
+                return
+        if self.pattern is None or self.pattern.search(message):
+            with self._changed:
+                self.generation += 1
+                self._changed.notify_all()
+
+    def _on_close(self, _app: websocket.WebSocketApp, *_args: object) -> None:
+        # Wake waiters so they fall back to polling instead of sleeping out their interval.
+        with self._changed:
+            self.connected = False
+            self._changed.notify_all()
+        self._opened.set()
+
+    def _on_error(self, _app: websocket.WebSocketApp, error: Exception) -> None:
+        self.logger.warning("UI event stream %s failed: %s", self.url, error)
+
+    def start(self) -> bool:
+        """
+        Connect in a background thread.
+
+        Returns:
+            bool: Whether the websocket opened within the connect timeout.
+
+        """
+        self._app = websocket.WebSocketApp(
+            self.url,
+            on_open=self._on_open,
+            on_message=self._on_message,
+            on_close=self._on_close,
+            on_error=self._on_error,
+        )
+        threading.Thread(target=self._app.run_forever, name="ui-events", daemon=True).start()
+        self._opened.wait(self.connect_timeout)
+        if self.connected:
+            self.logger.info("Subscribed to UI events at %s", self.url)
+        return self.connected
+
+    def stop(self) -> None:
+        """Close the websocket and stop the session's log broadcast if this stream started it."""
+        if self._app is not None:
+            self._app.close()
+            self._app = None
+        self.connected = False
+        if self._broadcasting is not None:
+            driver, self._broadcasting = self._broadcasting, None
+            try:
+                driver.execute_script("mobile: stopLogsBroadcast")
+            except WebDriverException as e:
+                self.logger.warning("Failed to stop the log broadcast: %s", e.msg)
+
+    def wait_for_change(self, generation: int, timeout: float) -> int:
+        """
+        Block until a UI change after `generation` arrives, the stream closes or the timeout passes.
+
+        Args:
+            generation (int): The generation observed before the last condition check.
+            timeout (float): Maximum seconds to block.
+
+        Returns:
+            int: The current generation.
+
+        """
+        deadline = time.monotonic() + timeout
+        with self._changed:
+            while self.generation == generation and self.connected:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._changed.wait(remaining)
+            return self.generation
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import io
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Sequence, Tuple
+
+import allure
+import numpy as np
+from PIL import Image
+
+from src.utils.exception import FailedTestError
+
+Region = Tuple[int, int, int, int]
+
+
+@dataclass
+class VisualResult:
+    """
+    Outcome of a screenshot comparison.
+
+    Attributes:
+        name (str): Baseline name.
+        matched (bool): Whether the screenshot matches the baseline.
+        diff_ratio (float): Fraction of unmasked pixels that differ.
+        skipped (bool): Whether the pixel comparison was skipped because the PNGs are identical.
+        new_baseline (bool): Whether the screenshot was stored as a new baseline.
+
+    """
+
+    name: str
+    matched: bool
+    diff_ratio: float = 0.0
+    skipped: bool = False
+    new_baseline: bool = False
+
+
+class VisualCheck:
+    """
+    Compares screenshots against stored baselines.
+
+    Byte-identical screenshots match without decoding; any other screenshot is compared pixel by
+    pixel in one pass. Decoded baselines are kept for the lifetime of the instance, so hold one
+    instance per run. Regions such as the status bar clock can be masked out of the comparison.
+    Diff images are attached to allure on mismatch only.
+    """
+
+    def __init__(
+        self,
+        baseline_dir: str,
+        max_diff_ratio: float = 0.001,
+        pixel_tolerance: int = 16,
+    ) -> None:
+        """
+        Initialize the VisualCheck instance.
+
+        Args:
+            baseline_dir (str): Directory containing baseline PNGs, one per name.
+            max_diff_ratio (float): Fraction of differing pixels tolerated before a mismatch.
+            pixel_tolerance (int): Per-channel difference below which pixels are considered equal.
+
+        """
+        self.baseline_dir = Path(baseline_dir)
+        self.max_diff_ratio = max_diff_ratio
+        self.pixel_tolerance = pixel_tolerance
+        self._baselines: dict[str, tuple[bytes, np.ndarray]] = {}
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @staticmethod
+    def _decode(png: bytes) -> np.ndarray:
+        with Image.open(io.BytesIO(png)) as image:
+            return np.asarray(image.convert("RGB"))
+
+    @staticmethod
+    def _mask(shape: tuple[int, ...], regions: Sequence[Region]) -> np.ndarray | None:
+        if not regions:
+            return None
+        mask = np.ones(shape[:2], dtype=bool)
+        for x, y, width, height in regions:
+            mask[y : y + height, x : x + width] = False
+        return mask
+
+    def _baseline(self, name: str) -> tuple[bytes, np.ndarray] | None:
+        if name not in self._baselines:
+            path = self.baseline_dir / f"{name}.png"
+            if not path.exists():
+                return None
+            png = path.read_bytes()
+            self._baselines[name] = (png, self._decode(png))
+        return self._baselines[name]
+
+    def _save_baseline(self, name: str, png: bytes) -> None:
+        self.baseline_dir.mkdir(parents=True, exist_ok=True)
+        (self.baseline_dir / f"{name}.png").write_bytes(png)
+        self._baselines[name] = (png, self._decode(png))
+        self.logger.info("New baseline stored: %s", name)
+
+    def compare(self, name: str, png: bytes, masks: Sequence[Region] = ()) -> VisualResult:
+        """
+        Compare a screenshot against its baseline, storing it as the baseline if none exists.
+
+        Args:
+            name (str): Baseline name.
+            png (bytes): Screenshot from `get_screenshot_as_png()`.
+            masks (Sequence[Region]): (x, y, width, height) regions excluded from the comparison.
+
+        Returns:
+            VisualResult: The comparison outcome.
+
+        """
+        baseline = self._baseline(name)
+        if baseline is None:
+            self._save_baseline(name, png)
+            return VisualResult(name, matched=True, new_baseline=True)
+        baseline_png, baseline_pixels = baseline
+        if png == baseline_png:
+            return VisualResult(name, matched=True, skipped=True)
+
+        pixels = self._decode(png)
+        if pixels.shape != baseline_pixels.shape:
+            self.logger.warning("Screenshot size %s differs from baseline %s", pixels.shape, baseline_pixels.shape)
+            return VisualResult(name, matched=False, diff_ratio=1.0)
+
+        diff = (np.abs(pixels.astype(np.int16) - baseline_pixels).max(axis=2) > self.pixel_tolerance)
+        mask = self._mask(pixels.shape, masks)
+        if mask is not None:
+            diff &= mask
+            total = int(np.count_nonzero(mask))
+        else:
+            total = diff.size
+        diff_ratio = int(np.count_nonzero(diff)) / max(total, 1)
+        matched = bool(diff_ratio <= self.max_diff_ratio)
+        if not matched:
+            self._attach_diff(name, baseline_pixels, diff)
+        self.logger.info("Visual check %s: diff ratio %.5f", name, diff_ratio)
+        return VisualResult(name, matched=matched, diff_ratio=diff_ratio)
+
+    def assert_matches(self, name: str, png: bytes, masks: Sequence[Region] = ()) -> VisualResult:
+        """
+        Compare a screenshot against its baseline and fail on mismatch.
+
+        Args:
+            name (str): Baseline name.
+            png (bytes): Screenshot from `get_screenshot_as_png()`.
+            masks (Sequence[Region]): (x, y, width, height) regions excluded from the comparison.
+
+        Returns:
+            VisualResult: The comparison outcome.
+
+        Raises:
+            FailedTestError: If the screenshot does not match the baseline.
+
+        """
+        result = self.compare(name, png, masks)
+        if not result.matched:
+            msg = f"Screenshot {name} differs from baseline ({result.diff_ratio:.3%} of pixels)"
+            raise FailedTestError(msg)
+        return result
+
+    def _attach_diff(self, name: str, baseline_pixels: np.ndarray, diff: np.ndarray) -> None:
+        overlay = baseline_pixels // 3
+        overlay[diff] = (255, 0, 0)
+        buffer = io.BytesIO()
+        Image.fromarray(overlay).save(buffer, format="PNG", compress_level=1)
+        allure.attach(
+            buffer.getvalue(),
+            name=f"Visual Diff: {name}",
+            attachment_type=allure.attachment_type.PNG,
+        )
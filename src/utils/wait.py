@@ -2,13 +2,26 @@
 from __future__ import annotations
 
 import logging
+import time
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Callable
 
 from appium.webdriver.common.appiumby import AppiumBy
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, TimeoutException
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support import expected_conditions as conditions
 from selenium.webdriver.support.wait import WebDriverWait
 
+if TYPE_CHECKING:
+    from src.utils.ui_events import UiEventStream
+
+
+class WaitBackend(Enum):
+    """How waits learn that a condition may have changed."""
+
+    POLLING = "POLLING"
+    EVENTS = "EVENTS"
+
 
 class Wait:
     """
@@ -16,19 +29,33 @@ class Wait:
 
     This class provides methods to wait for elements to be visible, invisible,
     present, or clickable.
+
+    Conditions are polled through WebDriverWait unless a connected UiEventStream is given, in which
+    case a condition is re-checked only after the device reports a UI change, or every
+    `fallback_interval` seconds in case a change went unreported.
     """
 
-    def __init__(self, driver: WebDriver, timeout: int = 30) -> None:
+    def __init__(
+        self,
+        driver: WebDriver,
+        timeout: int = 30,
+        events: UiEventStream | None = None,
+        fallback_interval: float = 0.5,
+    ) -> None:
         """
         Initialize the Wait class.
 
         Args:
             driver: The Appium driver instance.
             timeout (int): The maximum time to wait for a condition, in seconds.
+            events (UiEventStream | None): UI change notifications to wait on instead of polling.
+            fallback_interval (float): Maximum seconds between checks while waiting on events.
 
         """
         self.driver = driver
         self.timeout = timeout
+        self.events = events
+        self.fallback_interval = fallback_interval
         self.logger = logging.getLogger(__name__)
 
     def _wait_for_condition(
@@ -48,9 +75,12 @@ class Wait:
 
         """
         try:
-            WebDriverWait(self.driver, timeout=self.timeout).until(
-                condition((by, value)),
-            )
+            if self.events is not None and self.events.connected:
+                self._wait_for_events(condition((by, value)))
+            else:
+                WebDriverWait(self.driver, timeout=self.timeout).until(
+                    condition((by, value)),
+                )
             self.logger.info("Element %s successfully: %s=%s", action, by, value)
         except TimeoutException:
             self.logger.exception(
@@ -58,6 +88,36 @@ class Wait:
             )
             raise
 
+    def _wait_for_events(self, check: Callable[[WebDriver], Any]) -> None:
+        """
+        Check a condition now and again after each UI change until it holds.
+
+        Falls back to polling for the remaining time if the event stream closes.
+
+        Args:
+            check (Callable[[WebDriver], Any]): The expected condition, bound to its locator.
+
+        Raises:
+            TimeoutException: If the condition is not met within the timeout period.
+
+        """
+        deadline = time.monotonic() + self.timeout
+        while True:
+            generation = self.events.generation
+            try:
+                if check(self.driver):
+                    return
+            except (NoSuchElementException, StaleElementReferenceException):
+                pass
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                msg = f"Condition not met within {self.timeout} s"
+                raise TimeoutException(msg)
+            if not self.events.connected:
+                WebDriverWait(self.driver, timeout=remaining).until(check)
+                return
+            self.events.wait_for_change(generation, min(self.fallback_interval, remaining))
+
     def for_element_to_be_visible(
         self, by: str = AppiumBy.ID, value: str | dict | None = None,
     ) -> None: